@@ -0,0 +1,257 @@
+import json
+
+import httpx
+import pytest
+from httpx import Request, Response
+
+from febos.client import AsyncFebosClient, FebosClient
+
+
+@pytest.fixture
+def large_response():
+    """A 4 MB JSON response like a year of historical data for one group."""
+    body = json.dumps(
+        [
+            {"ts": f"2026-02-11T00:00:{i % 60:02}", "vs": ["194", "74", "146"]}
+            for i in range(100_000)
+        ]
+    ).encode()
+    request = Request(
+        "GET",
+        "https://emmeti.aq-iot.net/aq-iot-server-frontend-ha/api/v2/emmeti/1/historical-data",
+        headers={"Authorization": "Bearer token"},
+    )
+    return Response(200, content=body, request=request)
+
+
+def _device(device_id):
+    return {
+        "code": f"D{device_id}",
+        "codeName": f"D{device_id}",
+        "controllerCode": "C1",
+        "controllerId": 1,
+        "controllerName": "Controller",
+        "deviceCategory": "FEBOS",
+        "deviceTypeCode": "FB",
+        "deviceTypeId": 1,
+        "deviceTypeName": "Febos",
+        "enabled": True,
+        "id": device_id,
+        "installationCode": "I1",
+        "installationId": 1,
+        "installationName": "Installation",
+        "label": f"Device {device_id}",
+        "modelCode": "M1",
+        "modelId": 1,
+        "modelName": "Model",
+        "name": f"Device {device_id}",
+        "ord": device_id,
+        "tenantId": 1,
+        "tenantName": "Tenant",
+    }
+
+
+def _input(device_id, index):
+    return {
+        "category": "SENSOR",
+        "clientName": "client",
+        "code": f"R{8000 + index}",
+        "codeName": f"IN_{index}",
+        "dataOffset": index,
+        "deviceId": device_id,
+        "deviceModelId": 1,
+        "id": device_id * 1000 + index,
+        "inputOptionDtoList": [],
+        "inputType": "NUMBER",
+        "label": f"Input {index}",
+        "name": f"IN_{index}",
+        "ord": index,
+        "saveHistory": True,
+        "thingId": device_id,
+        "thingModelId": 1,
+        "measUnit": "°C",
+        "nullValue": "-32768",
+        "scale": 1,
+    }
+
+
+def page_config_body(devices=20, widgets=10, inputs=20):
+    """A page configuration with a page per device, each with `widgets`
+    widgets of `inputs` inputs (20 devices: ~4000 inputs, ~3 MB)."""
+    pages = {}
+    for device_id in range(1, devices + 1):
+        widget_list = [
+            {
+                "code": f"W{w}",
+                "defaultDeviceId": device_id,
+                "defaultThingId": device_id,
+                "id": device_id * 100 + w,
+                "inputGroupGetCodeList": [f"G{w}"],
+                "label": f"Widget {w}",
+                "name": f"Widget {w}",
+                "ord": w,
+                "tabId": device_id,
+                "widgetInputGroupList": [
+                    {
+                        "deviceId": device_id,
+                        "inputGroupCode": f"G{w}",
+                        "inputGroupGetCode": f"G{w}_GET",
+                        "inputGroupId": w,
+                        "inputList": [
+                            _input(device_id, w * inputs + i) for i in range(inputs)
+                        ],
+                        "ord": w,
+                        "thingId": device_id,
+                    }
+                ],
+            }
+            for w in range(widgets)
+        ]
+        pages[str(device_id)] = {
+            "code": f"P{device_id}",
+            "codeName": f"P{device_id}",
+            "id": device_id,
+            "inputGroupGetCodeList": [f"G{w}_GET" for w in range(widgets)],
+            "label": f"Page {device_id}",
+            "name": f"Page {device_id}",
+            "ord": device_id,
+            "pageType": "DEVICE",
+            "tabList": [
+                {
+                    "code": "TAB",
+                    "id": device_id,
+                    "inputGroupGetCodeMap": {str(device_id): ["G0_GET"]},
+                    "label": "Tab",
+                    "name": "Tab",
+                    "ord": 1,
+                    "pageId": device_id,
+                    "widgetList": widget_list,
+                }
+            ],
+        }
+    return json.dumps(
+        {
+            "deviceMap": {str(d): _device(d) for d in range(1, devices + 1)},
+            "installation": {
+                "code": "I1",
+                "codeName": "I1",
+                "id": 1,
+                "label": "Installation",
+                "name": "Installation",
+                "tagSet": [],
+                "tenantId": 1,
+                "tenantName": "Tenant",
+            },
+            "pageMap": pages,
+            "thingMap": {},
+        }
+    ).encode()
+
+
+def historical_body(groups=4, points=25_000, inputs=5):
+    """Historical data of `groups` groups with `points` samples each
+    (defaults: 100k samples, ~7 MB)."""
+    return json.dumps(
+        [
+            {
+                "deviceId": group,
+                "thingId": group,
+                "groupCode": f"FB-GRAPH-DATA@D{group}@T{group}",
+                "inputArray": [{"code": f"R{8750 + i}"} for i in range(inputs)],
+                "data": [
+                    {
+                        "ts": f"2026-02-11T{i // 3600 % 24:02}:{i // 60 % 60:02}:{i % 60:02}",
+                        "vs": [str((i * 7 + k) % 300) for k in range(inputs)],
+                    }
+                    for i in range(points)
+                ],
+            }
+            for group in range(groups)
+        ]
+    ).encode()
+
+
+def data_analysis_body(rows=10_000, inputs=100):
+    """Data analysis rows with `inputs` columns each
+    (defaults: 1M values, ~16 MB)."""
+    return json.dumps(
+        [
+            {"ts": f"2026-02-11 {i // 3600 % 24:02}:{i // 60 % 60:02}:{i % 60:02}"}
+            | {f"R{8000 + k}": str((i + k) % 300) for k in range(inputs)}
+            for i in range(rows)
+        ]
+    ).encode()
+
+
+def realtime_body(groups=10, inputs=50):
+    """A realtime snapshot of `groups` input groups of `inputs` values."""
+    return json.dumps(
+        [
+            {
+                "data": {f"R{8000 + k}": {"i": (g + k) % 300} for k in range(inputs)},
+                "deviceId": g,
+                "thingId": g,
+                "groupCode": f"G{g}",
+                "ts": "2026-02-11T00:00:00.000Z",
+            }
+            for g in range(groups)
+        ]
+    ).encode()
+
+
+def mock_transport(bodies):
+    """An in-memory transport answering each URL path suffix with a body.
+
+    Args:
+        bodies: Response bodies by the last segment of the URL path, e.g.
+            `{"historical-data": b"[...]"}`.
+    """
+
+    def handler(request):
+        return Response(200, content=bodies[request.url.path.rsplit("/", 1)[-1]])
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(scope="session")
+def endpoint_bodies(
+    large_page_config_body, large_historical_body, large_data_analysis_body
+):
+    return {
+        "page-config": large_page_config_body,
+        "historical-data": large_historical_body,
+        "realtime-data": realtime_body(),
+        "get-data-analysis": large_data_analysis_body,
+    }
+
+
+@pytest.fixture
+def mock_client(endpoint_bodies):
+    """A FebosClient served by `mock_transport`, with no network access."""
+    with FebosClient(transport=mock_transport(endpoint_bodies)) as client:
+        client.set_token("token")
+        yield client
+
+
+@pytest.fixture
+def mock_async_client(endpoint_bodies):
+    """An AsyncFebosClient served by `mock_transport`."""
+    client = AsyncFebosClient(transport=mock_transport(endpoint_bodies))
+    client.set_token("token")
+    return client
+
+
+@pytest.fixture(scope="session")
+def large_page_config_body():
+    """50 devices, 10000 inputs."""
+    return page_config_body(devices=50)
+
+
+@pytest.fixture(scope="session")
+def large_historical_body():
+    return historical_body()
+
+
+@pytest.fixture(scope="session")
+def large_data_analysis_body():
+    return data_analysis_body()
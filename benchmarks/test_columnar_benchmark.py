@@ -0,0 +1,51 @@
+"""Post-processing of large responses: building the `InstallationIndex` of a
+50-device page config, scaling 100k historical points with `ValueDecoder`
+and resampling them with `febos.aggregation`.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from febos.data_model import PageConfigGetResponse
+from febos.installation_index import InstallationIndex
+
+np = pytest.importorskip("numpy")
+
+from febos.aggregation import lttb, resample
+from febos.columnar import decode_historical_data
+from febos.scaling import ValueDecoder
+
+
+@pytest.fixture(scope="module")
+def index(large_page_config_body):
+    return InstallationIndex(
+        PageConfigGetResponse.model_validate_json(large_page_config_body)
+    )
+
+
+@pytest.fixture(scope="module")
+def columns(large_historical_body):
+    return decode_historical_data(large_historical_body)
+
+
+@pytest.mark.benchmark(group="post-process")
+def test_installation_index_build(benchmark, index):
+    benchmark(InstallationIndex, index.page_config)
+
+
+@pytest.mark.benchmark(group="post-process")
+def test_value_decoder_historical(benchmark, index, columns):
+    decoder = ValueDecoder(index)
+    benchmark(decoder.decode_historical, columns)
+
+
+@pytest.mark.benchmark(group="post-process")
+def test_resample_hourly_mean(benchmark, columns):
+    benchmark(lambda: [resample(entry, timedelta(hours=1)) for entry in columns])
+
+
+@pytest.mark.benchmark(group="post-process")
+def test_lttb_1000(benchmark, columns):
+    entry = columns[0]
+    benchmark(lttb, entry.ts, entry.values[:, 0], 1000)
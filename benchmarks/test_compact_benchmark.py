@@ -0,0 +1,98 @@
+"""Memory and parse time of the compact named tuples of `febos.compact`
+against the pydantic models, on the synthetic bodies of `conftest.py`.
+
+Memory is the size retained by the parsed result, measured with
+`tracemalloc` and reported per object in `extra_info` (see
+`--benchmark-verbose` or the saved JSON).
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from febos.compact import parse_data_analysis, parse_historical, parse_realtime
+from febos.data_model import (GetDataAnalysisGetResponse,
+                              HistoricalDataGetResponse,
+                              RealtimeDataGetResponse)
+from febos.parsing import parse_response
+
+from .conftest import realtime_body
+
+
+def retained_bytes(parse, content):
+    """Bytes still allocated after parsing `content`, i.e. held by the result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = parse(content)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+CASES = {
+    "historical": (
+        "large_historical_body",
+        lambda content: parse_response(HistoricalDataGetResponse, content),
+        parse_historical,
+        100_000,
+    ),
+    "data-analysis": (
+        "large_data_analysis_body",
+        lambda content: parse_response(GetDataAnalysisGetResponse, content),
+        parse_data_analysis,
+        10_000,
+    ),
+    "realtime": (
+        None,
+        lambda content: parse_response(RealtimeDataGetResponse, content),
+        parse_realtime,
+        10_000,
+    ),
+}
+
+
+@pytest.fixture
+def case(request):
+    fixture, parse_model, parse_compact, objects = CASES[request.param]
+    if fixture is None:
+        content = realtime_body(groups=objects, inputs=5)
+    else:
+        content = request.getfixturevalue(fixture)
+    return content, parse_model, parse_compact, objects
+
+
+@pytest.mark.benchmark(group="compact-memory")
+@pytest.mark.parametrize("case", list(CASES), indirect=True)
+def test_compact_memory(benchmark, case):
+    content, parse_model, parse_compact, objects = case
+    model = retained_bytes(parse_model, content) / objects
+    compact = retained_bytes(parse_compact, content) / objects
+    benchmark.extra_info["model_bytes"] = round(model)
+    benchmark.extra_info["compact_bytes"] = round(compact)
+    # A single timed run of the compact parser, to record the sizes
+    benchmark.pedantic(parse_compact, args=(content,), rounds=1, iterations=1)
+    assert compact < model
+
+
+@pytest.mark.benchmark(group="compact-historical")
+def test_historical_models(benchmark, large_historical_body):
+    benchmark(parse_response, HistoricalDataGetResponse, large_historical_body)
+
+
+@pytest.mark.benchmark(group="compact-historical")
+def test_historical_compact(benchmark, large_historical_body):
+    benchmark(parse_historical, large_historical_body)
+
+
+@pytest.mark.benchmark(group="compact-data-analysis")
+def test_data_analysis_models(benchmark, large_data_analysis_body):
+    benchmark(parse_response, GetDataAnalysisGetResponse, large_data_analysis_body)
+
+
+@pytest.mark.benchmark(group="compact-data-analysis")
+def test_data_analysis_compact(benchmark, large_data_analysis_body):
+    benchmark(parse_data_analysis, large_data_analysis_body)
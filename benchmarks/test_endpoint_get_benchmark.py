@@ -0,0 +1,91 @@
+"""End-to-end `get()` throughput of the main endpoints.
+
+Each benchmark runs the whole request path (`FebosEndpoint._call`, auth,
+logging, rate limiting hooks) against an in-memory transport serving the
+synthetic bodies of `conftest.py`, followed by response parsing into the
+`data_model` classes, so regressions in either show up here:
+
+- page config of 50 devices with 10000 inputs,
+- 100k-point historical data (models, columns and streamed batches),
+- 10000 data analysis rows of 100 inputs,
+- a realtime snapshot, sequentially and 100 concurrent `aget()` calls.
+"""
+
+import asyncio
+
+import pytest
+
+from febos.get_data_analysis import GetDataAnalysisEndpoint
+from febos.get_historical_data import GetHistoricalDataEndpoint
+from febos.page_config import PageConfigEndpoint
+from febos.realtime_data import RealtimeDataEndpoint
+
+HISTORICAL = GetHistoricalDataEndpoint(
+    installation_id=1,
+    input_group_list="FB-GRAPH-DATA@D0@T0",
+    time_from="2026-02-11 00:00:00",
+    time_to="2026-02-11 23:59:59",
+)
+REALTIME = RealtimeDataEndpoint(installation_id=1, input_group_list=["G0", "G1"])
+
+
+@pytest.mark.benchmark(group="get-page-config")
+def test_page_config_get(benchmark, mock_client):
+    config = benchmark(PageConfigEndpoint(installation_id=1).get, client=mock_client)
+    assert len(config.deviceMap) == 50
+
+
+@pytest.mark.benchmark(group="get-historical")
+def test_historical_get(benchmark, mock_client):
+    response = benchmark(HISTORICAL.get, client=mock_client)
+    assert sum(len(entry.data) for entry in response.root) == 100_000
+
+
+@pytest.mark.benchmark(group="get-historical")
+def test_historical_get_columnar(benchmark, mock_client):
+    pytest.importorskip("numpy")
+    columns = benchmark(HISTORICAL.get_columnar, client=mock_client)
+    assert sum(len(entry) for entry in columns) == 100_000
+
+
+@pytest.mark.benchmark(group="get-historical")
+def test_historical_stream(benchmark, mock_client):
+    def consume():
+        return sum(len(entry.data) for entry in HISTORICAL.stream(client=mock_client))
+
+    assert benchmark(consume) == 100_000
+
+
+@pytest.mark.benchmark(group="get-data-analysis")
+def test_data_analysis_get(benchmark, mock_client):
+    endpoint = GetDataAnalysisEndpoint(installation_id=1, device_id=1)
+    response = benchmark(endpoint.get, client=mock_client)
+    assert len(response.root) == 10_000
+
+
+@pytest.mark.benchmark(group="get-realtime")
+def test_realtime_get(benchmark, mock_client):
+    response = benchmark(REALTIME.get, client=mock_client)
+    assert len(response.root) == 10
+
+
+@pytest.mark.benchmark(group="get-realtime")
+def test_realtime_get_flat(benchmark, mock_client):
+    response = benchmark(REALTIME.get, client=mock_client, flat=True)
+    assert len(response.root) == 10
+
+
+@pytest.mark.benchmark(group="get-realtime")
+def test_realtime_aget_concurrent(benchmark, mock_async_client):
+    async def hundred():
+        return await asyncio.gather(
+            *(REALTIME.aget(client=mock_async_client) for _ in range(100))
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        responses = benchmark(lambda: loop.run_until_complete(hundred()))
+    finally:
+        loop.run_until_complete(mock_async_client.aclose())
+        loop.close()
+    assert len(responses) == 100
@@ -0,0 +1,57 @@
+"""Per-call overhead of building the URL and Referer of an endpoint.
+
+Compares the previous implementation (`model_dump()` + `str.format` and the
+Referer rebuilt from `client.base_url` on every call) with the templates
+precompiled at class creation, and measures a whole realtime `get()` over
+an in-memory transport to put the numbers in context.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from febos.client import FebosClient
+from febos.endpoint import FebosEndpoint
+from febos.realtime_data import RealtimeDataEndpoint
+
+
+def legacy_url(endpoint):
+    """`_url()` as it was before templates were precompiled."""
+    return f"{FebosEndpoint.API_URL}{endpoint.URL}".format(**endpoint.model_dump())
+
+
+def legacy_headers(endpoint, client):
+    """`_headers()` as it was before the Referer was precompiled."""
+    return {"Referer": str(client.base_url) + endpoint.APP_URL + endpoint.REFERER}
+
+
+@pytest.fixture
+def endpoint():
+    return RealtimeDataEndpoint(installation_id=101, input_group_list=["F_GENERAL"])
+
+
+@pytest.fixture
+def client():
+    body = json.dumps(
+        [{"data": {"R8765": {"i": 215}}, "deviceId": 789, "thingId": 10, "ts": "t"}]
+    ).encode()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    with FebosClient(transport=transport) as client:
+        client.set_token("token")
+        yield client
+
+
+@pytest.mark.benchmark(group="endpoint-url")
+def test_legacy_url_and_headers(benchmark, endpoint, client):
+    benchmark(lambda: (legacy_url(endpoint), legacy_headers(endpoint, client)))
+
+
+@pytest.mark.benchmark(group="endpoint-url")
+def test_precompiled_url_and_headers(benchmark, endpoint, client):
+    benchmark(lambda: (endpoint._url(), endpoint._headers(client)))
+
+
+@pytest.mark.benchmark(group="endpoint-get")
+def test_realtime_get(benchmark, endpoint, client):
+    benchmark(endpoint.get, client=client)
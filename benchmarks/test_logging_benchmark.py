@@ -0,0 +1,48 @@
+"""Overhead of the client logging hooks on a large response.
+
+Compares the previous hook, which decoded and formatted the whole body on
+every call, with `log_response` at WARNING (the default) and DEBUG level.
+"""
+
+import logging
+
+import pytest
+
+from febos.client import LOGGER, log_response
+
+
+def legacy_log_response(response):
+    """The hook as it was before bodies were only decoded at DEBUG level."""
+    try:
+        request = response.request
+        content = response.read().decode()
+        LOGGER.debug(
+            f"Response: {response.status_code} {request.url}\nHeaders: {dict(request.headers)}\nContent: {content}"
+        )
+    except Exception as e:
+        LOGGER.error(f"Error logging response: {e}")
+
+
+@pytest.fixture
+def warning_level():
+    level = LOGGER.level
+    LOGGER.setLevel(logging.WARNING)
+    yield
+    LOGGER.setLevel(level)
+
+
+@pytest.mark.benchmark(group="log-response")
+def test_legacy_log_response_warning(benchmark, warning_level, large_response):
+    benchmark(legacy_log_response, large_response)
+
+
+@pytest.mark.benchmark(group="log-response")
+def test_log_response_warning(benchmark, warning_level, large_response):
+    benchmark(log_response, large_response)
+
+
+@pytest.mark.benchmark(group="log-response")
+def test_log_response_debug(benchmark, caplog, large_response):
+    caplog.set_level(logging.DEBUG, logger=LOGGER.name)
+    benchmark(log_response, large_response)
+    caplog.clear()
@@ -0,0 +1,80 @@
+"""Response validation: two-pass `model_validate(json.loads(...))` against
+`parse_response` (single pass from bytes, cached TypeAdapter) in lax and
+trusted mode, and a recursive `model_construct` for reference.
+"""
+
+import json
+
+import pytest
+
+from febos.data_model import (HistoricalDataEntry, HistoricalDataGetResponse,
+                              HistoricalDataPoint, InputCode,
+                              PageConfigGetResponse)
+from febos.parsing import parse_response
+
+
+def construct_historical(content):
+    """Build the models without validation, as a trusted mode could."""
+    return HistoricalDataGetResponse.model_construct(
+        root=[
+            HistoricalDataEntry.model_construct(
+                **entry
+                | {
+                    "inputArray": [
+                        InputCode.model_construct(**code)
+                        for code in entry["inputArray"]
+                    ],
+                    "data": [
+                        HistoricalDataPoint.model_construct(**point)
+                        for point in entry["data"]
+                    ],
+                }
+            )
+            for entry in json.loads(content)
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="parse-historical")
+def test_historical_model_validate(benchmark, large_historical_body):
+    benchmark(
+        lambda: HistoricalDataGetResponse.model_validate(
+            json.loads(large_historical_body)
+        )
+    )
+
+
+@pytest.mark.benchmark(group="parse-historical")
+def test_historical_parse_response(benchmark, large_historical_body):
+    benchmark(parse_response, HistoricalDataGetResponse, large_historical_body)
+
+
+@pytest.mark.benchmark(group="parse-historical")
+def test_historical_parse_response_trusted(benchmark, large_historical_body):
+    benchmark(
+        parse_response, HistoricalDataGetResponse, large_historical_body, True
+    )
+
+
+@pytest.mark.benchmark(group="parse-historical")
+def test_historical_model_construct(benchmark, large_historical_body):
+    benchmark(construct_historical, large_historical_body)
+
+
+@pytest.mark.benchmark(group="parse-page-config")
+def test_page_config_model_validate(benchmark, large_page_config_body):
+    benchmark(
+        lambda: PageConfigGetResponse.model_validate(
+            json.loads(large_page_config_body)
+        )
+    )
+
+
+@pytest.mark.benchmark(group="parse-page-config")
+def test_page_config_parse_response(benchmark, large_page_config_body):
+    benchmark(parse_response, PageConfigGetResponse, large_page_config_body)
+
+
+@pytest.mark.benchmark(group="parse-page-config")
+def test_page_config_parse_response_trusted(benchmark, large_page_config_body):
+    benchmark(parse_response, PageConfigGetResponse, large_page_config_body, True)
@@ -4,11 +4,20 @@ A command-line interface where users can authenticate and run various API comman
 Type 'help' for a list of available commands.
 """
 
+import argparse
+import getpass
+import json
 import logging
+import os
+import shlex
+import sys
 from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, TextIO, Tuple
 
-from febos.client import FebosClient
+from febos.client import ConnectionSettings, FebosClient
+from febos.endpoint import FebosEndpoint
 from febos.error import AuthenticationError, FebosError
+from febos.fanout import DEFAULT_LIMIT, fan_out
 from febos.get_data_analysis import GetDataAnalysisEndpoint
 from febos.get_febos_slave import GetFebosSlaveEndpoint
 from febos.get_historical_data import GetHistoricalDataEndpoint
@@ -17,6 +26,7 @@ from febos.installation import InstallationEndpoint
 from febos.login import LoginEndpoint
 from febos.page_config import PageConfigEndpoint
 from febos.realtime_data import RealtimeDataEndpoint
+from febos.retry import RetryPolicy
 
 logging.basicConfig(
     level=logging.WARNING,
@@ -25,13 +35,94 @@ logging.basicConfig(
 
 LOGGER = logging.getLogger(__name__)
 
+PASSWORD_MISSING = "Password missing: set FEBOS_PASSWORD"
+
+
+def installation_endpoint(
+    page_start: str = "1", page_items: str = "500000"
+) -> InstallationEndpoint:
+    """Build the endpoint of `installation [pageStart] [pageItems]`."""
+    return InstallationEndpoint(pageStart=int(page_start), pageItems=int(page_items))
+
+
+def pageconfig_endpoint(installation_id: str) -> PageConfigEndpoint:
+    """Build the endpoint of `pageconfig <installation_id>`."""
+    return PageConfigEndpoint(installation_id=int(installation_id))
+
+
+def realtimeget_endpoint(
+    installation_id: str, input_group_list: str
+) -> RealtimeDataEndpoint:
+    """Build the endpoint of `realtimeget <installation_id> <input_group_list>`."""
+    return RealtimeDataEndpoint(
+        installation_id=int(installation_id),
+        input_group_list=input_group_list.split(","),
+    )
+
+
+def slave_endpoint(installation_id: str, device_id: str) -> GetFebosSlaveEndpoint:
+    """Build the endpoint of `slave <installation_id> <device_id>`."""
+    return GetFebosSlaveEndpoint(
+        installation_id=int(installation_id), device_id=int(device_id)
+    )
+
+
+def language_endpoint(installation_id: str, device_id: str) -> GetLanguageEndpoint:
+    """Build the endpoint of `language <installation_id> <device_id>`."""
+    return GetLanguageEndpoint(
+        installation_id=int(installation_id), device_id=int(device_id)
+    )
+
+
+def dataanalysis_endpoint(
+    installation_id: str,
+    device_id: str,
+    from_ts: Optional[str] = None,
+    to_ts: Optional[str] = None,
+) -> GetDataAnalysisEndpoint:
+    """Build the endpoint of `dataanalysis`, defaulting to today's rows."""
+    if from_ts is None or to_ts is None:
+        today = datetime.now().date()
+        from_ts = f"{today} 00:00:00"
+        to_ts = f"{today} 23:59:00"
+    return GetDataAnalysisEndpoint(
+        installation_id=int(installation_id),
+        device_id=int(device_id),
+        from_ts=from_ts,
+        to_ts=to_ts,
+    )
+
+
+def historicaldata_endpoint(
+    installation_id: str, input_group_list: str, time_from: str, time_to: str
+) -> GetHistoricalDataEndpoint:
+    """Build the endpoint of `historicaldata`."""
+    return GetHistoricalDataEndpoint(
+        installation_id=int(installation_id),
+        input_group_list=input_group_list,
+        time_from=time_from,
+        time_to=time_to,
+    )
+
+
+# Commands available in batch mode, by the endpoint they call
+BATCH_COMMANDS: Dict[str, Callable[..., FebosEndpoint]] = {
+    "installation": installation_endpoint,
+    "pageconfig": pageconfig_endpoint,
+    "realtimeget": realtimeget_endpoint,
+    "slave": slave_endpoint,
+    "language": language_endpoint,
+    "dataanalysis": dataanalysis_endpoint,
+    "historicaldata": historicaldata_endpoint,
+}
+
 
 class FebosSession:
     """Interactive session manager for Febos API."""
 
-    def __init__(self):
-        """Initialize session with no client (unauthenticated)."""
-        self.client = FebosClient()
+    def __init__(self, client: Optional[FebosClient] = None):
+        """Initialize session with an unauthenticated client."""
+        self.client = client if client is not None else FebosClient()
         self.authenticated = False
 
     def get_authenticated_client(self) -> FebosClient:
@@ -75,6 +166,7 @@ Historical Data:
   historicaldata <installation_id> <input_group_list> <time_from> <time_to>
                                          - Get historical time-series data
                                            (timestamps: "YYYY-MM-DD HH:MM:SS")
+                                           For large windows use `febos export`
 """
         print(help_text)
 
@@ -95,9 +187,7 @@ Historical Data:
 
         username, password = args[0], args[1]
         try:
-            login_endpoint = LoginEndpoint(username=username, password=password)
-            response = login_endpoint.post(client=self.client)
-            self.authenticated = True
+            response = self.login(username, password)
             print(f"✓ Logged in as: {response.username}")
             print(f"  Installations: {response.installationIdList}")
         except AuthenticationError as e:
@@ -105,14 +195,18 @@ Historical Data:
         except Exception as e:
             print(f"✗ Error: {e}")
 
+    def login(self, username: str, password: str):
+        """Authenticate the session's client and return the login response."""
+        response = LoginEndpoint(username=username, password=password).post(
+            client=self.client
+        )
+        self.authenticated = True
+        return response
+
     def cmd_installation(self, *args):
         """List installations."""
         try:
-            page_start = int(args[0]) if len(args) > 0 else 1
-            page_items = int(args[1]) if len(args) > 1 else 500000
-            endpoint = InstallationEndpoint(
-                pageStart=page_start, pageItems=page_items
-            )
+            endpoint = installation_endpoint(*args[:2])
             response = endpoint.get(client=self.get_authenticated_client())
             if not response.root:
                 print("No installations found.")
@@ -128,8 +222,7 @@ Historical Data:
             print("Usage: pageconfig <installation_id>")
             return
         try:
-            installation_id = int(args[0])
-            endpoint = PageConfigEndpoint(installation_id=installation_id)
+            endpoint = pageconfig_endpoint(args[0])
             response = endpoint.get(client=self.get_authenticated_client())
             print(f"Installation: {response.installation.name} (ID: {response.installation.id})")
             print(f"  Devices: {len(response.deviceMap)}")
@@ -149,12 +242,7 @@ Historical Data:
             print("  input_group_list: comma-separated group codes (e.g., 'group1,group2')")
             return
         try:
-            installation_id = int(args[0])
-            input_group_list = args[1].split(",")
-            endpoint = RealtimeDataEndpoint(
-                installation_id=installation_id,
-                input_group_list=input_group_list,
-            )
+            endpoint = realtimeget_endpoint(*args[:2])
             response = endpoint.get(client=self.get_authenticated_client())
             print(f"Real-time data ({len(response.root)} entries):")
             for entry in response.root:
@@ -180,11 +268,7 @@ Historical Data:
             print("Usage: slave <installation_id> <device_id>")
             return
         try:
-            installation_id = int(args[0])
-            device_id = int(args[1])
-            endpoint = GetFebosSlaveEndpoint(
-                installation_id=installation_id, device_id=device_id
-            )
+            endpoint = slave_endpoint(*args[:2])
             response = endpoint.get(client=self.get_authenticated_client())
             print(f"Slave device data ({len(response.root)} entries):")
             for slave in response.root:
@@ -204,11 +288,7 @@ Historical Data:
             print("Usage: language <installation_id> <device_id>")
             return
         try:
-            installation_id = int(args[0])
-            device_id = int(args[1])
-            endpoint = GetLanguageEndpoint(
-                installation_id=installation_id, device_id=device_id
-            )
+            endpoint = language_endpoint(*args[:2])
             response = endpoint.get(client=self.get_authenticated_client())
             print(f"Device language:")
             print(f"  ID: {response.ID_language}")
@@ -225,29 +305,12 @@ Historical Data:
             print("  from_ts/to_ts format: YYYY-MM-DD HH:MM:SS (defaults to today 00:00:00 to 23:59:00)")
             return
         try:
-            installation_id = int(args[0])
-            device_id = int(args[1])
-            from_ts = args[2] if len(args) > 2 else None
-            to_ts = args[3] if len(args) > 3 else None
-
-            if from_ts is None or to_ts is None:
-                today = datetime.now().date()
-                from_ts = f"{today} 00:00:00"
-                to_ts = f"{today} 23:59:00"
-
-            endpoint = GetDataAnalysisEndpoint(
-                installation_id=installation_id,
-                device_id=device_id,
-                from_ts=from_ts,
-                to_ts=to_ts,
-            )
-            response = endpoint.get(client=self.get_authenticated_client())
-            print(f"Data analysis rows ({len(response.root)} entries):")
-            for entry in response.root:
-                row_data = entry.model_dump()
-                ts = row_data.pop("ts")
-                print(f"  [{ts}]:")
-                for key, value in sorted(row_data.items()):
+            endpoint = dataanalysis_endpoint(*args[:4])
+            rows = endpoint.get_compact(client=self.get_authenticated_client())
+            print(f"Data analysis rows ({len(rows)} entries):")
+            for row in rows:
+                print(f"  [{row.ts}]:")
+                for key, value in sorted(row.values.items()):
                     print(f"    {key}: {value}")
         except ValueError:
             print("Installation ID and Device ID must be integers.")
@@ -262,17 +325,7 @@ Historical Data:
             print("  time_from/time_to: YYYY-MM-DD HH:MM:SS")
             return
         try:
-            installation_id = int(args[0])
-            input_group_list = args[1]
-            time_from = args[2]
-            time_to = args[3]
-
-            endpoint = GetHistoricalDataEndpoint(
-                installation_id=installation_id,
-                input_group_list=input_group_list,
-                time_from=time_from,
-                time_to=time_to,
-            )
+            endpoint = historicaldata_endpoint(*args[:4])
             response = endpoint.get(client=self.get_authenticated_client())
             print(f"Historical data ({len(response.root)} entries):")
             for entry in response.root:
@@ -322,15 +375,225 @@ Historical Data:
         else:
             print(f"Unknown command: '{cmd}'. Type 'help' for available commands.")
 
+    def run_batch(
+        self,
+        lines: Iterable[str],
+        limit: int = DEFAULT_LIMIT,
+        output: Optional[TextIO] = None,
+        credentials: Optional[Tuple[str, str]] = None,
+    ) -> int:
+        """Run commands non-interactively and write JSON lines.
+
+        Blank lines and lines starting with `#` are skipped. Arguments are
+        split like a shell does, so timestamps must be quoted, e.g.
+        `historicaldata 7593 GROUP "2026-02-11 00:00:00" "2026-02-11 23:59:59"`.
+        `login` commands (and `credentials`) run first, in order, on the
+        shared client; the other commands are independent and run
+        concurrently, up to `limit` at a time, in completion order.
+
+        Each command produces one JSON object with its `line` number and
+        `command`, and either `"ok": true` and the `result` or `"ok": false`
+        and the `error`.
+
+        Args:
+            lines: Command lines, e.g. an open file.
+            limit: Maximum number of requests in flight.
+            output: Stream the JSON lines are written to, defaults to
+                stdout.
+            credentials: Optional `(username, password)` to log in with
+                before the `login` commands of `lines`.
+
+        Returns:
+            Exit status: 0 if every command succeeded, 1 otherwise.
+        """
+        output = output if output is not None else sys.stdout
+        logins = [(0, *credentials)] if credentials else []
+        commands = []
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.split()[0].lower() != "login":
+                commands.append((number, line))
+                continue
+            try:
+                username, password = shlex.split(line)[1:]
+            except ValueError:
+                usage = "Usage: login <username> <password>"
+                _write_result(output, number, "login", error=usage)
+                return 1
+            logins.append((number, username, password))
+
+        for number, username, password in logins:
+            command = f"login {username}"
+            try:
+                response = self.login(username, password)
+            except Exception as e:
+                # Every other command would fail without a session
+                _write_result(output, number, command, error=e)
+                return 1
+            _write_result(
+                output,
+                number,
+                command,
+                result={
+                    "username": response.username,
+                    "installationIdList": response.installationIdList,
+                },
+            )
+
+        try:
+            client = self.get_authenticated_client()
+        except FebosError as e:
+            for number, line in commands:
+                _write_result(output, number, line, error=e)
+            return int(bool(commands))
+
+        status = 0
+        for result in fan_out(
+            client, lambda key: batch_endpoint(key[1]), commands, limit=limit
+        ):
+            number, line = result.key
+            if result.ok:
+                _write_result(
+                    output, number, line, result=result.value.model_dump(mode="json")
+                )
+            else:
+                _write_result(output, number, line, error=result.error)
+                status = 1
+        return status
+
+
+def batch_endpoint(line: str) -> FebosEndpoint:
+    """Build the endpoint of a batch command line.
+
+    Raises:
+        ValueError: If the command is unknown, interactive-only or has the
+            wrong number of arguments.
+    """
+    cmd, *args = shlex.split(line)
+    build = BATCH_COMMANDS.get(cmd.lower())
+    if build is None:
+        raise ValueError(f"Command not available in batch mode: '{cmd}'")
+    try:
+        return build(*args)
+    except TypeError:
+        raise ValueError(f"Wrong number of arguments for '{cmd}'") from None
+
+
+def _write_result(
+    output: TextIO,
+    number: int,
+    command: str,
+    result: Any = None,
+    error: Any = None,
+) -> None:
+    """Write the JSON line reporting the outcome of a batch command."""
+    record = {"line": number, "command": command, "ok": error is None}
+    if error is None:
+        record["result"] = result
+    elif isinstance(error, Exception):
+        record["error"] = f"{type(error).__name__}: {error}"
+    else:
+        record["error"] = error
+    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    output.flush()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Febos API command line client.")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="run the commands of FILE ('-' for stdin) and print JSON lines",
+    )
+    parser.add_argument(
+        "-u",
+        "--username",
+        default=os.getenv("FEBOS_USERNAME"),
+        help="log in first; the password is read from $FEBOS_PASSWORD or "
+        "prompted for",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="WARNING",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"batch commands run at the same time (default: {DEFAULT_LIMIT})",
+    )
+    return parser.parse_args(argv)
+
+
+def read_password() -> Optional[str]:
+    """Return the password from `FEBOS_PASSWORD`, prompting if it is unset.
+
+    Returns:
+        The password, or None if the variable is unset and stdin is not a
+        terminal to prompt on.
+    """
+    password = os.getenv("FEBOS_PASSWORD")
+    if password is not None or not sys.stdin.isatty():
+        return password
+    try:
+        return getpass.getpass("Febos password: ")
+    except EOFError:
+        return None
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Run batch mode on a client sized for the number of workers.
+
+    The password of `--username` is only taken from `FEBOS_PASSWORD`: batch
+    mode never prompts, since the prompt could consume a command line when
+    the batch is read from stdin. Without it the run fails with a JSON
+    error line.
+    """
+    credentials = None
+    if args.username:
+        password = os.getenv("FEBOS_PASSWORD")
+        if password is None:
+            command = f"login {args.username}"
+            _write_result(sys.stdout, 0, command, error=PASSWORD_MISSING)
+            return 1
+        credentials = (args.username, password)
+    client = FebosClient(
+        connection=ConnectionSettings(
+            max_connections=args.workers, max_keepalive_connections=args.workers
+        ),
+        retry=RetryPolicy(),
+    )
+    with client:
+        session = FebosSession(client)
+        if args.batch == "-":
+            return session.run_batch(sys.stdin, args.workers, credentials=credentials)
+        with open(args.batch, encoding="utf-8") as f:
+            return session.run_batch(f, args.workers, credentials=credentials)
+
+
+def main(argv=None) -> int:
+    """Main CLI loop, or batch mode with `--batch`."""
+    args = parse_args(argv)
+    logging.getLogger().setLevel(args.log_level)
+    if args.batch is not None:
+        return run_batch(args)
 
-def main():
-    """Main CLI loop."""
     session = FebosSession()
     print("=" * 60)
     print("  Febos Interactive CLI")
     print("=" * 60)
     print("Type 'help' for available commands or 'login <username> <password>' to start.")
     print()
+    if args.username:
+        password = read_password()
+        if password is None:
+            print(f"✗ {PASSWORD_MISSING}")
+        else:
+            session.cmd_login(args.username, password)
 
     try:
         while True:
@@ -347,7 +610,8 @@ def main():
                 break
     except KeyboardInterrupt:
         pass
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,13 +1,15 @@
 """Python API client for the EmmeTI Febos webapp.
 
-This package provides a small synchronous client and typed endpoint models
-for interacting with EmmeTI's Febos frontend API. Create a `FebosClient`,
+This package provides a small client and typed endpoint models for
+interacting with EmmeTI's Febos frontend API. Create a `FebosClient`,
 instantiate endpoint models (e.g., `GetDataAnalysisEndpoint`, `LoginEndpoint`)
-with that client and call `get()`/`post()` to perform requests.
+with that client and call `get()`/`post()` to perform requests. For asyncio
+code use an `AsyncFebosClient` with the `aget()`/`apost()` methods instead.
 """
 
-from febos.client import FebosClient
-from febos.data_model import (DataAnalysisEntry, Device,
+from febos.client import AsyncFebosClient, FebosClient
+from febos.data_model import (DataAnalysisEntry, Device, FlatRealtimeData,
+                              FlatRealtimeDataGetResponse,
                               GetDataAnalysisGetResponse,
                               GetFebosSlaveGetResponse, GetLanguageGetResponse,
                               HistoricalDataEntry, HistoricalDataGetResponse,
@@ -32,6 +34,7 @@ __version__ = "1.0.0"
 
 __all__ = [
     "FebosClient",
+    "AsyncFebosClient",
     "AuthenticationError",
     "FebosError",
     "GetDataAnalysisEndpoint",
@@ -59,6 +62,8 @@ __all__ = [
     "RealtimeData",
     "RealtimeDataGetResponse",
     "RealtimeDataPostResponse",
+    "FlatRealtimeData",
+    "FlatRealtimeDataGetResponse",
     "GetLanguageGetResponse",
     "DataAnalysisEntry",
     "GetDataAnalysisGetResponse",
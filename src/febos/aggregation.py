@@ -0,0 +1,352 @@
+"""Downsampling and aggregation of historical data series.
+
+A month of historical data at native resolution holds far more points than
+a dashboard can draw. This module reduces `HistoricalDataColumns` with NumPy:
+
+- `resample()` groups the points into fixed time buckets and reduces each
+  input to its `min`, `max`, `mean`, `last` value or `count` per bucket.
+- `Resampler` does the same incrementally, one chunk at a time, keeping only
+  the per-bucket aggregates in memory. `resample_chunks()` runs it over
+  `GetHistoricalDataEndpoint.iter_chunks()`, so a long range is fetched and
+  reduced without ever holding its raw points.
+- `lttb()` picks the points of a single series that best preserve its shape
+  when plotted (Largest-Triangle-Three-Buckets).
+
+NaN values (empty, null or non-numeric inputs) are ignored by every
+aggregate; a bucket without valid values yields NaN (0 for `count`).
+
+This module requires the optional `numpy` dependency
+(`pip install "febos[numpy]"`).
+
+Usage:
+    from datetime import timedelta
+    from febos.aggregation import resample_chunks
+
+    hourly = resample_chunks(
+        endpoint.iter_chunks(client=client), timedelta(hours=1), how="mean"
+    )
+    for columns in hourly:
+        print(columns.groupCode, columns.ts[0], columns.column("R8750")[0])
+"""
+
+from dataclasses import replace
+from datetime import timedelta
+from typing import (AsyncIterable, Dict, Iterable, List, NamedTuple, Optional,
+                    Tuple, Union)
+
+from febos.columnar import (HistoricalDataColumns, columns_from_entry,
+                            require_numpy)
+from febos.data_model import HistoricalDataGetResponse
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+AGGREGATES = ("min", "max", "mean", "last", "count")
+
+Chunk = Union[HistoricalDataGetResponse, Iterable[HistoricalDataColumns]]
+
+
+class _Buckets(NamedTuple):
+    """Partial aggregates of the buckets of one input group."""
+
+    ids: "np.ndarray"  # int64 bucket numbers, ascending
+    count: "np.ndarray"
+    sum: "np.ndarray"
+    min: "np.ndarray"
+    max: "np.ndarray"
+    last: "np.ndarray"
+
+
+def _bucket_ms(bucket: timedelta) -> int:
+    """Return the bucket width in milliseconds."""
+    width = int(bucket / timedelta(milliseconds=1))
+    if width < 1:
+        raise ValueError("bucket must be at least one millisecond")
+    return width
+
+
+def _run_starts(ids: "np.ndarray") -> "np.ndarray":
+    """Return the index of the first row of each run of equal sorted ids."""
+    return np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+
+
+def _last_valid(values: "np.ndarray", starts: "np.ndarray") -> "np.ndarray":
+    """Return the last non-NaN value of each column in each run of rows."""
+    nan = np.isnan(values)
+    if not nan.any():
+        return values[np.r_[starts[1:], len(values)] - 1]
+    index = np.where(nan, -1, np.arange(len(values))[:, None])
+    last = np.maximum.reduceat(index, starts, axis=0)
+    picked = values[last.clip(0), np.arange(values.shape[1])]
+    return np.where(last >= 0, picked, np.nan)
+
+
+def _reduce(ids: "np.ndarray", parts: _Buckets) -> _Buckets:
+    """Combine the rows of partial aggregates sharing a bucket id.
+
+    `ids` must be sorted; rows of the same bucket are combined in order, so
+    `last` keeps the value of the latest row.
+    """
+    starts = _run_starts(ids)
+    return _Buckets(
+        ids=ids[starts],
+        count=np.add.reduceat(parts.count, starts, axis=0),
+        sum=np.add.reduceat(parts.sum, starts, axis=0),
+        min=np.fmin.reduceat(parts.min, starts, axis=0),
+        max=np.fmax.reduceat(parts.max, starts, axis=0),
+        last=_last_valid(parts.last, starts),
+    )
+
+
+def _aggregate(columns: HistoricalDataColumns, width: int) -> Optional[_Buckets]:
+    """Aggregate the points of one entry into buckets of `width` ms.
+
+    The reductions run straight on the value matrix; full-size temporaries
+    are only built for unsorted timestamps or when values are missing.
+    """
+    if not len(columns):
+        return None
+    ms = columns.ts.astype("datetime64[ms]", copy=False).view(np.int64)
+    values = columns.values
+    if (ms[1:] < ms[:-1]).any():
+        order = np.argsort(ms, kind="stable")
+        ms, values = ms[order], values[order]
+    ids = ms // width
+    starts = _run_starts(ids)
+    valid = ~np.isnan(values)
+    if valid.all():
+        count = np.diff(np.r_[starts, len(values)])[:, None].repeat(
+            values.shape[1], axis=1
+        )
+        total = np.add.reduceat(values, starts, axis=0)
+    else:
+        count = np.add.reduceat(valid, starts, axis=0, dtype=np.int64)
+        total = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+    return _Buckets(
+        ids=ids[starts],
+        count=count,
+        sum=total,
+        min=np.fmin.reduceat(values, starts, axis=0),
+        max=np.fmax.reduceat(values, starts, axis=0),
+        last=_last_valid(values, starts),
+    )
+
+
+def _select(buckets: _Buckets, how: str) -> "np.ndarray":
+    """Return the value matrix of one aggregate."""
+    if how == "mean":
+        mean = np.full(buckets.sum.shape, np.nan)
+        return np.divide(buckets.sum, buckets.count, out=mean, where=buckets.count > 0)
+    if how == "count":
+        return buckets.count.astype(np.float64)
+    return getattr(buckets, how)
+
+
+def _check_how(how: str) -> None:
+    """Raise ValueError for an unknown aggregate name."""
+    if how not in AGGREGATES:
+        raise ValueError(f"how must be one of {', '.join(AGGREGATES)}, not {how!r}")
+
+
+def resample(
+    columns: HistoricalDataColumns, bucket: timedelta, how: str = "mean"
+) -> HistoricalDataColumns:
+    """Reduce an entry to one row per fixed time bucket.
+
+    Buckets are aligned on multiples of `bucket` since the epoch (e.g. hourly
+    buckets start on the hour) and labelled with their start time. Empty
+    buckets are omitted.
+
+    Args:
+        columns: Entry to resample.
+        bucket: Width of the buckets.
+        how: Aggregate to compute: `min`, `max`, `mean`, `last` or `count`.
+            Defaults to `mean`.
+
+    Returns:
+        HistoricalDataColumns with one timestamp per non-empty bucket.
+
+    Raises:
+        ValueError: If `how` or `bucket` is invalid.
+    """
+    resampler = Resampler(bucket)
+    resampler.feed([columns])
+    return resampler.result(how)[0]
+
+
+class Resampler:
+    """Incrementally aggregate historical data into fixed time buckets.
+
+    Each `feed()` reduces a chunk to per-bucket partial aggregates (count,
+    sum, min, max, last) and merges them with those of the previous chunks,
+    so memory grows with the number of buckets rather than the number of
+    points. Chunks must be fed in chronological order for `last` to be the
+    latest value of a bucket spanning two chunks.
+
+    Attributes:
+        bucket: Width of the buckets.
+    """
+
+    def __init__(self, bucket: timedelta) -> None:
+        """Initialize Resampler.
+
+        Args:
+            bucket: Width of the buckets.
+
+        Raises:
+            ValueError: If `bucket` is shorter than a millisecond.
+        """
+        require_numpy()
+        self.bucket = bucket
+        self._width = _bucket_ms(bucket)
+        self._groups: Dict[str, Tuple[HistoricalDataColumns, Optional[_Buckets]]] = {}
+
+    def feed(self, chunk: Chunk) -> None:
+        """Merge the points of a chunk into the aggregates.
+
+        Args:
+            chunk: A HistoricalDataGetResponse (e.g. from `iter_chunks()`)
+                or HistoricalDataColumns entries.
+        """
+        if isinstance(chunk, HistoricalDataGetResponse):
+            chunk = (columns_from_entry(entry) for entry in chunk.root)
+        for columns in chunk:
+            buckets = _aggregate(columns, self._width)
+            if columns.groupCode not in self._groups:
+                # Keep the identifying fields only, not the raw points
+                header = replace(
+                    columns,
+                    ts=np.empty(0, dtype="datetime64[ms]"),
+                    values=np.empty((0, len(columns.codes)), dtype=np.float64),
+                )
+                self._groups[columns.groupCode] = (header, buckets)
+                continue
+            first, previous = self._groups[columns.groupCode]
+            if previous is not None and buckets is not None:
+                parts = [np.concatenate(arrays) for arrays in zip(previous, buckets)]
+                order = np.argsort(parts[0], kind="stable")
+                buckets = _reduce(
+                    parts[0][order], _Buckets(*(part[order] for part in parts))
+                )
+            self._groups[columns.groupCode] = (
+                first,
+                buckets if buckets is not None else previous,
+            )
+
+    def result(self, how: str = "mean") -> List[HistoricalDataColumns]:
+        """Return the aggregated entries, in the order groups were first seen.
+
+        Args:
+            how: Aggregate to return: `min`, `max`, `mean`, `last` or
+                `count`. Defaults to `mean`.
+
+        Returns:
+            One HistoricalDataColumns per input group, with one timestamp
+            (the bucket start) per non-empty bucket.
+
+        Raises:
+            ValueError: If `how` is not a known aggregate.
+        """
+        _check_how(how)
+        results = []
+        for header, buckets in self._groups.values():
+            if buckets is None:
+                results.append(header)
+                continue
+            results.append(
+                replace(
+                    header,
+                    ts=(buckets.ids * self._width).astype("datetime64[ms]"),
+                    values=_select(buckets, how),
+                )
+            )
+        return results
+
+
+def resample_chunks(
+    chunks: Iterable[Chunk], bucket: timedelta, how: str = "mean"
+) -> List[HistoricalDataColumns]:
+    """Aggregate chunks into fixed time buckets as they arrive.
+
+    Args:
+        chunks: Chunks in chronological order, e.g.
+            `endpoint.iter_chunks(client=client)`.
+        bucket: Width of the buckets.
+        how: Aggregate to compute. Defaults to `mean`.
+
+    Returns:
+        One HistoricalDataColumns per input group.
+    """
+    _check_how(how)
+    resampler = Resampler(bucket)
+    for chunk in chunks:
+        resampler.feed(chunk)
+    return resampler.result(how)
+
+
+async def aresample_chunks(
+    chunks: AsyncIterable[Chunk], bucket: timedelta, how: str = "mean"
+) -> List[HistoricalDataColumns]:
+    """Aggregate chunks from an async iterator, e.g. `aiter_chunks()`.
+
+    Args:
+        chunks: Chunks in chronological order.
+        bucket: Width of the buckets.
+        how: Aggregate to compute. Defaults to `mean`.
+
+    Returns:
+        One HistoricalDataColumns per input group.
+    """
+    _check_how(how)
+    resampler = Resampler(bucket)
+    async for chunk in chunks:
+        resampler.feed(chunk)
+    return resampler.result(how)
+
+
+def lttb(
+    ts: "np.ndarray", values: "np.ndarray", threshold: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Downsample a series for plotting with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for each of `threshold - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    point kept for the previous bucket and the average of the next one.
+    NaN values are dropped first.
+
+    Args:
+        ts: Timestamps of the series (e.g. `columns.ts`), sorted.
+        values: Values of the series (e.g. `columns.column("R8750")`).
+        threshold: Number of points to keep, at least 3.
+
+    Returns:
+        The `(ts, values)` of the selected points.
+
+    Raises:
+        ValueError: If `threshold` is lower than 3.
+    """
+    require_numpy()
+    if threshold < 3:
+        raise ValueError("threshold must be at least 3")
+    keep = ~np.isnan(values)
+    ts, values = ts[keep], values[keep]
+    if len(values) <= threshold:
+        return ts, values
+
+    x = ts.astype("datetime64[ms]").astype(np.float64)
+    edges = np.linspace(1, len(values) - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, len(values) - 1
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        following = slice(stop, edges[i + 2] if i + 2 < len(edges) else len(values))
+        avg_x, avg_y = x[following].mean(), values[following].mean()
+        a = selected[i]
+        area = np.abs(
+            (x[a] - avg_x) * (values[start:stop] - values[a])
+            - (x[a] - x[start:stop]) * (avg_y - values[a])
+        )
+        selected[i + 1] = start + np.argmax(area)
+    return ts[selected], values[selected]
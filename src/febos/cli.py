@@ -0,0 +1,205 @@
+"""Non-interactive command line entry point.
+
+Installed as the `febos` command. The username is taken from the
+`--username` option or the `FEBOS_USERNAME` environment variable. Sessions
+are kept in the default `FileTokenStore`, so consecutive runs do not log in
+again and need no password. Otherwise the password is taken from the
+`FEBOS_PASSWORD` environment variable or prompted for on a terminal, so that
+it never shows up in the process list or the shell history.
+
+Usage:
+    febos export 7593 FB-GRAPH-DATA@D9551@T31115 \\
+        "2026-01-01 00:00:00" "2026-02-01 00:00:00" \\
+        --format parquet --output export/ --workers 8
+
+For an interactive session see `main.py` at the root of the repository.
+"""
+
+import argparse
+import getpass
+import os
+import sys
+from datetime import timedelta
+from typing import Any, Callable, List, Optional, TextIO
+
+from httpx import HTTPError
+
+from febos.client import ConnectionSettings, FebosClient
+from febos.error import FebosError
+from febos.export import FORMATS, ExportStats, export_historical
+from febos.get_historical_data import (DEFAULT_MAX_WORKERS,
+                                       GetHistoricalDataEndpoint)
+from febos.login import LoginEndpoint, restore_session
+from febos.retry import RetryPolicy
+from febos.token_store import FileTokenStore
+
+
+def _positive(convert: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Return an argparse type converting with `convert` and rejecting <= 0."""
+
+    def parse(value: str):
+        try:
+            number = convert(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+        if number <= 0:
+            raise argparse.ArgumentTypeError(f"must be positive, not {value}")
+        return number
+
+    return parse
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the `febos` command."""
+    parser = argparse.ArgumentParser(
+        prog="febos", description="Command line client for the EmmeTI Febos API."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser(
+        "export",
+        help="export historical data to CSV or Parquet files",
+        description="Export historical data, one file per input group.",
+    )
+    export.add_argument("installation_id", type=int)
+    export.add_argument("input_group_list", help="comma-separated input group codes")
+    export.add_argument("time_from", help='start time, "YYYY-MM-DD HH:MM:SS"')
+    export.add_argument("time_to", help='end time, "YYYY-MM-DD HH:MM:SS"')
+    export.add_argument(
+        "-f", "--format", choices=FORMATS, default="csv", help="default: csv"
+    )
+    export.add_argument(
+        "-o", "--output", default=".", help="output directory (default: .)"
+    )
+    export.add_argument(
+        "--chunk-hours",
+        type=_positive(float),
+        default=24.0,
+        help="time span of each request in hours (default: 24)",
+    )
+    export.add_argument(
+        "--workers",
+        type=_positive(int),
+        default=DEFAULT_MAX_WORKERS,
+        help=f"requests in flight (default: {DEFAULT_MAX_WORKERS})",
+    )
+    export.add_argument(
+        "-u",
+        "--username",
+        default=os.getenv("FEBOS_USERNAME"),
+        help="default: $FEBOS_USERNAME; without a stored session the "
+        "password is read from $FEBOS_PASSWORD or prompted for",
+    )
+    export.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report progress"
+    )
+    return parser
+
+
+def _reporter(stream: TextIO):
+    """Return a progress callback printing one line per chunk."""
+
+    def report(stats: ExportStats) -> None:
+        print(
+            f"chunk {stats.chunks}/{stats.total_chunks}: {stats.points} points, "
+            f"{stats.points_per_second:.0f} points/s",
+            file=stream,
+        )
+
+    return report
+
+
+def _password() -> str:
+    """Return the password from `FEBOS_PASSWORD`, prompting if it is unset.
+
+    Raises:
+        FebosError: If the variable is unset and stdin is not a terminal.
+    """
+    password = os.getenv("FEBOS_PASSWORD")
+    if password is not None:
+        return password
+    if not sys.stdin.isatty():
+        raise FebosError("Password missing: set FEBOS_PASSWORD")
+    try:
+        return getpass.getpass("Febos password: ")
+    except EOFError:
+        raise FebosError("Password missing: set FEBOS_PASSWORD") from None
+
+
+def _login(client: FebosClient, username: str) -> None:
+    """Log in, reusing the stored session unless `FEBOS_PASSWORD` is set.
+
+    With the password in the environment the client can also log in again
+    by itself when the stored token has expired.
+    """
+    if os.getenv("FEBOS_PASSWORD") is None and restore_session(client, username):
+        return
+    LoginEndpoint(username=username, password=_password()).post(client=client)
+
+
+def cmd_export(args: argparse.Namespace, client: FebosClient) -> None:
+    """Run the `export` command."""
+    if args.username is None:
+        raise FebosError("Username missing: set --username or FEBOS_USERNAME")
+    _login(client, args.username)
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=args.installation_id,
+        input_group_list=args.input_group_list,
+        time_from=args.time_from,
+        time_to=args.time_to,
+    )
+    stats = export_historical(
+        client,
+        endpoint,
+        args.output,
+        fmt=args.format,
+        chunk=timedelta(hours=args.chunk_hours),
+        max_workers=args.workers,
+        progress=None if args.quiet else _reporter(sys.stderr),
+    )
+    print(
+        f"Exported {stats.points} points of {len(stats.files)} input groups "
+        f"in {stats.elapsed:.1f} s ({stats.points_per_second:.0f} points/s)",
+        file=sys.stderr,
+    )
+    for path in stats.files.values():
+        print(path)
+
+
+COMMANDS = {"export": cmd_export}
+
+
+def main(argv: Optional[List[str]] = None, client: Optional[FebosClient] = None) -> int:
+    """Run the `febos` command.
+
+    Args:
+        argv: Command line arguments, defaults to `sys.argv[1:]`.
+        client: Client to use, defaults to a new FebosClient with retries,
+            a file token store and a connection per worker.
+
+    Returns:
+        Exit status: 0 on success, 1 on errors.
+    """
+    args = _parser().parse_args(argv)
+    owned = client is None
+    if owned:
+        client = FebosClient(
+            connection=ConnectionSettings(
+                max_connections=args.workers, max_keepalive_connections=args.workers
+            ),
+            retry=RetryPolicy(),
+            token_store=FileTokenStore(),
+        )
+    try:
+        COMMANDS[args.command](args, client)
+    except (FebosError, HTTPError, ImportError, ValueError) as e:
+        print(f"febos: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if owned:
+            client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
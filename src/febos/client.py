@@ -1,64 +1,332 @@
 """HTTP client helpers for Febos.
 
 This module provides `FebosClient`, a thin wrapper around `httpx.Client`,
+its asyncio counterpart `AsyncFebosClient` (built on `httpx.AsyncClient`)
 and related utilities such as `BearerAuth` and request/response logging
 helpers used by the package.
 """
 
+import asyncio
+import importlib.util
 import logging
 import os
-from typing import Generator, Optional
+import threading
+from dataclasses import dataclass, replace
+from typing import (Any, AsyncGenerator, Dict, Generator, Iterable, Optional,
+                    Tuple)
 
-from httpx import Auth, Client, Request, Response, Timeout
+from httpx import (URL, AsyncClient, Auth, Client, Headers, Limits, Request,
+                   Response, Timeout)
+
+from febos.data_model import LoginPostResponse
+from febos.error import AuthenticationError
+from febos.parsing import parse_response
+from febos.retry import RateLimiter, RetryPolicy
+from febos.token_store import StoredSession, TokenStore, session_key
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://emmeti.aq-iot.net"
+DEFAULT_HEADERS = {"Accept": "application/json, text/plain, */*"}
+
+
+LOG_BODY_LIMIT = 2048
+"""Maximum number of body bytes included in debug logs (None for no limit)."""
+
+REDACTED_HEADERS = frozenset({"authorization"})
+"""Lower-case names of headers whose values are masked in debug logs."""
+
+STREAM_EXTENSION = "febos_stream"
+"""Request extension marking requests whose response body is streamed.
+
+The debug logging hooks log only the headers of these responses, since
+reading the body would buffer it before the caller iterates over it.
+"""
+
+HTTP1_FALLBACK_CONNECTIONS = 100
+"""Minimum pool size when HTTP/2 settings fall back to HTTP/1.1."""
+
+
+def configure_logging(
+    body_limit: Optional[int] = LOG_BODY_LIMIT,
+    redact_headers: Iterable[str] = REDACTED_HEADERS,
+) -> None:
+    """Configure the request/response debug logging hooks.
+
+    Args:
+        body_limit: Maximum number of body bytes to log, or None to log
+            whole bodies. Defaults to 2048.
+        redact_headers: Names of headers whose values are replaced with
+            `[REDACTED]`. Defaults to `Authorization`; pass an empty
+            iterable to log every header verbatim.
+    """
+    global LOG_BODY_LIMIT, REDACTED_HEADERS
+    LOG_BODY_LIMIT = body_limit
+    REDACTED_HEADERS = frozenset(name.lower() for name in redact_headers)
+
+
+def _format_headers(headers: Headers) -> Dict[str, str]:
+    """Return headers as a dict with sensitive values redacted."""
+    return {
+        name: "[REDACTED]" if name.lower() in REDACTED_HEADERS else value
+        for name, value in headers.items()
+    }
+
+
+def _format_body(content: bytes) -> str:
+    """Decode at most `LOG_BODY_LIMIT` bytes of a body for logging."""
+    if LOG_BODY_LIMIT is None or len(content) <= LOG_BODY_LIMIT:
+        return content.decode(errors="replace")
+    return (
+        content[:LOG_BODY_LIMIT].decode(errors="replace")
+        + f"... [{len(content) - LOG_BODY_LIMIT} more bytes]"
+    )
+
+
+def _debug_request(request: Request, content: bytes) -> None:
+    """Emit the debug record for a request."""
+    LOGGER.debug(
+        "Request: %s %s\nHeaders: %s\nContent: %s",
+        request.method,
+        request.url,
+        _format_headers(request.headers),
+        _format_body(content),
+    )
+
+
+def _debug_response(response: Response, content: Optional[bytes]) -> None:
+    """Emit the debug record for a response, None content for streamed ones."""
+    LOGGER.debug(
+        "Response: %s %s\nHeaders: %s\nContent: %s",
+        response.status_code,
+        response.request.url,
+        _format_headers(response.headers),
+        "[streamed]" if content is None else _format_body(content),
+    )
+
+
+def _is_streamed(response: Response) -> bool:
+    """Tell whether the body of a response is left to the caller to stream."""
+    return bool(response.request.extensions.get(STREAM_EXTENSION))
+
 
 def log_request(request: Request) -> None:
     """Log HTTP request details.
 
+    Does nothing unless DEBUG logging is enabled for this module, so the
+    request body is neither read nor decoded in normal operation.
+
     Args:
         request: The HTTP request object to log.
     """
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
     try:
-        content = request.read().decode()
-        LOGGER.debug(
-            f"Request: {request.method} {request.url}\nHeaders: {dict(request.headers)}\nContent: {content}"
-        )
+        _debug_request(request, request.read())
     except Exception as e:
-        LOGGER.error(f"Error logging request: {e}")
+        LOGGER.error("Error logging request: %s", e)
 
 
 def log_response(response: Response) -> None:
     """Log HTTP response details.
 
+    Does nothing unless DEBUG logging is enabled for this module, so the
+    response body is neither read nor decoded in normal operation. The body
+    of streamed responses (see `STREAM_EXTENSION`) is never read.
+
     Args:
         response: The HTTP response object to log.
     """
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
     try:
-        request = response.request
-        content = response.read().decode()
-        LOGGER.debug(
-            f"Response: {response.status_code} {request.url}\nHeaders: {dict(request.headers)}\nContent: {content}"
-        )
+        if _is_streamed(response):
+            _debug_response(response, None)
+        else:
+            _debug_response(response, response.read())
+    except Exception as e:
+        LOGGER.error("Error logging response: %s", e)
+
+
+async def alog_request(request: Request) -> None:
+    """Log HTTP request details from an `AsyncFebosClient` event hook.
+
+    Args:
+        request: The HTTP request object to log.
+    """
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    try:
+        _debug_request(request, await request.aread())
+    except Exception as e:
+        LOGGER.error("Error logging request: %s", e)
+
+
+async def alog_response(response: Response) -> None:
+    """Log HTTP response details from an `AsyncFebosClient` event hook.
+
+    Args:
+        response: The HTTP response object to log.
+    """
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    try:
+        if _is_streamed(response):
+            _debug_response(response, None)
+        else:
+            _debug_response(response, await response.aread())
     except Exception as e:
-        LOGGER.error(f"Error logging response: {e}")
+        LOGGER.error("Error logging response: %s", e)
+
+
+@dataclass(frozen=True)
+class ConnectionSettings:
+    """Connection pool and protocol settings of a client.
+
+    With HTTP/2 every connection multiplexes many concurrent requests, so a
+    small pool serves hundreds of requests in flight; with HTTP/1.1 each
+    request in flight needs its own connection and extra requests wait for
+    a free one (up to the pool timeout).
+
+    Attributes:
+        http2: Negotiate HTTP/2 when the server supports it. Requires the
+            optional `h2` package (`pip install febos[http2]`); without it
+            the client falls back to HTTP/1.1 with a warning, raising the
+            pool limits to at least `HTTP1_FALLBACK_CONNECTIONS`.
+        max_connections: Maximum number of open connections, None for no
+            limit.
+        max_keepalive_connections: Maximum number of idle connections kept
+            open for reuse, None for no limit.
+        keepalive_expiry: Seconds an idle connection is kept open.
+    """
+
+    http2: bool = False
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+
+    def limits(self) -> Limits:
+        """Return the settings as `httpx.Limits`."""
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+COLLECTOR = ConnectionSettings(
+    http2=True,
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=120.0,
+)
+"""Long-running collectors with many concurrent requests to one server: a
+few HTTP/2 connections kept open between polls."""
+
+CLI = ConnectionSettings(
+    http2=False,
+    max_connections=4,
+    max_keepalive_connections=1,
+    keepalive_expiry=5.0,
+)
+"""Short-lived command line use: a handful of HTTP/1.1 connections."""
+
+
+def _client_options(
+    base_url: Optional[str],
+    timeout: float,
+    connection: Optional[ConnectionSettings] = None,
+) -> Dict[str, Any]:
+    """Build the keyword arguments shared by the sync and async clients.
+
+    Args:
+        base_url: Base URL for API requests, or None to use the default.
+        timeout: Request timeout in seconds.
+        connection: Connection settings, or None for the httpx defaults.
+
+    Returns:
+        Keyword arguments for `httpx.Client`/`httpx.AsyncClient`.
+    """
+    if base_url is None:
+        base_url = os.getenv("FEBOS_BASE_URL", DEFAULT_BASE_URL)
+    options = {
+        "base_url": base_url,
+        "timeout": Timeout(timeout),
+        "headers": dict(DEFAULT_HEADERS),
+    }
+    if connection is not None:
+        if connection.http2 and importlib.util.find_spec("h2") is None:
+            connection = _http1_fallback(connection)
+            LOGGER.warning(
+                "HTTP/2 requested but the 'h2' package is not installed, "
+                "using HTTP/1.1 with up to %s connections (pip install febos[http2])",
+                connection.max_connections,
+            )
+        options["http2"] = connection.http2
+        options["limits"] = connection.limits()
+    return options
+
+
+def _http1_fallback(connection: ConnectionSettings) -> ConnectionSettings:
+    """Return HTTP/1.1 settings replacing HTTP/2 ones.
+
+    Without multiplexing every request in flight needs its own connection,
+    so the pool limits are raised to at least `HTTP1_FALLBACK_CONNECTIONS`;
+    otherwise the requests a small HTTP/2 pool was sized for would queue
+    and fail with `PoolTimeout`.
+    """
+
+    def raised(limit: Optional[int]) -> Optional[int]:
+        return None if limit is None else max(limit, HTTP1_FALLBACK_CONNECTIONS)
+
+    return replace(
+        connection,
+        http2=False,
+        max_connections=raised(connection.max_connections),
+        max_keepalive_connections=raised(connection.max_keepalive_connections),
+    )
 
 
 class BearerAuth(Auth):
     """Bearer token authentication for HTTP requests.
 
+    When credentials are set, a 401 response is answered by logging in
+    again and replaying the original request with the new token. The login
+    is serialized by a lock and only performed if the token is still the
+    one the failed request was sent with, so concurrent requests failing
+    at the same time share a single login instead of each starting one.
+    With a `store`, a token saved there by another process since the
+    request was sent is used instead of logging in, and new tokens are
+    saved for the other processes.
+
     Attributes:
         token: Optional bearer token to include in Authorization header.
+        username: Optional username used to log in again on 401.
+        password: Optional password used to log in again on 401.
+        store: Optional `TokenStore` shared with other clients.
     """
 
-    def __init__(self, token: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        store: Optional[TokenStore] = None,
+    ) -> None:
         """Initialize BearerAuth.
 
         Args:
             token: Optional bearer token string.
+            username: Optional username for re-authentication.
+            password: Optional password for re-authentication.
+            store: Optional token store shared with other clients.
         """
         self.token = token
+        self.username = username
+        self.password = password
+        self.store = store
+        self._lock = threading.Lock()
+        self._alock = asyncio.Lock()
 
     def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
         """Apply bearer token to request.
@@ -69,12 +337,201 @@ class BearerAuth(Auth):
         Yields:
             The modified request with Authorization header if token is set.
         """
-        if self.token:
-            request.headers["Authorization"] = f"Bearer {self.token}"
+        self._apply(request)
+        yield request
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        """Apply the bearer token, logging in again if the server answers 401.
+
+        Args:
+            request: The HTTP request to authenticate.
+
+        Yields:
+            The authenticated request, then the login request and the
+            replayed request if the token was rejected.
+
+        Raises:
+            AuthenticationError: If logging in again fails.
+        """
+        sent = self._apply(request)
+        response = yield request
+        if not self._should_relogin(request, response):
+            return
+        with self._lock:
+            if self.token == sent and not self._load_stored(request, sent):
+                login = yield self._login_request(request)
+                login.read()
+                self._update_token(request, login)
+        self._apply(request)
+        yield request
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        """Asynchronous equivalent of `sync_auth_flow`.
+
+        Args:
+            request: The HTTP request to authenticate.
+
+        Yields:
+            The authenticated request, then the login request and the
+            replayed request if the token was rejected.
+
+        Raises:
+            AuthenticationError: If logging in again fails.
+        """
+        sent = self._apply(request)
+        response = yield request
+        if not self._should_relogin(request, response):
+            return
+        async with self._alock:
+            if self.token == sent and not self._load_stored(request, sent):
+                login = yield self._login_request(request)
+                await login.aread()
+                self._update_token(request, login)
+        self._apply(request)
         yield request
 
+    def _apply(self, request: Request) -> Optional[str]:
+        """Set the Authorization header and return the token used."""
+        token = self.token
+        if token:
+            request.headers["Authorization"] = f"Bearer {token}"
+        return token
+
+    def _should_relogin(self, request: Request, response: Response) -> bool:
+        """Whether a response calls for logging in again and replaying."""
+        from febos.login import LoginEndpoint
+
+        return (
+            response.status_code == 401
+            and self.username is not None
+            and self.password is not None
+            and not request.url.path.endswith(LoginEndpoint.URL)
+        )
+
+    def _login_request(self, request: Request) -> Request:
+        """Build a login request against the host of `request`."""
+        from febos.endpoint import FebosEndpoint
+        from febos.login import LoginEndpoint
+
+        LOGGER.info("Token rejected by %s, logging in again", request.url.host)
+        referer = request.url.join(FebosEndpoint.APP_URL + LoginEndpoint.REFERER)
+        return Request(
+            "POST",
+            request.url.join(FebosEndpoint.API_URL + LoginEndpoint.URL),
+            headers={**DEFAULT_HEADERS, "Referer": str(referer)},
+            json={"username": self.username, "password": self.password},
+        )
+
+    def _load_stored(self, request: Request, sent: Optional[str]) -> bool:
+        """Adopt a token stored by another client since `sent` was rejected."""
+        if self.store is None:
+            return False
+        session = self.store.load(session_key(request.url.host, self.username))
+        if session is None or session.token == sent:
+            return False
+        self.token = session.token
+        return True
+
+    def _update_token(self, request: Request, response: Response) -> None:
+        """Store the token returned by a login response.
+
+        Raises:
+            AuthenticationError: If the login failed or returned no token.
+        """
+        token = response.headers.get("Authorization")
+        if response.status_code != 200 or not token:
+            raise AuthenticationError(
+                f"Re-authentication failed with status {response.status_code}"
+            )
+        self.token = token
+        if self.store is not None:
+            try:
+                login = parse_response(LoginPostResponse, response.content)
+            except ValueError:
+                login = None
+            self.store.save(
+                session_key(request.url.host, self.username),
+                StoredSession(token, login),
+            )
+
+
+class _FebosClientMixin:
+    """Behaviour shared by `FebosClient` and `AsyncFebosClient`.
+
+    Attributes:
+        retry_policy: Optional `RetryPolicy` applied by endpoints to every
+            request. None disables retries.
+        rate_limiter: Optional per-host `RateLimiter` applied by endpoints
+            to every request attempt. None disables rate limiting.
+        token_store: Optional `TokenStore` used by `LoginEndpoint` and
+            re-authentication to share sessions with other clients.
+        trusted: Whether endpoints validate responses with the faster
+            strict pass first; see `febos.parsing`.
+    """
+
+    retry_policy: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    token_store: Optional[TokenStore] = None
+    trusted: bool = False
+    _base_url_cache: Optional[Tuple[URL, str]] = None
+
+    def _configure_retries(
+        self,
+        retry: Optional[RetryPolicy],
+        rate_limit: Optional[float],
+        rate_burst: Optional[float],
+    ) -> None:
+        """Store the retry policy and build the per-host rate limiter."""
+        self.retry_policy = retry
+        self.rate_limiter = (
+            RateLimiter(rate_limit, rate_burst) if rate_limit is not None else None
+        )
+
+    def base_url_string(self) -> str:
+        """Return `str(self.base_url)`, cached until the base URL changes."""
+        base_url = self.base_url
+        cache = self._base_url_cache
+        if cache is None or cache[0] is not base_url:
+            cache = self._base_url_cache = (base_url, str(base_url))
+        return cache[1]
+
+    def get_token(self) -> Optional[str]:
+        """Get the bearer token for authentication.
+
+        Returns:
+            The bearer token to use for subsequent requests. None if not yet authenticated.
+        """
+        return getattr(self.auth, "token", None) if self.auth else None
+
+    def set_token(self, token: str) -> None:
+        """Set or update the bearer token for authentication.
+
+        Args:
+            token: The bearer token to use for subsequent requests.
+        """
+        self._bearer_auth().token = token
+
+    def set_credentials(self, username: str, password: str) -> None:
+        """Store credentials used to log in again when the token is rejected.
+
+        Args:
+            username: Username for re-authentication.
+            password: Password for re-authentication.
+        """
+        auth = self._bearer_auth()
+        auth.username = username
+        auth.password = password
+
+    def _bearer_auth(self) -> BearerAuth:
+        """Return the client's BearerAuth, installing one if needed."""
+        if not isinstance(self.auth, BearerAuth):
+            self.auth = BearerAuth(store=self.token_store)
+        return self.auth
+
 
-class FebosClient(Client):
+class FebosClient(_FebosClientMixin, Client):
     """HTTP client for EmmeTI Febos API.
 
     Extends httpx.Client with bearer token authentication and request/response logging.
@@ -85,6 +542,12 @@ class FebosClient(Client):
         *args,
         base_url: Optional[str] = None,
         timeout: float = 30.0,
+        connection: Optional[ConnectionSettings] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
+        trusted: bool = False,
         **kwargs,
     ) -> None:
         """Initialize FebosClient.
@@ -92,39 +555,113 @@ class FebosClient(Client):
         Args:
             base_url: Base URL for API requests. Defaults to FEBOS_BASE_URL env var or EmmeTI production server.
             timeout: Request timeout in seconds. Defaults to 30.0.
+            connection: Optional connection pool and HTTP/2 settings, e.g.
+                the `COLLECTOR` or `CLI` presets. Defaults to the httpx
+                defaults (HTTP/1.1, 100 connections). Explicit httpx
+                `limits`/`http2` keyword arguments take precedence.
+            retry: Optional retry policy for endpoint requests. Defaults to
+                no retries.
+            rate_limit: Optional maximum number of requests per second and
+                host. Defaults to no limit.
+            rate_burst: Maximum burst of requests allowed by `rate_limit`.
+                Defaults to one second worth of requests.
+            token_store: Optional store sharing session tokens with other
+                clients and processes. Defaults to none.
+            trusted: Validate responses in strict mode first, for servers
+                known to send well-typed payloads. A body failing the strict
+                pass is parsed a second time in lax mode, and its model is
+                validated lax only from then on. Defaults to False.
             *args: Additional positional arguments passed to httpx.Client.
             **kwargs: Additional keyword arguments passed to httpx.Client.
         """
-        if base_url is None:
-            base_url = os.getenv("FEBOS_BASE_URL", "https://emmeti.aq-iot.net")
-
-        super().__init__(
-            *args,
-            base_url=base_url,
-            timeout=Timeout(timeout),
-            headers={
-                "Accept": "application/json, text/plain, */*",
-            },
-            **kwargs,
-        )
+        options = _client_options(base_url, timeout, connection)
+        super().__init__(*args, **(options | kwargs))
+        self._configure_retries(retry, rate_limit, rate_burst)
+        self.token_store = token_store
+        self.trusted = trusted
         # Only add logging hooks if not already present to prevent duplicates
         if log_request not in self.event_hooks["request"]:
             self.event_hooks["request"].append(log_request)
         if log_response not in self.event_hooks["response"]:
             self.event_hooks["response"].append(log_response)
 
-    def get_token(self) -> Optional[str]:
-        """Get the bearer token for authentication.
 
-        Returns:
-            The bearer token to use for subsequent requests. None if not yet authenticated.
+class AsyncFebosClient(_FebosClientMixin, AsyncClient):
+    """Asyncio HTTP client for EmmeTI Febos API.
+
+    Extends httpx.AsyncClient with the same bearer token authentication,
+    base URL and default headers as `FebosClient`. Use it with the `aget()`
+    and `apost()` endpoint methods to keep many requests in flight from a
+    single event loop.
+    """
+
+    def __init__(
+        self,
+        *args,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        connection: Optional[ConnectionSettings] = None,
+        max_concurrency: Optional[int] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
+        trusted: bool = False,
+        **kwargs,
+    ) -> None:
+        """Initialize AsyncFebosClient.
+
+        Args:
+            base_url: Base URL for API requests. Defaults to FEBOS_BASE_URL env var or EmmeTI production server.
+            timeout: Request timeout in seconds. Defaults to 30.0.
+            connection: Optional connection pool and HTTP/2 settings, e.g.
+                the `COLLECTOR` or `CLI` presets. Defaults to the httpx
+                defaults (HTTP/1.1, 100 connections). Explicit httpx
+                `limits`/`http2` keyword arguments take precedence.
+            max_concurrency: Optional upper bound on the number of requests
+                in flight at the same time. Extra requests wait for a free
+                slot instead of failing. Defaults to no limit.
+            retry: Optional retry policy for endpoint requests. Defaults to
+                no retries.
+            rate_limit: Optional maximum number of requests per second and
+                host. Defaults to no limit.
+            rate_burst: Maximum burst of requests allowed by `rate_limit`.
+                Defaults to one second worth of requests.
+            token_store: Optional store sharing session tokens with other
+                clients and processes. Defaults to none.
+            trusted: Validate responses in strict mode first, for servers
+                known to send well-typed payloads. A body failing the strict
+                pass is parsed a second time in lax mode, and its model is
+                validated lax only from then on. Defaults to False.
+            *args: Additional positional arguments passed to httpx.AsyncClient.
+            **kwargs: Additional keyword arguments passed to httpx.AsyncClient.
         """
-        return getattr(self.auth, "token", None) if self.auth else None
+        options = _client_options(base_url, timeout, connection)
+        super().__init__(*args, **(options | kwargs))
+        self._configure_retries(retry, rate_limit, rate_burst)
+        self.token_store = token_store
+        self.trusted = trusted
+        self.max_concurrency = max_concurrency
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        # Only add logging hooks if not already present to prevent duplicates
+        if alog_request not in self.event_hooks["request"]:
+            self.event_hooks["request"].append(alog_request)
+        if alog_response not in self.event_hooks["response"]:
+            self.event_hooks["response"].append(alog_response)
 
-    def set_token(self, token: str) -> None:
-        """Set or update the bearer token for authentication.
+    async def send(self, request: Request, **kwargs) -> Response:
+        """Send a request, waiting for a free slot if `max_concurrency` is set.
 
         Args:
-            token: The bearer token to use for subsequent requests.
+            request: The HTTP request to send.
+            **kwargs: Additional keyword arguments passed to httpx.AsyncClient.send.
+
+        Returns:
+            httpx.Response object.
         """
-        self.auth = BearerAuth(token)
+        if self._semaphore is None:
+            return await super().send(request, **kwargs)
+        async with self._semaphore:
+            return await super().send(request, **kwargs)
@@ -0,0 +1,304 @@
+"""Columnar NumPy representations of Febos responses.
+
+Large historical responses are decoded straight from the JSON payload into
+NumPy arrays instead of one Pydantic model per data point. Each
+`HistoricalDataEntry` becomes a `HistoricalDataColumns` holding a
+`datetime64[ms]` timestamp array and a `float64` value matrix with one
+column per input code. Data analysis rows are decoded the same way into a
+single `DataAnalysisColumns` over the union of their input codes, which can
+be exported as an Arrow table or a Parquet file.
+
+This module requires the optional `numpy` dependency
+(`pip install "febos[numpy]"`); Arrow and Parquet export also require
+`pyarrow` (`pip install "febos[arrow]"`).
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, List, Union
+
+from febos.data_model import HistoricalDataEntry
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+
+JsonContent = Union[bytes, str, List[Any]]
+
+
+def require_numpy() -> None:
+    """Raise an informative error if NumPy is not installed.
+
+    Raises:
+        ImportError: If the optional `numpy` dependency is missing.
+    """
+    if np is None:
+        raise ImportError(
+            'numpy is required for columnar decoding: pip install "febos[numpy]"'
+        )
+
+
+def require_pyarrow() -> None:
+    """Raise an informative error if pyarrow is not installed.
+
+    Raises:
+        ImportError: If the optional `pyarrow` dependency is missing.
+    """
+    if pa is None:
+        raise ImportError(
+            'pyarrow is required for Arrow export: pip install "febos[arrow]"'
+        )
+
+
+def load_json(content: JsonContent) -> Any:
+    """Parse raw response content, passing already decoded JSON through.
+
+    Args:
+        content: Response body as bytes/str, or the decoded JSON value.
+
+    Returns:
+        The decoded JSON value.
+    """
+    if isinstance(content, (bytes, bytearray, str)):
+        return json.loads(content)
+    return content
+
+
+def to_float(value: Any) -> float:
+    """Convert a raw wire value to float, mapping null or invalid to NaN.
+
+    Args:
+        value: Raw value, usually a numeric string such as `"194"`.
+
+    Returns:
+        The value as float, or NaN for None, empty and non-numeric values.
+    """
+    if value is None or value == "":
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def to_float_matrix(rows: List[List[Any]], width: int) -> "np.ndarray":
+    """Convert rows of raw values to a `float64` matrix.
+
+    Tries a single vectorized conversion first and falls back to converting
+    value by value when rows contain nulls, placeholders such as `"---"` or
+    have a different length than `width`.
+
+    Args:
+        rows: Raw values, one list per timestamp.
+        width: Number of columns of the resulting matrix.
+
+    Returns:
+        Array of shape `(len(rows), width)` with NaN for missing values.
+    """
+    if not rows:
+        return np.empty((0, width), dtype=np.float64)
+    try:
+        values = np.array(rows, dtype=np.float64)
+        if values.shape == (len(rows), width):
+            return values
+    except (TypeError, ValueError):
+        pass
+    values = np.full((len(rows), width), np.nan, dtype=np.float64)
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row[:width]):
+            values[i, j] = to_float(value)
+    return values
+
+
+class _Columns:
+    """Lookups and exports shared by the columnar classes."""
+
+    codes: List[str]
+    ts: "np.ndarray"
+    values: "np.ndarray"
+
+    def __len__(self) -> int:
+        """Return the number of timestamps."""
+        return len(self.ts)
+
+    def column(self, code: str) -> "np.ndarray":
+        """Return the values of a single input code.
+
+        Args:
+            code: Input code, e.g. `R8750`.
+
+        Returns:
+            View on the matching column of `values`.
+
+        Raises:
+            KeyError: If `code` is not part of this entry.
+        """
+        try:
+            return self.values[:, self.codes.index(code)]
+        except ValueError:
+            raise KeyError(code) from None
+
+    def to_records(self) -> "np.recarray":
+        """Return a NumPy record array with a `ts` field and one per code."""
+        return np.rec.fromarrays([self.ts, *self.values.T], names=["ts", *self.codes])
+
+    def to_arrow(self) -> "pa.Table":
+        """Return an Arrow table with a `ts` column and one column per code.
+
+        NaN values become nulls, so missing and non-numeric values load as
+        SQL NULL rather than NaN. Requires the optional `pyarrow` dependency.
+        """
+        require_pyarrow()
+        columns = {"ts": pa.array(self.ts)}
+        for i, code in enumerate(self.codes):
+            column = self.values[:, i]
+            columns[code] = pa.array(column, mask=np.isnan(column))
+        return pa.table(columns)
+
+    def to_parquet(self, path: Union[str, os.PathLike], **kwargs: Any) -> None:
+        """Write the columns to a Parquet file.
+
+        Requires the optional `pyarrow` dependency.
+
+        Args:
+            path: Destination file.
+            **kwargs: Additional arguments for `pyarrow.parquet.write_table`
+                (e.g. `compression="zstd"`).
+        """
+        require_pyarrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+
+@dataclass(frozen=True)
+class HistoricalDataColumns(_Columns):
+    """Columnar view of a single `HistoricalDataEntry`.
+
+    Attributes:
+        deviceId: ID of the device the input group belongs to.
+        thingId: ID of the thing the input group belongs to.
+        groupCode: Input group code (e.g. `FB-GRAPH-DATA@D9551@T31115`).
+        codes: Input codes naming the columns of `values`.
+        ts: Timestamps as a `datetime64[ms]` array of length N.
+        values: `float64` matrix of shape (N, len(codes)); NaN marks
+            empty, null or non-numeric values.
+    """
+
+    deviceId: int
+    thingId: int
+    groupCode: str
+    codes: List[str]
+    ts: "np.ndarray"
+    values: "np.ndarray"
+
+
+@dataclass(frozen=True)
+class DataAnalysisColumns(_Columns):
+    """Columnar view of a data analysis response.
+
+    Attributes:
+        codes: Input codes naming the columns of `values`, sorted; the
+            union of the codes of all rows.
+        ts: Timestamps as a `datetime64[ms]` array of length N.
+        values: `float64` matrix of shape (N, len(codes)); NaN marks codes
+            missing from a row and empty, null or non-numeric values such
+            as `---`.
+    """
+
+    codes: List[str]
+    ts: "np.ndarray"
+    values: "np.ndarray"
+
+
+def decode_historical_entry(entry: dict) -> HistoricalDataColumns:
+    """Decode one raw historical data entry into columns.
+
+    Args:
+        entry: Decoded JSON object of a single historical data entry.
+
+    Returns:
+        HistoricalDataColumns for the entry.
+    """
+    require_numpy()
+    codes = [item["code"] for item in entry["inputArray"]]
+    data = entry["data"]
+    return HistoricalDataColumns(
+        deviceId=entry["deviceId"],
+        thingId=entry["thingId"],
+        groupCode=entry["groupCode"],
+        codes=codes,
+        ts=np.array([point["ts"] for point in data], dtype="datetime64[ms]"),
+        values=to_float_matrix([point["vs"] for point in data], len(codes)),
+    )
+
+
+def columns_from_entry(entry: HistoricalDataEntry) -> HistoricalDataColumns:
+    """Convert an already parsed historical data entry into columns.
+
+    Args:
+        entry: Entry of a HistoricalDataGetResponse.
+
+    Returns:
+        HistoricalDataColumns for the entry.
+    """
+    require_numpy()
+    codes = [item.code for item in entry.inputArray]
+    return HistoricalDataColumns(
+        deviceId=entry.deviceId,
+        thingId=entry.thingId,
+        groupCode=entry.groupCode,
+        codes=codes,
+        ts=np.array([point.ts for point in entry.data], dtype="datetime64[ms]"),
+        values=to_float_matrix([point.vs for point in entry.data], len(codes)),
+    )
+
+
+def decode_historical_data(content: JsonContent) -> List[HistoricalDataColumns]:
+    """Decode a historical data response without building per-point models.
+
+    Args:
+        content: Response body as bytes/str, or the decoded JSON list.
+
+    Returns:
+        One HistoricalDataColumns per entry of the response.
+    """
+    require_numpy()
+    return [decode_historical_entry(entry) for entry in load_json(content)]
+
+
+def decode_data_analysis(content: JsonContent) -> DataAnalysisColumns:
+    """Decode a data analysis response without building per-row models.
+
+    Each input code is gathered into its own column with a single lookup
+    per row, then converted to floats in one vectorized call where the
+    column holds numbers only.
+
+    Args:
+        content: Response body as bytes/str, or the decoded JSON list.
+
+    Returns:
+        DataAnalysisColumns over the union of the input codes of all rows.
+    """
+    require_numpy()
+    rows = load_json(content)
+    codes = sorted(set().union(*rows) - {"ts"})
+    values = np.empty((len(rows), len(codes)), dtype=np.float64)
+    for i, code in enumerate(codes):
+        column = [row.get(code) for row in rows]
+        try:
+            values[:, i] = np.array(column, dtype=np.float64)
+        except (TypeError, ValueError):
+            values[:, i] = [to_float(value) for value in column]
+    return DataAnalysisColumns(
+        codes=codes,
+        ts=np.array([row["ts"] for row in rows], dtype="datetime64[ms]"),
+        values=values,
+    )
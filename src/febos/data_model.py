@@ -8,7 +8,7 @@ structures returned by the server.
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, Field, RootModel, field_validator
 
 
 class Slave(BaseModel):
@@ -200,6 +200,7 @@ class RealtimeData(BaseModel):
     data: dict[str, Value]
     deviceId: int
     thingId: int
+    groupCode: Optional[str] = None
     ts: str = Field(
         default_factory=lambda: datetime.now(timezone.utc).strftime(
             "%Y-%m-%dT%H:%M:%S.%f"
@@ -212,6 +213,34 @@ class RealtimeDataGetResponse(RootModel):
     root: List[RealtimeData]
 
 
+class FlatRealtimeData(BaseModel):
+    """Realtime data with values unwrapped from their `{"i": value}` objects.
+
+    Parsed from the same wire format as `RealtimeData`, but `data` maps each
+    input code straight to its value instead of a `Value` model.
+    """
+
+    data: Dict[str, Any]
+    deviceId: int
+    thingId: int
+    groupCode: Optional[str] = None
+    ts: Optional[str] = None
+
+    @field_validator("data", mode="before")
+    @classmethod
+    def _unwrap(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {
+                code: value["i"] if isinstance(value, dict) and "i" in value else value
+                for code, value in data.items()
+            }
+        return data
+
+
+class FlatRealtimeDataGetResponse(RootModel):
+    root: List[FlatRealtimeData]
+
+
 class RealtimeDataPostResponse(BaseModel):
     errCode: int
     msg: str
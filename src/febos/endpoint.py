@@ -5,13 +5,22 @@ to model API endpoints and perform HTTP requests against the Febos
 frontend API.
 """
 
+import asyncio
+import logging
+import re
+import string
+import time
 from abc import ABC
-from typing import Any, ClassVar, Dict, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import (Any, AsyncIterator, ClassVar, Dict, Iterator, Optional,
+                    Tuple)
 
-from httpx import Response
+from httpx import Response, TransportError
 from pydantic import BaseModel
 
-from febos.client import FebosClient
+from febos.client import STREAM_EXTENSION, AsyncFebosClient, FebosClient
+
+LOGGER = logging.getLogger(__name__)
 
 
 class FebosEndpoint(ABC, BaseModel):
@@ -31,13 +40,23 @@ class FebosEndpoint(ABC, BaseModel):
     Notes:
         - `get()` and `post()` convenience methods call `_call()` which
           forwards keyword arguments directly to the underlying httpx client.
+          `aget()` and `apost()` are the asyncio equivalents built on
+          `_acall()` and an `AsyncFebosClient`.
                 - Path placeholders in `URL` are formatted using the endpoint model
-                    values (via `self.model_dump()`). For example, if the model has
+                    values. For example, if the model has
                     `installation_id` and `device_id` fields they will be used to fill
                     `{installation_id}`/`{device_id}` in the `URL` automatically when
-                    calling `get()` or `post()`.
+                    calling `get()` or `post()`. The template is parsed once when
+                    the subclass is created and only the referenced fields are read
+                    per request; placeholders must name model fields.
         - To send a JSON body call `super().post(json=...)`.
         - To include query parameters pass `params={...}` to `get()`/`post()`.
+        - `_stream()`/`_astream()` are context managers yielding the
+          response before its body is read, for endpoints parsing large
+          bodies incrementally (see `febos.streaming`).
+        - Failed requests are retried according to the client's
+          `retry_policy` and paced by its per-host `rate_limiter`; see
+          `febos.retry`.
     """
 
     APP_URL: ClassVar[str] = "/aq-iot-app-emmeti"
@@ -45,6 +64,37 @@ class FebosEndpoint(ABC, BaseModel):
     URL: ClassVar[str]  # Must be overridden in subclasses
     REFERER: ClassVar[str]  # Must be overridden in subclasses
 
+    # Precompiled by __pydantic_init_subclass__ from URL and REFERER
+    _url_template: ClassVar[str] = ""
+    _url_fields: ClassVar[Tuple[str, ...]] = ()
+    _referer_path: ClassVar[str] = ""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompile the URL template and Referer path of a subclass.
+
+        Raises:
+            TypeError: If a placeholder in `URL` is not a model field.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        if not hasattr(cls, "URL"):
+            return
+        template = f"{cls.API_URL}{cls.URL}"
+        fields = tuple(
+            dict.fromkeys(
+                re.split(r"[.\[]", name, maxsplit=1)[0]
+                for _, name, _, _ in string.Formatter().parse(template)
+                if name is not None
+            )
+        )
+        unknown = [name for name in fields if name not in cls.model_fields]
+        if unknown:
+            raise TypeError(f"{cls.__name__}.URL references unknown fields {unknown}")
+        # Templates without placeholders are formatted once here
+        cls._url_template = template if fields else template.format()
+        cls._url_fields = fields
+        cls._referer_path = f"{cls.APP_URL}{getattr(cls, 'REFERER', '')}"
+
     def _call(
         self,
         client: FebosClient,
@@ -63,20 +113,255 @@ class FebosEndpoint(ABC, BaseModel):
             httpx.Response object.
 
         Raises:
-            HTTPStatusError: If response status indicates an error.
+            HTTPStatusError: If response status indicates an error and the
+                client retry policy gave up.
+            TransportError: If the request could not be sent and the client
+                retry policy gave up.
+        """
+        if headers is None:
+            headers = {}
+        url = self._url()
+        headers = self._headers(client) | headers
+        method = kwargs.get("method", "GET")
+
+        attempt = 1
+        while True:
+            if client.rate_limiter is not None:
+                client.rate_limiter.bucket(client.base_url.host).acquire()
+            try:
+                response = client.request(url=url, headers=headers, **kwargs)
+            except TransportError as e:
+                delay = self._retry_delay(client, method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(client, method, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def _acall(
+        self,
+        client: AsyncFebosClient,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Response:
+        """Make asynchronous HTTP request to the endpoint.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the request.
+            headers: Optional additional headers to merge into the request.
+            **kwargs: Additional keyword arguments forwarded to
+                `httpx.AsyncClient.request` (for example: `method`, `params`, `json`).
+
+        Returns:
+            httpx.Response object.
+
+        Raises:
+            HTTPStatusError: If response status indicates an error and the
+                client retry policy gave up.
+            TransportError: If the request could not be sent and the client
+                retry policy gave up.
+        """
+        if headers is None:
+            headers = {}
+        url = self._url()
+        headers = self._headers(client) | headers
+        method = kwargs.get("method", "GET")
+
+        attempt = 1
+        while True:
+            if client.rate_limiter is not None:
+                await client.rate_limiter.bucket(client.base_url.host).aacquire()
+            try:
+                response = await client.request(url=url, headers=headers, **kwargs)
+            except TransportError as e:
+                delay = self._retry_delay(client, method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(client, method, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @contextmanager
+    def _stream(
+        self,
+        client: FebosClient,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Iterator[Response]:
+        """Make HTTP request to the endpoint without reading the body.
+
+        Retries and rate limiting apply until the response headers are
+        received; errors while the caller reads the body are not retried.
+
+        Args:
+            client: FebosClient instance used to perform the request.
+            headers: Optional additional headers to merge into the request.
+            **kwargs: Additional keyword arguments forwarded to
+                `httpx.Client.build_request` (for example: `method`, `params`).
+
+        Yields:
+            httpx.Response whose body can be read with `iter_bytes()`.
+
+        Raises:
+            HTTPStatusError: If response status indicates an error and the
+                client retry policy gave up.
+            TransportError: If the request could not be sent and the client
+                retry policy gave up.
         """
         if headers is None:
             headers = {}
+        request = client.build_request(
+            url=self._url(), headers=self._headers(client) | headers, **kwargs
+        )
+        request.extensions[STREAM_EXTENSION] = True
+
+        attempt = 1
+        while True:
+            if client.rate_limiter is not None:
+                client.rate_limiter.bucket(client.base_url.host).acquire()
+            try:
+                response = client.send(request, stream=True)
+            except TransportError as e:
+                delay = self._retry_delay(client, request.method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                try:
+                    delay = self._retry_delay(
+                        client, request.method, attempt, response=response
+                    )
+                    if delay is None:
+                        response.raise_for_status()
+                        yield response
+                        return
+                finally:
+                    response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    @asynccontextmanager
+    async def _astream(
+        self,
+        client: AsyncFebosClient,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> AsyncIterator[Response]:
+        """Asynchronous equivalent of `_stream()`.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the request.
+            headers: Optional additional headers to merge into the request.
+            **kwargs: Additional keyword arguments forwarded to
+                `httpx.AsyncClient.build_request` (e.g. `method`, `params`).
+
+        Yields:
+            httpx.Response whose body can be read with `aiter_bytes()`.
 
-        response = client.request(
-            url=f"{FebosEndpoint.API_URL}{self.URL}".format(**self.model_dump()),
-            headers={"Referer": str(client.base_url) + self.APP_URL + self.REFERER}
-            | headers,
-            **kwargs,
+        Raises:
+            HTTPStatusError: If response status indicates an error and the
+                client retry policy gave up.
+            TransportError: If the request could not be sent and the client
+                retry policy gave up.
+        """
+        if headers is None:
+            headers = {}
+        request = client.build_request(
+            url=self._url(), headers=self._headers(client) | headers, **kwargs
         )
+        request.extensions[STREAM_EXTENSION] = True
+
+        attempt = 1
+        while True:
+            if client.rate_limiter is not None:
+                await client.rate_limiter.bucket(client.base_url.host).aacquire()
+            try:
+                response = await client.send(request, stream=True)
+            except TransportError as e:
+                delay = self._retry_delay(client, request.method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                try:
+                    delay = self._retry_delay(
+                        client, request.method, attempt, response=response
+                    )
+                    if delay is None:
+                        response.raise_for_status()
+                        yield response
+                        return
+                finally:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
-        response.raise_for_status()
-        return response
+    def _retry_delay(
+        self,
+        client: FebosClient | AsyncFebosClient,
+        method: str,
+        attempt: int,
+        response: Optional[Response] = None,
+        error: Optional[TransportError] = None,
+    ) -> Optional[float]:
+        """Decide whether an attempt is retried and how long to wait first.
+
+        Args:
+            client: Client holding the retry policy and rate limiter.
+            method: HTTP method of the request.
+            attempt: Number of the attempt that just finished.
+            response: Response of the attempt, if one was received.
+            error: Transport error of the attempt, if it failed to send.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to stop and
+            return the response (or re-raise the error).
+        """
+        policy = client.retry_policy
+        if policy is None:
+            return None
+        if error is not None:
+            if not policy.retry_error(method, error, attempt):
+                return None
+            delay = policy.delay(attempt)
+            reason = repr(error)
+        else:
+            if response.is_success or not policy.retry_response(
+                method, response, attempt
+            ):
+                return None
+            delay = policy.delay(attempt, response)
+            reason = str(response.status_code)
+            if response.status_code == 429 and client.rate_limiter is not None:
+                # Slow down every request to the host, not just this one
+                client.rate_limiter.bucket(client.base_url.host).pause(delay)
+        LOGGER.warning(
+            "Retrying %s %s in %.2fs after attempt %d failed: %s",
+            method,
+            self.URL,
+            delay,
+            attempt,
+            reason,
+        )
+        return delay
+
+    def _url(self) -> str:
+        """Format the endpoint URL path with the model field values."""
+        if not self._url_fields:
+            return self._url_template
+        return self._url_template.format_map(
+            {name: getattr(self, name) for name in self._url_fields}
+        )
+
+    def _headers(self, client: FebosClient | AsyncFebosClient) -> Dict[str, Any]:
+        """Build the default headers sent with every request to the endpoint."""
+        return {"Referer": client.base_url_string() + self._referer_path}
 
     def get(self, *args, **kwargs) -> Any:
         """Make GET request to endpoint.
@@ -100,3 +385,28 @@ class FebosEndpoint(ABC, BaseModel):
             headers = {}
         headers = {"Content-Type": "application/json"} | headers
         return self._call(method="POST", *args, headers=headers, **kwargs)
+
+    async def aget(self, *args, **kwargs) -> Any:
+        """Make asynchronous GET request to endpoint.
+
+        Returns:
+            HTTP response object.
+        """
+        return await self._acall(method="GET", *args, **kwargs)
+
+    async def apost(
+        self, *args, headers: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Any:
+        """Make asynchronous POST request to endpoint.
+
+        Args:
+            headers: Optional additional headers.
+            **kwargs: URL format and body parameters.
+
+        Returns:
+            HTTP response object.
+        """
+        if headers is None:
+            headers = {}
+        headers = {"Content-Type": "application/json"} | headers
+        return await self._acall(method="POST", *args, headers=headers, **kwargs)
@@ -0,0 +1,237 @@
+"""Bulk export of historical data to CSV or Parquet files.
+
+`export_historical()` fetches the range of a `GetHistoricalDataEndpoint` with
+`iter_chunks()` (several chunk requests in flight, chunks processed in
+chronological order) and appends every chunk to one file per input group as
+soon as it arrives, so memory stays bounded by the chunks in flight however
+long the range is.
+
+- CSV files hold a `ts` column and one column per input code with the raw
+  values exactly as returned by the server. Writes go through a 1 MiB
+  buffer instead of one system call per line.
+- Parquet files hold a `timestamp[ms]` column and one `float64` column per
+  input code (see `febos.columnar`), with nulls for empty and non-numeric
+  values, one row group per chunk. This format requires the optional
+  `arrow` dependency (`pip install "febos[arrow]"`).
+
+The `febos export` command (`febos.cli`) is a thin wrapper around this
+module.
+
+Usage:
+    from febos.export import export_historical
+
+    stats = export_historical(client, endpoint, "export/", fmt="parquet")
+    print(f"{stats.points} points, {stats.points_per_second:.0f} points/s")
+"""
+
+import csv
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from febos.client import FebosClient
+from febos.columnar import columns_from_entry, require_numpy, require_pyarrow
+from febos.data_model import HistoricalDataEntry
+from febos.get_historical_data import (DEFAULT_CHUNK, DEFAULT_MAX_WORKERS,
+                                       GetHistoricalDataEndpoint,
+                                       split_time_range)
+
+LOGGER = logging.getLogger(__name__)
+
+FORMATS = ("csv", "parquet")
+BUFFER_SIZE = 1 << 20
+
+
+@dataclass
+class ExportStats:
+    """Progress of an export, updated after every chunk.
+
+    Attributes:
+        total_chunks: Number of chunk requests covering the range.
+        chunks: Number of chunks written so far.
+        points: Number of data points written so far.
+        elapsed: Seconds since the export started.
+        files: Output file of each input group.
+    """
+
+    total_chunks: int
+    chunks: int = 0
+    points: int = 0
+    elapsed: float = 0.0
+    files: Dict[str, Path] = field(default_factory=dict)
+
+    @property
+    def points_per_second(self) -> float:
+        """Average throughput so far."""
+        return self.points / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _Writer:
+    """Base of the writers, holding the input codes of the file's columns."""
+
+    def __init__(self, entry: HistoricalDataEntry) -> None:
+        self.group_code = entry.groupCode
+        self.codes = [item.code for item in entry.inputArray]
+
+    def column_order(self, entry: HistoricalDataEntry) -> Optional[List[int]]:
+        """Return the indices of the file's columns in an entry's values.
+
+        Returns:
+            None if the entry lists the same codes in the same order as the
+            file, otherwise the position of each file column in `vs`.
+
+        Raises:
+            ValueError: If the entry does not have the file's input codes.
+        """
+        codes = [item.code for item in entry.inputArray]
+        if codes == self.codes:
+            return None
+        if sorted(codes) != sorted(self.codes):
+            raise ValueError(
+                f"Input codes of {self.group_code} changed between chunks: "
+                f"{', '.join(codes)} instead of {', '.join(self.codes)}"
+            )
+        return [codes.index(code) for code in self.codes]
+
+
+class _CsvWriter(_Writer):
+    """Append the raw points of one input group to a CSV file."""
+
+    def __init__(self, path: Path, entry: HistoricalDataEntry) -> None:
+        super().__init__(entry)
+        self._file = open(
+            path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(["ts", *self.codes])
+
+    def write(self, entry: HistoricalDataEntry) -> None:
+        order = self.column_order(entry)
+        if order is None:
+            self._writer.writerows([point.ts, *point.vs] for point in entry.data)
+        else:
+            self._writer.writerows(
+                [point.ts, *(point.vs[i] for i in order)] for point in entry.data
+            )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter(_Writer):
+    """Append the decoded points of one input group to a Parquet file."""
+
+    def __init__(self, path: Path, entry: HistoricalDataEntry) -> None:
+        import pyarrow.parquet as pq
+
+        super().__init__(entry)
+        schema = columns_from_entry(entry).to_arrow().schema
+        self._writer = pq.ParquetWriter(path, schema)
+
+    def write(self, entry: HistoricalDataEntry) -> None:
+        order = self.column_order(entry)
+        if not entry.data:
+            return
+        columns = columns_from_entry(entry)
+        if order is not None:
+            columns = replace(
+                columns, codes=self.codes, values=columns.values[:, order]
+            )
+        self._writer.write_table(columns.to_arrow())
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {"csv": _CsvWriter, "parquet": _ParquetWriter}
+
+
+def file_name(group_code: str, fmt: str) -> str:
+    """Return the name of the output file of an input group.
+
+    Characters other than letters, digits, `@`, `.`, `-` and `_` are
+    replaced by `_`, e.g. `FB-GRAPH-DATA@D9551@T31115.csv`.
+    """
+    name = re.sub(r"[^\w@.-]", "_", group_code)
+    return f"{name}.{fmt}"
+
+
+def export_historical(
+    client: FebosClient,
+    endpoint: GetHistoricalDataEndpoint,
+    output_dir: Union[str, os.PathLike],
+    fmt: str = "csv",
+    chunk: timedelta = DEFAULT_CHUNK,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    progress: Optional[Callable[[ExportStats], Any]] = None,
+) -> ExportStats:
+    """Export the historical data of an endpoint, one file per input group.
+
+    Existing files of the exported groups are overwritten. The columns of
+    a file follow the input codes of the group's first chunk; later chunks
+    listing the same codes in another order are written in the file's
+    order.
+
+    Args:
+        client: FebosClient instance used to perform the requests.
+        endpoint: Input groups and time range to export.
+        output_dir: Directory of the output files, created if missing.
+        fmt: Output format, `csv` or `parquet`. Defaults to `csv`.
+        chunk: Maximum time span covered by a single request.
+        max_workers: Maximum number of requests in flight.
+        progress: Optional callback receiving the stats after each chunk.
+
+    Returns:
+        ExportStats of the finished export.
+
+    Raises:
+        ValueError: If `fmt` is not a supported format, or the input codes
+            of a group change between chunks.
+        ImportError: If `fmt` is `parquet` and pyarrow is not installed.
+        HTTPStatusError: If any HTTP request fails.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {', '.join(FORMATS)}, not {fmt!r}")
+    if fmt == "parquet":
+        require_numpy()
+        require_pyarrow()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    stats = ExportStats(
+        total_chunks=len(split_time_range(endpoint.time_from, endpoint.time_to, chunk))
+    )
+    writers = {}
+    start = time.perf_counter()
+    try:
+        for response in endpoint.iter_chunks(
+            client=client, chunk=chunk, max_workers=max_workers
+        ):
+            for entry in response.root:
+                writer = writers.get(entry.groupCode)
+                if writer is None:
+                    path = output_dir / file_name(entry.groupCode, fmt)
+                    writer = writers[entry.groupCode] = _WRITERS[fmt](path, entry)
+                    stats.files[entry.groupCode] = path
+                writer.write(entry)
+                stats.points += len(entry.data)
+            stats.chunks += 1
+            stats.elapsed = time.perf_counter() - start
+            LOGGER.debug(
+                "Exported chunk %d/%d, %d points",
+                stats.chunks,
+                stats.total_chunks,
+                stats.points,
+            )
+            if progress is not None:
+                progress(stats)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    stats.elapsed = time.perf_counter() - start
+    return stats
@@ -0,0 +1,173 @@
+"""Run an endpoint across many installations or devices concurrently.
+
+Most jobs start from the `installationIdList` of a `LoginPostResponse` or
+from `InstallationEndpoint` and call the same endpoint for every
+installation (or every installation/device pair). `afan_out` and `fan_out`
+build one endpoint per key with a factory, keep up to `limit` requests in
+flight and yield each result as soon as it completes, so a slow
+installation never holds back the others. A failing key does not stop the
+fan-out: its exception is reported in the corresponding `FanOutResult`.
+
+Usage:
+    from febos.fanout import afan_out
+    from febos.page_config import PageConfigEndpoint
+
+    async for result in afan_out(
+        client,
+        lambda installation_id: PageConfigEndpoint(installation_id=installation_id),
+        login.installationIdList,
+        limit=8,
+    ):
+        if result.ok:
+            print(result.key, len(result.value.deviceMap))
+        else:
+            print(result.key, "failed:", result.error)
+"""
+
+import asyncio
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (Any, AsyncIterator, Callable, Dict, Hashable, Iterable,
+                    Iterator, NamedTuple, Optional)
+
+from febos.client import AsyncFebosClient, FebosClient
+from febos.endpoint import FebosEndpoint
+
+DEFAULT_LIMIT = 10
+
+EndpointFactory = Callable[[Any], FebosEndpoint]
+
+
+class FanOutResult(NamedTuple):
+    """Outcome of the call made for one key.
+
+    Attributes:
+        key: Key the endpoint was built from (e.g. an installation id or an
+            `(installation_id, device_id)` tuple).
+        value: Value returned by the endpoint method, None on error.
+        error: Exception raised by the call, None on success.
+    """
+
+    key: Hashable
+    value: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+async def afan_out(
+    client: AsyncFebosClient,
+    factory: EndpointFactory,
+    keys: Iterable[Hashable],
+    method: str = "get",
+    limit: int = DEFAULT_LIMIT,
+    **kwargs: Any,
+) -> AsyncIterator[FanOutResult]:
+    """Call an endpoint for every key, yielding results as they complete.
+
+    Keys are consumed lazily, so `keys` may be a generator. Leaving the
+    loop early cancels the requests still in flight.
+
+    Args:
+        client: AsyncFebosClient instance used to perform the requests.
+        factory: Builds the endpoint for a key.
+        keys: Installation ids, `(installation_id, device_id)` tuples or any
+            other keys understood by `factory`.
+        method: Endpoint method to call, `get` or `post`; its asyncio
+            variant (`aget`/`apost`) is used. Defaults to `get`.
+        limit: Maximum number of requests in flight. Defaults to 10.
+        **kwargs: Additional keyword arguments passed to the method.
+
+    Yields:
+        FanOutResult for each key, in completion order.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    keys = iter(keys)
+    pending: Dict[asyncio.Task, Hashable] = {}
+
+    async def call(key: Hashable) -> Any:
+        endpoint = factory(key)
+        return await getattr(endpoint, f"a{method}")(client=client, **kwargs)
+
+    try:
+        while True:
+            for key in keys:
+                pending[asyncio.ensure_future(call(key))] = key
+                if len(pending) >= limit:
+                    break
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                error = task.exception()
+                if error is None:
+                    yield FanOutResult(key, task.result(), None)
+                elif isinstance(error, Exception):
+                    yield FanOutResult(key, None, error)
+                else:
+                    raise error
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancellations so no task is left pending
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def fan_out(
+    client: FebosClient,
+    factory: EndpointFactory,
+    keys: Iterable[Hashable],
+    method: str = "get",
+    limit: int = DEFAULT_LIMIT,
+    **kwargs: Any,
+) -> Iterator[FanOutResult]:
+    """Call an endpoint for every key on a thread pool, in completion order.
+
+    Synchronous counterpart of `afan_out` for `FebosClient`, which is safe
+    to share between threads.
+
+    Args:
+        client: FebosClient instance used to perform the requests.
+        factory: Builds the endpoint for a key.
+        keys: Installation ids, `(installation_id, device_id)` tuples or any
+            other keys understood by `factory`.
+        method: Endpoint method to call, `get` or `post`. Defaults to `get`.
+        limit: Maximum number of requests in flight. Defaults to 10.
+        **kwargs: Additional keyword arguments passed to the method.
+
+    Yields:
+        FanOutResult for each key, in completion order.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    keys = iter(keys)
+    pending: Dict[Future, Hashable] = {}
+
+    def call(key: Hashable) -> Any:
+        return getattr(factory(key), method)(client=client, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=limit) as executor:
+        try:
+            while True:
+                for key in keys:
+                    pending[executor.submit(call, key)] = key
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield FanOutResult(key, future.result(), None)
+                    else:
+                        yield FanOutResult(key, None, error)
+        finally:
+            for future in pending:
+                future.cancel()
@@ -1,10 +1,14 @@
 """Endpoint model for retrieving data analysis rows for a device."""
 
-from typing import ClassVar, Optional
+from typing import AsyncIterator, ClassVar, Dict, Iterator, List, Optional
 
-from febos.client import FebosClient
-from febos.data_model import GetDataAnalysisGetResponse
+from febos.client import AsyncFebosClient, FebosClient
+from febos.columnar import DataAnalysisColumns, decode_data_analysis
+from febos.compact import DataAnalysisRow, parse_data_analysis
+from febos.data_model import DataAnalysisEntry, GetDataAnalysisGetResponse
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
+from febos.streaming import DataAnalysisEntryDecoder
 
 
 class GetDataAnalysisEndpoint(FebosEndpoint):
@@ -37,11 +41,116 @@ class GetDataAnalysisEndpoint(FebosEndpoint):
         Returns:
             GetDataAnalysisGetResponse: list-like root model with entries.
         """
+        response = super().get(client=client, params=self._params())
+        return parse_response(
+            GetDataAnalysisGetResponse, response.content, client.trusted
+        )
+
+    async def aget(self, client: AsyncFebosClient) -> GetDataAnalysisGetResponse:
+        """Asynchronously get data analysis rows for the configured time range.
+
+        Returns:
+            GetDataAnalysisGetResponse: list-like root model with entries.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return parse_response(
+            GetDataAnalysisGetResponse, response.content, client.trusted
+        )
+
+    def get_columnar(self, client: FebosClient) -> DataAnalysisColumns:
+        """Get data analysis rows decoded into NumPy columns.
+
+        The response body is decoded straight into one column per input
+        code without building per-row models. Requires the optional `numpy`
+        dependency; see `DataAnalysisColumns.to_arrow()`/`to_parquet()` for
+        export.
+
+        Returns:
+            DataAnalysisColumns over the union of the rows' input codes.
+        """
+        response = super().get(client=client, params=self._params())
+        return decode_data_analysis(response.content)
+
+    async def aget_columnar(self, client: AsyncFebosClient) -> DataAnalysisColumns:
+        """Asynchronously get data analysis rows decoded into NumPy columns.
+
+        Returns:
+            DataAnalysisColumns over the union of the rows' input codes.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return decode_data_analysis(response.content)
+
+    def get_compact(self, client: FebosClient) -> List[DataAnalysisRow]:
+        """Get data analysis rows as compact named tuples.
+
+        Returns:
+            One DataAnalysisRow per row, values keyed by input code.
+        """
+        response = super().get(client=client, params=self._params())
+        return parse_data_analysis(response.content)
+
+    async def aget_compact(self, client: AsyncFebosClient) -> List[DataAnalysisRow]:
+        """Asynchronously get data analysis rows as compact named tuples.
+
+        Returns:
+            One DataAnalysisRow per row, values keyed by input code.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return parse_data_analysis(response.content)
+
+    def stream(self, client: FebosClient) -> Iterator[DataAnalysisEntry]:
+        """Stream data analysis rows as the response body arrives.
+
+        Rows are parsed one at a time while the body is downloaded, so long
+        ranges are processed in constant memory.
+
+        Args:
+            client: FebosClient instance used to perform the request.
+
+        Yields:
+            DataAnalysisEntry for each row, in response order.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            ValueError: If the body is not a valid JSON array of rows.
+        """
+        decoder = DataAnalysisEntryDecoder()
+        with self._stream(
+            client=client, method="GET", params=self._params()
+        ) as response:
+            for chunk in response.iter_bytes():
+                yield from decoder.feed(chunk)
+        decoder.close()
+
+    async def astream(
+        self, client: AsyncFebosClient
+    ) -> AsyncIterator[DataAnalysisEntry]:
+        """Asynchronously stream data analysis rows as the response body arrives.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the request.
+
+        Yields:
+            DataAnalysisEntry for each row, in response order.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            ValueError: If the body is not a valid JSON array of rows.
+        """
+        decoder = DataAnalysisEntryDecoder()
+        async with self._astream(
+            client=client, method="GET", params=self._params()
+        ) as response:
+            async for chunk in response.aiter_bytes():
+                for entry in decoder.feed(chunk):
+                    yield entry
+        decoder.close()
+
+    def _params(self) -> Dict[str, str]:
+        """Build the `from`/`to` query parameters for the configured range."""
         params = {}
         if self.from_ts is not None:
             params["from"] = self.from_ts
         if self.to_ts is not None:
             params["to"] = self.to_ts
-
-        response = super().get(client=client, params=params)
-        return GetDataAnalysisGetResponse.model_validate(response.json())
+        return params
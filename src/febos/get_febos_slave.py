@@ -2,9 +2,10 @@
 
 from typing import ClassVar
 
-from febos.client import FebosClient
+from febos.client import AsyncFebosClient, FebosClient
 from febos.data_model import GetFebosSlaveGetResponse
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
 
 
 class GetFebosSlaveEndpoint(FebosEndpoint):
@@ -43,4 +44,20 @@ class GetFebosSlaveEndpoint(FebosEndpoint):
             HTTPStatusError: If HTTP request fails.
         """
         response = super().get(client=client)
-        return GetFebosSlaveGetResponse.model_validate(response.json())
+        return parse_response(
+            GetFebosSlaveGetResponse, response.content, client.trusted
+        )
+
+    async def aget(self, client: AsyncFebosClient) -> GetFebosSlaveGetResponse:
+        """Asynchronously get Febos slave device data.
+
+        Returns:
+            GetFebosSlaveGetResponse containing slave device information.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        response = await super().aget(client=client)
+        return parse_response(
+            GetFebosSlaveGetResponse, response.content, client.trusted
+        )
@@ -19,13 +19,130 @@ Usage:
         print(f"Device: {entry.deviceId}, Thing: {entry.thingId}")
         for point in entry.data:
             print(f"  {point.ts}: {point.vs}")
+
+    # Long ranges: fetch one day per request, four requests at a time
+    response = endpoint.get_chunked(client=client, chunk=timedelta(days=1))
 """
 
-from typing import ClassVar
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import (AsyncIterator, ClassVar, Dict, Iterable, Iterator, List,
+                    Tuple)
 
-from febos.client import FebosClient
-from febos.data_model import HistoricalDataGetResponse
+from febos.client import AsyncFebosClient, FebosClient
+from febos.columnar import HistoricalDataColumns, decode_historical_data
+from febos.compact import HistoricalBlock, parse_historical
+from febos.data_model import (HistoricalDataEntry, HistoricalDataGetResponse,
+                              HistoricalDataPoint)
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
+from febos.streaming import DEFAULT_BATCH_SIZE, HistoricalEntryDecoder
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DEFAULT_CHUNK = timedelta(days=1)
+DEFAULT_MAX_WORKERS = 4
+
+EntryKey = Tuple[int, int, str]
+
+
+def split_time_range(
+    time_from: str, time_to: str, chunk: timedelta = DEFAULT_CHUNK
+) -> List[Tuple[str, str]]:
+    """Split a time range into consecutive chunks.
+
+    Consecutive chunks share their boundary timestamp so no sample is lost
+    if the server treats both ends as inclusive; the resulting duplicates
+    are removed when the chunks are merged.
+
+    Args:
+        time_from: Start time string "YYYY-MM-DD HH:MM:SS".
+        time_to: End time string "YYYY-MM-DD HH:MM:SS".
+        chunk: Maximum length of each chunk.
+
+    Returns:
+        List of `(time_from, time_to)` string pairs in chronological order.
+
+    Raises:
+        ValueError: If `chunk` is not positive or the range is reversed.
+    """
+    if chunk <= timedelta(0):
+        raise ValueError("chunk must be a positive timedelta")
+    start = datetime.strptime(time_from, TIME_FORMAT)
+    end = datetime.strptime(time_to, TIME_FORMAT)
+    if end < start:
+        raise ValueError("time_to must not be earlier than time_from")
+
+    ranges = []
+    while True:
+        stop = min(start + chunk, end)
+        ranges.append((start.strftime(TIME_FORMAT), stop.strftime(TIME_FORMAT)))
+        if stop >= end:
+            return ranges
+        start = stop
+
+
+def merge_historical_data(
+    responses: Iterable[HistoricalDataGetResponse],
+) -> HistoricalDataGetResponse:
+    """Merge historical data responses for adjacent time ranges.
+
+    Entries are matched on `(deviceId, thingId, groupCode)`. Their data
+    points are concatenated, sorted by timestamp and de-duplicated, keeping
+    the first point seen for a given timestamp.
+
+    Args:
+        responses: Responses to merge, typically one per chunk.
+
+    Returns:
+        HistoricalDataGetResponse with one entry per input group.
+    """
+    entries: Dict[EntryKey, HistoricalDataEntry] = {}
+    points: Dict[EntryKey, Dict[str, HistoricalDataPoint]] = {}
+    for response in responses:
+        for entry in response.root:
+            key = (entry.deviceId, entry.thingId, entry.groupCode)
+            if key not in entries:
+                entries[key] = entry
+                points[key] = {}
+            merged = points[key]
+            for point in entry.data:
+                merged.setdefault(point.ts, point)
+
+    return HistoricalDataGetResponse(
+        [
+            entry.model_copy(
+                update={"data": [points[key][ts] for ts in sorted(points[key])]}
+            )
+            for key, entry in entries.items()
+        ]
+    )
+
+
+def _trim_chunk(
+    response: HistoricalDataGetResponse, last_ts: Dict[EntryKey, str]
+) -> HistoricalDataGetResponse:
+    """Sort a chunk and drop points already returned by the previous chunks.
+
+    Args:
+        response: Response for a single chunk.
+        last_ts: Latest timestamp yielded so far per entry, updated in place.
+
+    Returns:
+        HistoricalDataGetResponse holding only points newer than `last_ts`.
+    """
+    entries = []
+    for entry in response.root:
+        key = (entry.deviceId, entry.thingId, entry.groupCode)
+        previous = last_ts.get(key)
+        data = sorted(entry.data, key=lambda point: point.ts)
+        if previous is not None:
+            data = [point for point in data if point.ts > previous]
+        if data:
+            last_ts[key] = data[-1].ts
+        entries.append(entry.model_copy(update={"data": data}))
+    return HistoricalDataGetResponse(entries)
 
 
 class GetHistoricalDataEndpoint(FebosEndpoint):
@@ -62,10 +179,254 @@ class GetHistoricalDataEndpoint(FebosEndpoint):
         Returns:
             HistoricalDataGetResponse: list-like root model with entries.
         """
-        params = {
+        response = super().get(client=client, params=self._params())
+        return parse_response(
+            HistoricalDataGetResponse, response.content, client.trusted
+        )
+
+    async def aget(self, client: AsyncFebosClient) -> HistoricalDataGetResponse:
+        """Asynchronously get historical data for the configured time range.
+
+        Returns:
+            HistoricalDataGetResponse: list-like root model with entries.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return parse_response(
+            HistoricalDataGetResponse, response.content, client.trusted
+        )
+
+    def get_compact(self, client: FebosClient) -> List[HistoricalBlock]:
+        """Get historical data as compact named tuples.
+
+        Uses about a third of the memory of `get()`; see `febos.compact`.
+
+        Returns:
+            One HistoricalBlock per input group.
+        """
+        response = super().get(client=client, params=self._params())
+        return parse_historical(response.content)
+
+    async def aget_compact(self, client: AsyncFebosClient) -> List[HistoricalBlock]:
+        """Asynchronously get historical data as compact named tuples.
+
+        Returns:
+            One HistoricalBlock per input group.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return parse_historical(response.content)
+
+    def stream(
+        self, client: FebosClient, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[HistoricalDataEntry]:
+        """Stream historical data as the response body arrives.
+
+        Points are parsed one at a time while the body is downloaded and
+        returned in batches, so a year-long range is processed in constant
+        memory. An input group with more than `batch_size` points is
+        returned as several consecutive entries with the same `deviceId`,
+        `thingId` and `groupCode`.
+
+        Args:
+            client: FebosClient instance used to perform the request.
+            batch_size: Maximum number of points per yielded entry.
+
+        Yields:
+            HistoricalDataEntry holding the next batch of points of a group.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            ValueError: If the body is not valid historical data.
+        """
+        decoder = HistoricalEntryDecoder(batch_size)
+        with self._stream(
+            client=client, method="GET", params=self._params()
+        ) as response:
+            for chunk in response.iter_bytes():
+                yield from decoder.feed(chunk)
+        decoder.close()
+
+    async def astream(
+        self, client: AsyncFebosClient, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[HistoricalDataEntry]:
+        """Asynchronously stream historical data as the response body arrives.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the request.
+            batch_size: Maximum number of points per yielded entry.
+
+        Yields:
+            HistoricalDataEntry holding the next batch of points of a group.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            ValueError: If the body is not valid historical data.
+        """
+        decoder = HistoricalEntryDecoder(batch_size)
+        async with self._astream(
+            client=client, method="GET", params=self._params()
+        ) as response:
+            async for chunk in response.aiter_bytes():
+                for entry in decoder.feed(chunk):
+                    yield entry
+        decoder.close()
+
+    def get_columnar(self, client: FebosClient) -> List[HistoricalDataColumns]:
+        """Get historical data decoded into NumPy columns.
+
+        The response body is decoded straight into arrays without building
+        per-point models. Requires the optional `numpy` dependency.
+
+        Returns:
+            One HistoricalDataColumns per entry of the response.
+        """
+        response = super().get(client=client, params=self._params())
+        return decode_historical_data(response.content)
+
+    async def aget_columnar(
+        self, client: AsyncFebosClient
+    ) -> List[HistoricalDataColumns]:
+        """Asynchronously get historical data decoded into NumPy columns.
+
+        Returns:
+            One HistoricalDataColumns per entry of the response.
+        """
+        response = await super().aget(client=client, params=self._params())
+        return decode_historical_data(response.content)
+
+    def iter_chunks(
+        self,
+        client: FebosClient,
+        chunk: timedelta = DEFAULT_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Iterator[HistoricalDataGetResponse]:
+        """Fetch the configured range in chunks, yielding them in order.
+
+        Up to `max_workers` chunks are requested at the same time on a
+        thread pool. Chunks are yielded in chronological order with points
+        already yielded for a previous chunk removed, so only a bounded
+        number of chunk responses is held in memory at any time.
+
+        Args:
+            client: FebosClient instance used to perform the requests.
+            chunk: Maximum time span covered by a single request.
+            max_workers: Maximum number of requests in flight.
+
+        Yields:
+            HistoricalDataGetResponse for each chunk.
+
+        Raises:
+            HTTPStatusError: If any HTTP request fails.
+        """
+        endpoints = self._chunk_endpoints(chunk)
+        last_ts: Dict[EntryKey, str] = {}
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for endpoint in endpoints:
+                    pending.append(executor.submit(endpoint.get, client=client))
+                    if len(pending) >= max_workers:
+                        yield _trim_chunk(pending.popleft().result(), last_ts)
+                while pending:
+                    yield _trim_chunk(pending.popleft().result(), last_ts)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def get_chunked(
+        self,
+        client: FebosClient,
+        chunk: timedelta = DEFAULT_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> HistoricalDataGetResponse:
+        """Get historical data for a long time range using parallel chunks.
+
+        Args:
+            client: FebosClient instance used to perform the requests.
+            chunk: Maximum time span covered by a single request.
+            max_workers: Maximum number of requests in flight.
+
+        Returns:
+            HistoricalDataGetResponse: merged entries ordered by timestamp.
+        """
+        return merge_historical_data(
+            self.iter_chunks(client=client, chunk=chunk, max_workers=max_workers)
+        )
+
+    async def aiter_chunks(
+        self,
+        client: AsyncFebosClient,
+        chunk: timedelta = DEFAULT_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> AsyncIterator[HistoricalDataGetResponse]:
+        """Asynchronously fetch the configured range in chunks, in order.
+
+        Asyncio equivalent of `iter_chunks()`: up to `max_workers` chunk
+        requests run as concurrent tasks.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the requests.
+            chunk: Maximum time span covered by a single request.
+            max_workers: Maximum number of requests in flight.
+
+        Yields:
+            HistoricalDataGetResponse for each chunk.
+
+        Raises:
+            HTTPStatusError: If any HTTP request fails.
+        """
+        endpoints = self._chunk_endpoints(chunk)
+        last_ts: Dict[EntryKey, str] = {}
+        pending = deque()
+        try:
+            for endpoint in endpoints:
+                pending.append(asyncio.ensure_future(endpoint.aget(client=client)))
+                if len(pending) >= max_workers:
+                    yield _trim_chunk(await pending.popleft(), last_ts)
+            while pending:
+                yield _trim_chunk(await pending.popleft(), last_ts)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aget_chunked(
+        self,
+        client: AsyncFebosClient,
+        chunk: timedelta = DEFAULT_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> HistoricalDataGetResponse:
+        """Asynchronously get historical data for a long time range in chunks.
+
+        Args:
+            client: AsyncFebosClient instance used to perform the requests.
+            chunk: Maximum time span covered by a single request.
+            max_workers: Maximum number of requests in flight.
+
+        Returns:
+            HistoricalDataGetResponse: merged entries ordered by timestamp.
+        """
+        return merge_historical_data(
+            [
+                response
+                async for response in self.aiter_chunks(
+                    client=client, chunk=chunk, max_workers=max_workers
+                )
+            ]
+        )
+
+    def _chunk_endpoints(self, chunk: timedelta) -> List["GetHistoricalDataEndpoint"]:
+        """Build one endpoint per chunk of the configured time range."""
+        return [
+            self.model_copy(update={"time_from": time_from, "time_to": time_to})
+            for time_from, time_to in split_time_range(
+                self.time_from, self.time_to, chunk
+            )
+        ]
+
+    def _params(self) -> Dict[str, str]:
+        """Build the query parameters for the configured groups and range."""
+        return {
             "input_group_list": self.input_group_list,
             "time_from": self.time_from,
             "time_to": self.time_to,
         }
-        response = super().get(client=client, params=params)
-        return HistoricalDataGetResponse.model_validate(response.json())
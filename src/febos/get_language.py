@@ -2,9 +2,10 @@
 
 from typing import ClassVar
 
-from febos.client import FebosClient
+from febos.client import AsyncFebosClient, FebosClient
 from febos.data_model import GetLanguageGetResponse
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
 
 
 class GetLanguageEndpoint(FebosEndpoint):
@@ -34,4 +35,13 @@ class GetLanguageEndpoint(FebosEndpoint):
             GetLanguageGetResponse with `ts` and `ID_language` fields.
         """
         response = super().get(client=client)
-        return GetLanguageGetResponse.model_validate(response.json())
+        return parse_response(GetLanguageGetResponse, response.content, client.trusted)
+
+    async def aget(self, client: AsyncFebosClient) -> GetLanguageGetResponse:
+        """Asynchronously get language information for the device.
+
+        Returns:
+            GetLanguageGetResponse with `ts` and `ID_language` fields.
+        """
+        response = await super().aget(client=client)
+        return parse_response(GetLanguageGetResponse, response.content, client.trusted)
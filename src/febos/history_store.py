@@ -0,0 +1,412 @@
+"""Local SQLite store of historical data with incremental sync.
+
+Dashboards and reports ask `GetHistoricalDataEndpoint` for the same windows
+over and over. `HistoryStore` keeps every `HistoricalDataPoint` it has seen
+in a SQLite database, together with the time ranges already synced for each
+installation and input group. A query only requests the parts of the window
+missing locally (typically the tail since the last sync, or a gap left by an
+earlier query) and serves the rest from disk, so a repeated query costs no
+request at all.
+
+Ranges ending in the recent past are only recorded as synced up to the last
+point returned by the server (or up to `settle` ago), since points may still
+be arriving for them.
+
+Usage:
+    from febos.get_historical_data import GetHistoricalDataEndpoint
+    from febos.history_store import HistoryStore
+
+    store = HistoryStore("~/.cache/febos/history.sqlite")
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-01 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    response = store.get(client=client, endpoint=endpoint)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from febos.client import AsyncFebosClient, FebosClient
+from febos.data_model import (HistoricalDataEntry, HistoricalDataGetResponse,
+                              HistoricalDataPoint, InputCode)
+from febos.get_historical_data import TIME_FORMAT, GetHistoricalDataEndpoint
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PATH = "~/.cache/febos/history.sqlite"
+DEFAULT_SETTLE = timedelta(hours=1)
+
+Range = Tuple[str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS groups (
+    installation_id INTEGER NOT NULL,
+    group_code TEXT NOT NULL,
+    device_id INTEGER NOT NULL,
+    thing_id INTEGER NOT NULL,
+    inputs TEXT NOT NULL,
+    PRIMARY KEY (installation_id, group_code)
+);
+CREATE TABLE IF NOT EXISTS points (
+    installation_id INTEGER NOT NULL,
+    group_code TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    raw_ts TEXT NOT NULL,
+    vs TEXT NOT NULL,
+    PRIMARY KEY (installation_id, group_code, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS synced (
+    installation_id INTEGER NOT NULL,
+    group_code TEXT NOT NULL,
+    time_from TEXT NOT NULL,
+    time_to TEXT NOT NULL,
+    PRIMARY KEY (installation_id, group_code, time_from)
+);
+"""
+
+
+def _sort_key(ts: str) -> str:
+    """Normalize a point timestamp to `TIME_FORMAT` for range comparisons.
+
+    The server returns `2026-02-11T01:03:18` while queries use
+    `2026-02-11 01:03:18`; both sort the same once normalized.
+    """
+    return ts.replace("T", " ", 1)[:19]
+
+
+def merge_ranges(ranges: Iterable[Range]) -> List[Range]:
+    """Merge overlapping or touching time ranges.
+
+    Args:
+        ranges: `(time_from, time_to)` pairs in `TIME_FORMAT`.
+
+    Returns:
+        Disjoint ranges sorted by start time.
+    """
+    merged: List[Range] = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def missing_ranges(
+    synced: Iterable[Range], time_from: str, time_to: str
+) -> List[Range]:
+    """Return the parts of a time range not covered by synced ranges.
+
+    Missing ranges share their boundary timestamps with the synced ones,
+    so no point on a boundary is lost.
+
+    Args:
+        synced: Ranges already synced, in `TIME_FORMAT`.
+        time_from: Start of the requested range.
+        time_to: End of the requested range.
+
+    Returns:
+        `(time_from, time_to)` pairs to fetch, in chronological order.
+    """
+    gaps = []
+    cursor = time_from
+    for start, stop in merge_ranges(synced):
+        if stop < cursor:
+            continue
+        if start > time_to:
+            break
+        if start > cursor:
+            gaps.append((cursor, start))
+        cursor = max(cursor, stop)
+    if cursor < time_to:
+        gaps.append((cursor, time_to))
+    return gaps
+
+
+class HistoryStore:
+    """SQLite-backed store of historical data points.
+
+    Points are keyed by installation id, group code and timestamp, so
+    fetching an overlapping range again never duplicates them. The store
+    can be shared by the threads of a process; separate processes may open
+    the same file, which uses SQLite's write-ahead log.
+
+    Attributes:
+        path: Path of the SQLite database.
+        settle: How long ago a point must be to consider its range final.
+            Ranges ending later are only marked as synced up to the last
+            point received, so the next query fetches the tail again.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike] = DEFAULT_PATH,
+        settle: timedelta = DEFAULT_SETTLE,
+    ) -> None:
+        """Initialize HistoryStore.
+
+        Args:
+            path: Path of the SQLite database, created if missing, or
+                `":memory:"`. Defaults to `~/.cache/febos/history.sqlite`.
+            settle: Age after which points are assumed to be final.
+                Defaults to one hour.
+        """
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.settle = settle
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def get(
+        self, client: FebosClient, endpoint: GetHistoricalDataEndpoint
+    ) -> HistoricalDataGetResponse:
+        """Get historical data, fetching only what is missing locally.
+
+        Args:
+            client: FebosClient instance used for the missing ranges.
+            endpoint: Endpoint describing the installation, input groups
+                and time range to return.
+
+        Returns:
+            HistoricalDataGetResponse with one entry per known input group,
+            points sorted by timestamp.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        for request in self._missing(endpoint):
+            self._store(request, request.get(client=client))
+        return self.query(endpoint)
+
+    async def aget(
+        self, client: AsyncFebosClient, endpoint: GetHistoricalDataEndpoint
+    ) -> HistoricalDataGetResponse:
+        """Asynchronously get historical data, fetching only what is missing.
+
+        Missing ranges are requested concurrently.
+
+        Args:
+            client: AsyncFebosClient instance used for the missing ranges.
+            endpoint: Endpoint describing the installation, input groups
+                and time range to return.
+
+        Returns:
+            HistoricalDataGetResponse with one entry per known input group,
+            points sorted by timestamp.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        requests = self._missing(endpoint)
+        responses = await asyncio.gather(
+            *(request.aget(client=client) for request in requests)
+        )
+        for request, response in zip(requests, responses):
+            self._store(request, response)
+        return self.query(endpoint)
+
+    def query(self, endpoint: GetHistoricalDataEndpoint) -> HistoricalDataGetResponse:
+        """Return the stored data for an endpoint without going to the network.
+
+        Args:
+            endpoint: Endpoint describing the installation, input groups
+                and time range to return.
+
+        Returns:
+            HistoricalDataGetResponse with one entry per input group seen
+            before, points sorted by timestamp.
+        """
+        entries = []
+        with self._lock:
+            for group_code in _group_codes(endpoint):
+                group = self._db.execute(
+                    "SELECT device_id, thing_id, inputs FROM groups"
+                    " WHERE installation_id = ? AND group_code = ?",
+                    (endpoint.installation_id, group_code),
+                ).fetchone()
+                if group is None:
+                    continue
+                rows = self._db.execute(
+                    "SELECT raw_ts, vs FROM points"
+                    " WHERE installation_id = ? AND group_code = ?"
+                    " AND ts >= ? AND ts <= ? ORDER BY ts",
+                    (
+                        endpoint.installation_id,
+                        group_code,
+                        endpoint.time_from,
+                        endpoint.time_to,
+                    ),
+                )
+                entries.append(
+                    HistoricalDataEntry(
+                        deviceId=group[0],
+                        thingId=group[1],
+                        groupCode=group_code,
+                        inputArray=[
+                            InputCode(code=code) for code in json.loads(group[2])
+                        ],
+                        data=[
+                            HistoricalDataPoint(ts=ts, vs=json.loads(vs))
+                            for ts, vs in rows
+                        ],
+                    )
+                )
+        return HistoricalDataGetResponse(entries)
+
+    def last_synced(self, installation_id: int, group_code: str) -> Optional[str]:
+        """Return the end of the latest range synced for an input group.
+
+        Args:
+            installation_id: ID of the installation.
+            group_code: Input group code.
+
+        Returns:
+            Timestamp in `TIME_FORMAT`, or None if nothing was synced.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MAX(time_to) FROM synced"
+                " WHERE installation_id = ? AND group_code = ?",
+                (installation_id, group_code),
+            ).fetchone()
+        return row[0]
+
+    def _synced(self, installation_id: int, group_code: str) -> List[Range]:
+        """Return the ranges synced for an input group."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT time_from, time_to FROM synced"
+                " WHERE installation_id = ? AND group_code = ?",
+                (installation_id, group_code),
+            ).fetchall()
+
+    def _missing(
+        self, endpoint: GetHistoricalDataEndpoint
+    ) -> List[GetHistoricalDataEndpoint]:
+        """Build the requests fetching the ranges missing for an endpoint.
+
+        Input groups missing the same ranges share their requests.
+        """
+        gaps: Dict[Tuple[Range, ...], List[str]] = {}
+        for group_code in _group_codes(endpoint):
+            missing = missing_ranges(
+                self._synced(endpoint.installation_id, group_code),
+                endpoint.time_from,
+                endpoint.time_to,
+            )
+            if missing:
+                gaps.setdefault(tuple(missing), []).append(group_code)
+
+        requests = []
+        for missing, group_codes in gaps.items():
+            for time_from, time_to in missing:
+                requests.append(
+                    endpoint.model_copy(
+                        update={
+                            "input_group_list": ",".join(group_codes),
+                            "time_from": time_from,
+                            "time_to": time_to,
+                        }
+                    )
+                )
+        LOGGER.debug(
+            "Fetching %d missing range(s) for installation %s",
+            len(requests),
+            endpoint.installation_id,
+        )
+        return requests
+
+    def _store(
+        self,
+        request: GetHistoricalDataEndpoint,
+        response: HistoricalDataGetResponse,
+    ) -> None:
+        """Save the points of a response and mark its range as synced."""
+        installation_id = request.installation_id
+        settled = (datetime.now() - self.settle).strftime(TIME_FORMAT)
+        last_ts: Dict[str, str] = {}
+        with self._lock, self._db:
+            for entry in response.root:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO groups VALUES (?, ?, ?, ?, ?)",
+                    (
+                        installation_id,
+                        entry.groupCode,
+                        entry.deviceId,
+                        entry.thingId,
+                        json.dumps([code.code for code in entry.inputArray]),
+                    ),
+                )
+                rows = [
+                    (
+                        installation_id,
+                        entry.groupCode,
+                        _sort_key(point.ts),
+                        point.ts,
+                        json.dumps(point.vs),
+                    )
+                    for point in entry.data
+                ]
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?)", rows
+                )
+                if rows:
+                    last_ts[entry.groupCode] = max(row[2] for row in rows)
+
+            for group_code in _group_codes(request):
+                synced_to = request.time_to
+                if synced_to > settled:
+                    synced_to = min(
+                        synced_to, max(settled, last_ts.get(group_code, ""))
+                    )
+                if synced_to < request.time_from:
+                    continue
+                self._mark_synced(
+                    installation_id, group_code, (request.time_from, synced_to)
+                )
+
+    def _mark_synced(
+        self, installation_id: int, group_code: str, synced: Range
+    ) -> None:
+        """Add a range to the synced ranges of a group, merging neighbours."""
+        ranges = self._db.execute(
+            "SELECT time_from, time_to FROM synced"
+            " WHERE installation_id = ? AND group_code = ?",
+            (installation_id, group_code),
+        ).fetchall()
+        self._db.execute(
+            "DELETE FROM synced WHERE installation_id = ? AND group_code = ?",
+            (installation_id, group_code),
+        )
+        self._db.executemany(
+            "INSERT INTO synced VALUES (?, ?, ?, ?)",
+            [
+                (installation_id, group_code, start, stop)
+                for start, stop in merge_ranges(ranges + [synced])
+            ],
+        )
+
+
+def _group_codes(endpoint: GetHistoricalDataEndpoint) -> List[str]:
+    """Split the comma-separated input group list of an endpoint."""
+    return [code for code in endpoint.input_group_list.split(",") if code]
@@ -2,9 +2,10 @@
 
 from typing import ClassVar
 
-from febos.client import FebosClient
+from febos.client import AsyncFebosClient, FebosClient
 from febos.data_model import InstallationGetResponse
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
 
 
 class InstallationEndpoint(FebosEndpoint):
@@ -36,4 +37,16 @@ class InstallationEndpoint(FebosEndpoint):
             HTTPStatusError: If HTTP request fails.
         """
         response = super().get(client=client, params=self.model_dump())
-        return InstallationGetResponse.model_validate(response.json())
+        return parse_response(InstallationGetResponse, response.content, client.trusted)
+
+    async def aget(self, client: AsyncFebosClient) -> InstallationGetResponse:
+        """Asynchronously get list of installations.
+
+        Returns:
+            InstallationGetResponse containing list of installations.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        response = await super().aget(client=client, params=self.model_dump())
+        return parse_response(InstallationGetResponse, response.content, client.trusted)
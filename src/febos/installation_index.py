@@ -0,0 +1,175 @@
+"""Indexed lookups over an installation's page configuration.
+
+`PageConfigGetResponse` is a tree: pages hold tabs, tabs hold widgets,
+widgets hold input groups and input groups hold inputs. `InstallationIndex`
+walks that tree once and exposes dictionaries from input code, input group
+code, device id and thing id to the corresponding objects, so resolving the
+metadata of a sample is a constant-time lookup. Input and input group codes
+repeat across devices, so they are keyed by `(deviceId, code)`.
+
+Usage:
+    from febos.installation_index import InstallationIndex
+
+    index = InstallationIndex(PageConfigEndpoint(installation_id=101).get(client))
+    resolved = index.resolve("R8765")
+    print(resolved.device.name, resolved.input.label, resolved.meta.measUnit)
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from febos.data_model import (Device, Input, InputGroup, PageConfigGetResponse,
+                              Thing, Widget)
+
+
+class InputMeta(NamedTuple):
+    """Metadata needed to turn raw values of an input into engineering units.
+
+    Attributes:
+        scale: Number of implied decimal digits of raw values, if any.
+        measUnit: Measurement unit (e.g. `°C`), if any.
+        nullValue: Raw value the device uses to signal "no data", if any.
+    """
+
+    scale: Optional[int]
+    measUnit: Optional[str]
+    nullValue: Optional[str]
+
+
+class ResolvedInput(NamedTuple):
+    """An input together with everything it belongs to.
+
+    Attributes:
+        input: The input itself.
+        group: Input group listing the input.
+        widget: Widget displaying the input group.
+        device: Device the input belongs to, if listed in the device map.
+        thing: Thing the input belongs to, if listed in the thing map.
+        meta: Precomputed scale, unit and null value of the input.
+    """
+
+    input: Input
+    group: InputGroup
+    widget: Widget
+    device: Optional[Device]
+    thing: Optional[Thing]
+    meta: InputMeta
+
+
+Location = Tuple[InputGroup, Widget, InputMeta]
+
+
+class InstallationIndex:
+    """Constant-time lookups over a `PageConfigGetResponse`.
+
+    The same input may be shown by several widgets; the first occurrence in
+    page, tab and widget order is indexed. Input and input group codes are
+    shared by devices of the same model, so groups, inputs and metadata are
+    keyed by `(deviceId, code)`; only `inputs` (and the lookups called
+    without a device id) keep the first device seen for a code.
+
+    Attributes:
+        page_config: The indexed page configuration.
+        devices: Devices by id.
+        things: Things by id.
+        input_groups: Input groups by `(deviceId, inputGroupCode)`.
+        inputs: Inputs by code, for the first device seen.
+        device_inputs: Inputs by `(deviceId, code)`.
+        meta: Precomputed `InputMeta` by `(deviceId, code)`.
+    """
+
+    def __init__(self, page_config: PageConfigGetResponse) -> None:
+        """Build the index.
+
+        Args:
+            page_config: Page configuration of the installation.
+        """
+        self.page_config = page_config
+        self.devices: Dict[int, Device] = {
+            device.id: device for device in page_config.deviceMap.values()
+        }
+        self.things: Dict[int, Thing] = {
+            thing.id: thing for thing in page_config.thingMap.values()
+        }
+        self.input_groups: Dict[Tuple[int, str], InputGroup] = {}
+        self.inputs: Dict[str, Input] = {}
+        self.device_inputs: Dict[Tuple[int, str], Input] = {}
+        self.meta: Dict[Tuple[int, str], InputMeta] = {}
+        self._locations: Dict[Tuple[int, str], Location] = {}
+
+        for page in page_config.pageMap.values():
+            for tab in page.tabList:
+                for widget in tab.widgetList:
+                    for group in widget.widgetInputGroupList:
+                        self.input_groups.setdefault(
+                            (group.deviceId, group.inputGroupCode), group
+                        )
+                        for item in group.inputList:
+                            key = (item.deviceId, item.code)
+                            if key in self.device_inputs:
+                                continue
+                            meta = InputMeta(item.scale, item.measUnit, item.nullValue)
+                            self.device_inputs[key] = item
+                            self.meta[key] = meta
+                            self._locations[key] = (group, widget, meta)
+                            self.inputs.setdefault(item.code, item)
+
+    def input_group(self, code: str, device_id: int) -> InputGroup:
+        """Return the input group with the given code on a device.
+
+        Args:
+            code: Input group code, e.g. `F_GENERAL`.
+            device_id: Device the group belongs to.
+
+        Raises:
+            KeyError: If the group is not part of the configuration.
+        """
+        return self.input_groups[(device_id, code)]
+
+    def input(self, code: str, device_id: Optional[int] = None) -> Input:
+        """Return the input with the given code.
+
+        Args:
+            code: Input code, e.g. `R8765`.
+            device_id: Optional device id to pick among devices sharing codes.
+
+        Raises:
+            KeyError: If the input is not part of the configuration.
+        """
+        if device_id is None:
+            return self.inputs[code]
+        return self.device_inputs[(device_id, code)]
+
+    def input_meta(self, code: str, device_id: Optional[int] = None) -> InputMeta:
+        """Return the scale, unit and null value of an input.
+
+        Args:
+            code: Input code, e.g. `R8765`.
+            device_id: Optional device id to pick among devices sharing codes.
+
+        Raises:
+            KeyError: If the input is not part of the configuration.
+        """
+        if device_id is None:
+            device_id = self.inputs[code].deviceId
+        return self.meta[(device_id, code)]
+
+    def resolve(self, code: str, device_id: Optional[int] = None) -> ResolvedInput:
+        """Return an input together with its group, widget, device and thing.
+
+        Args:
+            code: Input code, e.g. `R8765`.
+            device_id: Optional device id to pick among devices sharing codes.
+
+        Raises:
+            KeyError: If the input is not part of the configuration.
+        """
+        item = self.input(code, device_id)
+        group, widget, meta = self._locations[(item.deviceId, item.code)]
+        return ResolvedInput(
+            input=item,
+            group=group,
+            widget=widget,
+            device=self.devices.get(item.deviceId),
+            thing=self.things.get(item.thingId),
+            meta=meta,
+        )
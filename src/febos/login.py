@@ -4,12 +4,42 @@ Defines `LoginEndpoint`, an endpoint model used to authenticate a user and
 store the returned bearer token on the provided `FebosClient`.
 """
 
-from typing import ClassVar
+from typing import ClassVar, Optional
 
-from febos.client import FebosClient
+from httpx import Response
+
+from febos.client import AsyncFebosClient, FebosClient
 from febos.data_model import LoginPostResponse
 from febos.endpoint import FebosEndpoint
 from febos.error import AuthenticationError
+from febos.parsing import parse_response
+from febos.token_store import StoredSession, session_key
+
+
+def restore_session(
+    client: FebosClient | AsyncFebosClient, username: str
+) -> Optional[LoginPostResponse]:
+    """Reuse the session of a user stored in the client's token store.
+
+    Sets the stored token on the client without contacting the server and
+    without credentials, so the client cannot log in again by itself if
+    the token has expired.
+
+    Args:
+        client: Client whose `token_store` is searched.
+        username: Name of the user.
+
+    Returns:
+        The stored login response, or None if the client has no token
+        store or it holds no session for this user and host.
+    """
+    if client.token_store is None:
+        return None
+    session = client.token_store.load(session_key(client.base_url.host, username))
+    if session is None or session.login is None:
+        return None
+    client.set_token(session.token)
+    return session.login
 
 
 class LoginEndpoint(FebosEndpoint):
@@ -23,6 +53,11 @@ class LoginEndpoint(FebosEndpoint):
         password: Password for authentication.
 
     Usage:
+        - The credentials are also stored on the client so that it logs in
+          again by itself when the token expires (pass `remember=False` to
+          opt out).
+        - If the client has a `token_store` holding a session for this
+          user and host, it is reused without contacting the server.
         - Calls `super().post(json=self.model_dump())` to send credentials as
           a JSON body to the server.
         - Expects the server to set an `Authorization` header on success; the
@@ -35,9 +70,18 @@ class LoginEndpoint(FebosEndpoint):
     username: str
     password: str
 
-    def post(self, client: FebosClient) -> LoginPostResponse:
+    def post(
+        self, client: FebosClient, remember: bool = True, refresh: bool = False
+    ) -> LoginPostResponse:
         """Authenticate user and set bearer token.
 
+        Args:
+            client: FebosClient instance to authenticate.
+            remember: Store the credentials on the client to log in again
+                when the server rejects an expired token. Defaults to True.
+            refresh: Log in even if the client's token store holds a
+                session for this user. Defaults to False.
+
         Returns:
             LoginPostResponse containing user information and auth details.
 
@@ -45,12 +89,77 @@ class LoginEndpoint(FebosEndpoint):
             AuthenticationError: If authorization token is missing from response.
             HTTPStatusError: If HTTP request fails.
         """
+        restored = None if refresh else self._restore(client, remember)
+        if restored is not None:
+            return restored
         response = super().post(
             client=client,
             json=self.model_dump(),
         )
+        return self._authenticate(client, response, remember)
+
+    async def apost(
+        self, client: AsyncFebosClient, remember: bool = True, refresh: bool = False
+    ) -> LoginPostResponse:
+        """Asynchronously authenticate user and set bearer token.
+
+        Args:
+            client: AsyncFebosClient instance to authenticate.
+            remember: Store the credentials on the client to log in again
+                when the server rejects an expired token. Defaults to True.
+            refresh: Log in even if the client's token store holds a
+                session for this user. Defaults to False.
+
+        Returns:
+            LoginPostResponse containing user information and auth details.
+
+        Raises:
+            AuthenticationError: If authorization token is missing from response.
+            HTTPStatusError: If HTTP request fails.
+        """
+        restored = None if refresh else self._restore(client, remember)
+        if restored is not None:
+            return restored
+        response = await super().apost(
+            client=client,
+            json=self.model_dump(),
+        )
+        return self._authenticate(client, response, remember)
+
+    def _restore(
+        self, client: FebosClient | AsyncFebosClient, remember: bool
+    ) -> Optional[LoginPostResponse]:
+        """Reuse the session stored in the client's token store, if any.
+
+        The stored token is not validated here: if the server rejects it,
+        the client logs in again on the first 401 (when `remember` is set).
+        """
+        login = restore_session(client, self.username)
+        if login is not None and remember:
+            client.set_credentials(self.username, self.password)
+        return login
+
+    def _authenticate(
+        self,
+        client: FebosClient | AsyncFebosClient,
+        response: Response,
+        remember: bool,
+    ) -> LoginPostResponse:
+        """Store the returned bearer token on the client and parse the body.
+
+        Raises:
+            AuthenticationError: If authorization token is missing from response.
+        """
         token = response.headers.get("Authorization")
         if not token:
             raise AuthenticationError("Missing authorization token in response")
         client.set_token(token)
-        return LoginPostResponse.model_validate(response.json())
+        if remember:
+            client.set_credentials(self.username, self.password)
+        login = parse_response(LoginPostResponse, response.content, client.trusted)
+        if client.token_store is not None:
+            client.token_store.save(
+                session_key(client.base_url.host, self.username),
+                StoredSession(token, login),
+            )
+        return login
@@ -1,10 +1,13 @@
 """Endpoint model for fetching page and device configuration."""
 
-from typing import ClassVar
+from typing import Any, ClassVar, Dict, Optional
 
-from febos.client import FebosClient
+from httpx import Response
+
+from febos.client import AsyncFebosClient, FebosClient
 from febos.data_model import PageConfigGetResponse
 from febos.endpoint import FebosEndpoint
+from febos.parsing import parse_response
 
 
 class PageConfigEndpoint(FebosEndpoint):
@@ -37,5 +40,51 @@ class PageConfigEndpoint(FebosEndpoint):
         Raises:
             HTTPStatusError: If HTTP request fails.
         """
-        response = super().get(client=client, params={"web": "false"})
-        return PageConfigGetResponse.model_validate(response.json())
+        response = self.get_raw(client=client)
+        return parse_response(PageConfigGetResponse, response.content, client.trusted)
+
+    def get_raw(
+        self, client: FebosClient, headers: Optional[Dict[str, Any]] = None
+    ) -> Response:
+        """Get the page configuration response without parsing it.
+
+        Args:
+            headers: Optional additional headers, e.g. `If-None-Match`.
+
+        Returns:
+            httpx.Response object.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails or returns 304 Not Modified.
+        """
+        return super().get(client=client, params={"web": "false"}, headers=headers)
+
+    async def aget_raw(
+        self, client: AsyncFebosClient, headers: Optional[Dict[str, Any]] = None
+    ) -> Response:
+        """Asynchronously get the page configuration response without parsing it.
+
+        Args:
+            headers: Optional additional headers, e.g. `If-None-Match`.
+
+        Returns:
+            httpx.Response object.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails or returns 304 Not Modified.
+        """
+        return await super().aget(
+            client=client, params={"web": "false"}, headers=headers
+        )
+
+    async def aget(self, client: AsyncFebosClient) -> PageConfigGetResponse:
+        """Asynchronously get page configuration for installation.
+
+        Returns:
+            PageConfigGetResponse containing pages, devices, and input groups.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        response = await self.aget_raw(client=client)
+        return parse_response(PageConfigGetResponse, response.content, client.trusted)
@@ -0,0 +1,265 @@
+"""Persistent on-disk cache for page configuration responses.
+
+The page configuration of an installation (devices, pages, things and their
+inputs) is large and rarely changes. `PageConfigCache` stores the raw JSON
+returned by `PageConfigEndpoint` on disk, keyed by installation id, so that
+a restarted process can load it without going to the network. Entries older
+than the configured TTL are revalidated with `If-None-Match` /
+`If-Modified-Since` when the server provided an `ETag` / `Last-Modified`
+header, and only downloaded again if they actually changed.
+
+Usage:
+    from febos import FebosClient
+    from febos.page_config_cache import PageConfigCache
+
+    cache = PageConfigCache("~/.cache/febos/page-config", ttl=24 * 3600)
+    config = cache.get(client=client, installation_id=101)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from httpx import HTTPStatusError, Response, TransportError
+
+from febos.client import AsyncFebosClient, FebosClient
+from febos.data_model import PageConfigGetResponse
+from febos.page_config import PageConfigEndpoint
+from febos.parsing import parse_response
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600.0
+
+CacheEntry = Tuple[PageConfigGetResponse, Dict[str, Any]]
+
+
+class PageConfigCache:
+    """Disk-backed cache of `PageConfigGetResponse` keyed by installation id.
+
+    Each installation is stored as two files in `directory`: the raw
+    response body (`<installation_id>.json`) and its metadata
+    (`<installation_id>.meta.json`) holding the fetch time and the `ETag`
+    and `Last-Modified` response headers. Parsed configurations are also
+    kept in memory so they are validated at most once per process.
+
+    Attributes:
+        directory: Directory holding the cache files.
+        ttl: Number of seconds a cached configuration is used without
+            revalidating it with the server.
+        stale_if_error: Whether to return an expired configuration when
+            the server cannot be reached.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+    ) -> None:
+        """Initialize PageConfigCache.
+
+        Args:
+            directory: Directory holding the cache files. Created if missing.
+            ttl: Seconds a cached configuration is considered fresh.
+                Defaults to one day.
+            stale_if_error: Return an expired configuration instead of
+                raising when the server cannot be reached. Defaults to True.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.stale_if_error = stale_if_error
+        self._entries: Dict[int, CacheEntry] = {}
+
+    def load(self, installation_id: int) -> Optional[PageConfigGetResponse]:
+        """Load a cached configuration without going to the network.
+
+        The configuration is returned regardless of its age.
+
+        Args:
+            installation_id: ID of the installation.
+
+        Returns:
+            The cached PageConfigGetResponse, or None if not cached.
+        """
+        entry = self._entry(installation_id)
+        return entry[0] if entry else None
+
+    def get(
+        self, client: FebosClient, installation_id: int, refresh: bool = False
+    ) -> PageConfigGetResponse:
+        """Get the configuration of an installation, using the cache.
+
+        Args:
+            client: FebosClient instance used when the server must be asked.
+            installation_id: ID of the installation.
+            refresh: Revalidate with the server even if the TTL has not
+                expired yet.
+
+        Returns:
+            PageConfigGetResponse containing pages, devices, and input groups.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            TransportError: If the server cannot be reached and no cached
+                configuration can be used instead.
+        """
+        entry = self._entry(installation_id)
+        if entry and not refresh and self._is_fresh(entry):
+            return entry[0]
+
+        endpoint = PageConfigEndpoint(installation_id=installation_id)
+        try:
+            response = endpoint.get_raw(
+                client=client, headers=self._conditional_headers(entry)
+            )
+        except HTTPStatusError as e:
+            return self._not_modified(installation_id, entry, e)
+        except TransportError as e:
+            return self._stale(installation_id, entry, e)
+        return self._store(installation_id, response)
+
+    async def aget(
+        self, client: AsyncFebosClient, installation_id: int, refresh: bool = False
+    ) -> PageConfigGetResponse:
+        """Asynchronously get the configuration of an installation.
+
+        Args:
+            client: AsyncFebosClient instance used when the server must be asked.
+            installation_id: ID of the installation.
+            refresh: Revalidate with the server even if the TTL has not
+                expired yet.
+
+        Returns:
+            PageConfigGetResponse containing pages, devices, and input groups.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+            TransportError: If the server cannot be reached and no cached
+                configuration can be used instead.
+        """
+        entry = self._entry(installation_id)
+        if entry and not refresh and self._is_fresh(entry):
+            return entry[0]
+
+        endpoint = PageConfigEndpoint(installation_id=installation_id)
+        try:
+            response = await endpoint.aget_raw(
+                client=client, headers=self._conditional_headers(entry)
+            )
+        except HTTPStatusError as e:
+            return self._not_modified(installation_id, entry, e)
+        except TransportError as e:
+            return self._stale(installation_id, entry, e)
+        return self._store(installation_id, response)
+
+    def invalidate(self, installation_id: int) -> None:
+        """Remove a configuration from memory and disk.
+
+        Args:
+            installation_id: ID of the installation.
+        """
+        self._entries.pop(installation_id, None)
+        for path in self._paths(installation_id):
+            path.unlink(missing_ok=True)
+
+    def _paths(self, installation_id: int) -> Tuple[Path, Path]:
+        """Return the body and metadata file paths of an installation."""
+        return (
+            self.directory / f"{installation_id}.json",
+            self.directory / f"{installation_id}.meta.json",
+        )
+
+    def _entry(self, installation_id: int) -> Optional[CacheEntry]:
+        """Return the cached entry, reading it from disk on first access."""
+        if installation_id in self._entries:
+            return self._entries[installation_id]
+        body_path, meta_path = self._paths(installation_id)
+        try:
+            content = body_path.read_bytes()
+            meta = json.loads(meta_path.read_text())
+            config = parse_response(PageConfigGetResponse, content)
+        except (OSError, ValueError) as e:
+            if body_path.exists():
+                LOGGER.warning(
+                    "Ignoring unreadable page config cache for %s: %s",
+                    installation_id,
+                    e,
+                )
+            return None
+        self._entries[installation_id] = (config, meta)
+        return self._entries[installation_id]
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry was fetched or revalidated within the TTL."""
+        return time.time() - entry[1].get("fetched_at", 0.0) < self.ttl
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Build revalidation headers from the metadata of an entry."""
+        headers = {}
+        if entry:
+            if entry[1].get("etag"):
+                headers["If-None-Match"] = entry[1]["etag"]
+            if entry[1].get("last_modified"):
+                headers["If-Modified-Since"] = entry[1]["last_modified"]
+        return headers
+
+    def _store(self, installation_id: int, response: Response) -> PageConfigGetResponse:
+        """Parse a fresh response and write it to memory and disk."""
+        config = parse_response(PageConfigGetResponse, response.content)
+        meta = {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        body_path, meta_path = self._paths(installation_id)
+        self._write(body_path, response.content)
+        self._write(meta_path, json.dumps(meta).encode())
+        self._entries[installation_id] = (config, meta)
+        return config
+
+    def _not_modified(
+        self,
+        installation_id: int,
+        entry: Optional[CacheEntry],
+        error: HTTPStatusError,
+    ) -> PageConfigGetResponse:
+        """Extend the lifetime of an entry on 304 Not Modified, else re-raise."""
+        if entry is None or error.response.status_code != 304:
+            raise error
+        config, meta = entry
+        meta = meta | {"fetched_at": time.time()}
+        self._write(self._paths(installation_id)[1], json.dumps(meta).encode())
+        self._entries[installation_id] = (config, meta)
+        return config
+
+    def _stale(
+        self,
+        installation_id: int,
+        entry: Optional[CacheEntry],
+        error: TransportError,
+    ) -> PageConfigGetResponse:
+        """Return an expired entry if allowed, else re-raise the transport error."""
+        if entry is None or not self.stale_if_error:
+            raise error
+        LOGGER.warning(
+            "Using stale page config for %s: server unreachable", installation_id
+        )
+        return entry[0]
+
+    def _write(self, path: Path, content: bytes) -> None:
+        """Atomically replace a cache file so readers never see partial data."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
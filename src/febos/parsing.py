@@ -0,0 +1,71 @@
+"""Validation of response bodies straight from JSON bytes.
+
+`Model.model_validate(response.json())` first builds the whole body as
+Python dicts and lists and then walks that tree a second time to validate
+it. `parse_response` hands the raw bytes to pydantic-core instead, which
+parses and validates in a single pass. For `RootModel` list responses the
+list type is validated with a cached `TypeAdapter` and wrapped without a
+second validation of the root.
+
+Trusted mode (`FebosClient(trusted=True)`) is meant for payloads known to
+match the models: the body is validated in strict mode, which skips the
+type coercions lax mode tries, and only falls back to lax validation if the
+strict pass fails. A failed strict pass costs a second parse of the body,
+so a model that fails it once is validated in lax mode only from then on.
+Building the models with `model_construct` instead was
+measured slower, since it walks the decoded tree in Python (see
+`benchmarks/test_parsing_benchmark.py`).
+"""
+
+from functools import lru_cache
+from typing import Set, Type, TypeVar
+
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+# Models whose bodies failed strict validation once; validated lax only
+_LAX_MODELS: Set[Type[BaseModel]] = set()
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Return the cached TypeAdapter validating bodies of a response model.
+
+    Args:
+        model: Response model. For a `RootModel`, the adapter validates the
+            type of its `root` field.
+    """
+    if issubclass(model, RootModel):
+        return TypeAdapter(model.model_fields["root"].annotation)
+    return TypeAdapter(model)
+
+
+def parse_response(model: Type[M], content: bytes, trusted: bool = False) -> M:
+    """Validate a JSON response body into a model.
+
+    Args:
+        model: Response model to build.
+        content: Raw JSON body.
+        trusted: Try the faster strict validation first, falling back to
+            lax validation if the body does not pass it. After a fallback
+            the model is always validated in lax mode.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        ValidationError: If the body does not match the model.
+    """
+    adapter = type_adapter(model)
+    if trusted and model not in _LAX_MODELS:
+        try:
+            value = adapter.validate_json(content, strict=True)
+        except ValidationError:
+            _LAX_MODELS.add(model)
+            value = adapter.validate_json(content)
+    else:
+        value = adapter.validate_json(content)
+    if issubclass(model, RootModel):
+        return model.model_construct(root=value)
+    return value
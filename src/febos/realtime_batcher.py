@@ -0,0 +1,181 @@
+"""Coalescing of concurrent realtime requests per installation.
+
+Different parts of an application often ask for different input groups of
+the same installation within a few milliseconds of each other.
+`RealtimeBatcher` collects those requests during a short window, sends a
+single `RealtimeDataEndpoint` request with the union of the requested input
+groups (split in several requests if the URL would get too long) and hands
+each caller only the `RealtimeData` entries of the groups it asked for.
+
+Usage:
+    from febos.realtime_batcher import RealtimeBatcher
+
+    batcher = RealtimeBatcher(client, window=0.005)
+    # Both calls are served by one HTTP request
+    general, zones = await asyncio.gather(
+        batcher.get(101, ["F_GENERAL"]),
+        batcher.get(101, ["F_ZONE1", "F_ZONE2"]),
+    )
+"""
+
+import asyncio
+from typing import Dict, List, Set, Tuple
+from urllib.parse import quote
+
+from febos.client import AsyncFebosClient
+from febos.data_model import RealtimeData, RealtimeDataGetResponse
+from febos.endpoint import FebosEndpoint
+from febos.realtime_data import RealtimeDataEndpoint
+
+DEFAULT_WINDOW = 0.005
+DEFAULT_MAX_URL_LENGTH = 2000
+
+Waiter = Tuple[List[str], "asyncio.Future[RealtimeDataGetResponse]"]
+
+
+def split_input_groups(
+    installation_id: int, groups: List[str], max_url_length: int
+) -> List[List[str]]:
+    """Split input groups so that each request URL stays below a length.
+
+    Args:
+        installation_id: ID of the installation, part of the URL path.
+        groups: Input group codes to request.
+        max_url_length: Maximum length of path and query string.
+
+    Returns:
+        Lists of input group codes, one per request. A single group longer
+        than the limit still gets its own request.
+    """
+    prefix = len(
+        f"{FebosEndpoint.API_URL}{RealtimeDataEndpoint.URL}".format(
+            installation_id=installation_id
+        )
+        + "?input_group_list="
+    )
+    chunks: List[List[str]] = []
+    length = prefix
+    for group in groups:
+        size = len(quote(group, safe="")) + 1
+        if chunks and length + size <= max_url_length:
+            chunks[-1].append(group)
+            length += size
+        else:
+            chunks.append([group])
+            length = prefix + size
+    return chunks
+
+
+class RealtimeBatcher:
+    """Merge concurrent realtime requests for the same installation.
+
+    The first request for an installation opens a batch; requests arriving
+    within `window` seconds join it. When the window closes, the union of
+    the requested groups is fetched and each caller receives a
+    `RealtimeDataGetResponse` restricted to the entries whose `groupCode`
+    it requested. Entries without a `groupCode` are given to every caller.
+
+    Attributes:
+        client: AsyncFebosClient used to perform the requests.
+        window: Seconds a batch stays open for new requests.
+        max_url_length: Maximum length of path and query string of a single
+            request; larger batches are split.
+    """
+
+    def __init__(
+        self,
+        client: AsyncFebosClient,
+        window: float = DEFAULT_WINDOW,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+    ) -> None:
+        """Initialize RealtimeBatcher.
+
+        Args:
+            client: AsyncFebosClient used to perform the requests.
+            window: Seconds a batch stays open. Defaults to 5 ms.
+            max_url_length: Maximum request URL length. Defaults to 2000.
+        """
+        self.client = client
+        self.window = window
+        self.max_url_length = max_url_length
+        self._batches: Dict[int, List[Waiter]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(
+        self, installation_id: int, input_group_list: List[str]
+    ) -> RealtimeDataGetResponse:
+        """Get realtime data for input groups, sharing the request with others.
+
+        Args:
+            installation_id: ID of the installation.
+            input_group_list: Input group codes to query.
+
+        Returns:
+            RealtimeDataGetResponse with the entries of the requested groups.
+
+        Raises:
+            HTTPStatusError: If the HTTP request covering these groups fails.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if installation_id not in self._batches:
+            self._batches[installation_id] = []
+            loop.call_later(self.window, self._close_batch, installation_id)
+        self._batches[installation_id].append((list(input_group_list), future))
+        return await future
+
+    def _close_batch(self, installation_id: int) -> None:
+        """Close the batch of an installation and start fetching it."""
+        waiters = self._batches.pop(installation_id)
+        task = asyncio.ensure_future(self._flush(installation_id, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, installation_id: int, waiters: List[Waiter]) -> None:
+        """Fetch a batch and resolve its waiters, failing them on errors."""
+        try:
+            await self._resolve(installation_id, waiters)
+        except Exception as e:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _resolve(self, installation_id: int, waiters: List[Waiter]) -> None:
+        """Fetch the union of the groups of a batch and resolve its waiters."""
+        groups = list(dict.fromkeys(g for requested, _ in waiters for g in requested))
+        chunks = split_input_groups(installation_id, groups, self.max_url_length)
+        results = await asyncio.gather(
+            *(
+                RealtimeDataEndpoint(
+                    installation_id=installation_id, input_group_list=chunk
+                ).aget(client=self.client)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        entries: List[RealtimeData] = []
+        errors: Dict[str, BaseException] = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                errors.update(dict.fromkeys(chunk, result))
+            else:
+                entries.extend(result.root)
+
+        for requested, future in waiters:
+            if future.done():
+                continue
+            error = next((errors[g] for g in requested if g in errors), None)
+            if error is not None:
+                future.set_exception(error)
+                continue
+            wanted = set(requested)
+            future.set_result(
+                RealtimeDataGetResponse(
+                    [
+                        entry
+                        for entry in entries
+                        if entry.groupCode is None or entry.groupCode in wanted
+                    ]
+                )
+            )
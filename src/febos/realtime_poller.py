@@ -0,0 +1,293 @@
+"""Long-running realtime polling with change detection.
+
+`RealtimePoller` polls `RealtimeDataEndpoint` for many installations and
+input groups, each on its own interval, from a single asyncio scheduler.
+Every poll is compared with the previous snapshot of the same job and only
+the inputs whose `Value.i` changed are handed to the `on_change` callback.
+
+Usage:
+    import asyncio
+
+    from febos import AsyncFebosClient
+    from febos.realtime_poller import RealtimePoller
+
+    async def main(client):
+        poller = RealtimePoller(client, on_change=print)
+        poller.add(installation_id=101, input_group_list=["F_GENERAL"], interval=10)
+        poller.add(installation_id=102, input_group_list=["F_GENERAL"], interval=60)
+        await poller.run()  # until poller.stop() is called
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from febos.client import AsyncFebosClient
+from febos.data_model import Value
+from febos.realtime_data import RealtimeDataEndpoint, RealtimeResponse
+
+LOGGER = logging.getLogger(__name__)
+
+SnapshotKey = Tuple[int, int, str]
+
+
+class RealtimeChange(NamedTuple):
+    """A realtime input whose value changed since the previous poll.
+
+    Attributes:
+        installation_id: ID of the installation.
+        deviceId: ID of the device.
+        thingId: ID of the thing.
+        code: Input code.
+        value: New value (`Value.i`).
+        previous: Value at the previous poll, None for the first snapshot.
+        ts: Timestamp of the realtime data entry.
+    """
+
+    installation_id: int
+    deviceId: int
+    thingId: int
+    code: str
+    value: Any
+    previous: Any
+    ts: str
+
+
+@dataclass(eq=False)
+class PollJob:
+    """A set of input groups of one installation polled on a fixed interval.
+
+    Attributes:
+        installation_id: ID of the installation.
+        input_group_list: Input group codes requested on each poll.
+        interval: Seconds between two polls.
+        snapshot: Last seen value per `(deviceId, thingId, code)`.
+        active: False once the job was removed from the poller.
+    """
+
+    installation_id: int
+    input_group_list: List[str]
+    interval: float
+    snapshot: Dict[SnapshotKey, Any] = field(default_factory=dict)
+    active: bool = True
+
+
+def diff_snapshot(
+    installation_id: int,
+    response: RealtimeResponse,
+    snapshot: Dict[SnapshotKey, Any],
+    emit_initial: bool = True,
+) -> List[RealtimeChange]:
+    """Compare a realtime response with a snapshot and update the snapshot.
+
+    Args:
+        installation_id: ID of the installation the response belongs to.
+        response: Realtime data returned by the server, flat or not.
+        snapshot: Previous values per `(deviceId, thingId, code)`, updated
+            in place.
+        emit_initial: Whether inputs seen for the first time are reported.
+
+    Returns:
+        The inputs whose value changed.
+    """
+    changes = []
+    for entry in response.root:
+        for code, value in entry.data.items():
+            if isinstance(value, Value):
+                value = value.i
+            key = (entry.deviceId, entry.thingId, code)
+            seen = key in snapshot
+            previous = snapshot.get(key)
+            if seen and previous == value:
+                continue
+            snapshot[key] = value
+            if seen or emit_initial:
+                changes.append(
+                    RealtimeChange(
+                        installation_id,
+                        entry.deviceId,
+                        entry.thingId,
+                        code,
+                        value,
+                        previous,
+                        entry.ts,
+                    )
+                )
+    return changes
+
+
+class RealtimePoller:
+    """Poll many realtime input groups from a single scheduler.
+
+    Jobs are kept in a heap ordered by their next due time. One scheduler
+    coroutine sleeps until the earliest job is due and starts its poll as a
+    task, so thousands of jobs do not need a thread or a timer each. Every
+    interval is randomly stretched or shortened by up to `jitter` (a
+    fraction of the interval) so that jobs added together drift apart
+    instead of hitting the server in bursts.
+
+    Attributes:
+        client: AsyncFebosClient used to perform the requests.
+        on_change: Callable (or coroutine function) receiving the list of
+            `RealtimeChange` of a poll, only called if something changed.
+        jitter: Maximum relative deviation applied to each interval.
+        emit_initial: Whether the first snapshot of a job is reported.
+    """
+
+    def __init__(
+        self,
+        client: AsyncFebosClient,
+        on_change: Callable[[List[RealtimeChange]], Any],
+        jitter: float = 0.1,
+        max_concurrency: int = 10,
+        emit_initial: bool = True,
+    ) -> None:
+        """Initialize RealtimePoller.
+
+        Args:
+            client: AsyncFebosClient used to perform the requests.
+            on_change: Called with the changes of each poll that has any.
+            jitter: Maximum relative deviation applied to each interval.
+                Defaults to 0.1 (±10%).
+            max_concurrency: Maximum number of polls in flight.
+            emit_initial: Report every input on the first poll of a job.
+        """
+        self.client = client
+        self.on_change = on_change
+        self.jitter = jitter
+        self.emit_initial = emit_initial
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queue: List[Tuple[float, int, PollJob]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight: Set[PollJob] = set()
+        self._running = False
+
+    def add(
+        self, installation_id: int, input_group_list: List[str], interval: float
+    ) -> PollJob:
+        """Schedule a new polling job.
+
+        The first poll happens after a random fraction of `jitter * interval`.
+
+        Args:
+            installation_id: ID of the installation.
+            input_group_list: Input group codes to request.
+            interval: Seconds between two polls.
+
+        Returns:
+            The PollJob, which can be passed to `remove()`.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        job = PollJob(installation_id, list(input_group_list), interval)
+        self._schedule(job, self._now() + random.uniform(0, self.jitter * interval))
+        return job
+
+    def remove(self, job: PollJob) -> None:
+        """Stop polling a job. A poll already in flight is still reported.
+
+        Args:
+            job: Job returned by `add()`.
+        """
+        job.active = False
+
+    async def poll(self, job: PollJob) -> List[RealtimeChange]:
+        """Poll a job once and return its changes.
+
+        Args:
+            job: Job to poll.
+
+        Returns:
+            The inputs whose value changed since the previous poll.
+
+        Raises:
+            HTTPStatusError: If HTTP request fails.
+        """
+        endpoint = RealtimeDataEndpoint(
+            installation_id=job.installation_id,
+            input_group_list=job.input_group_list,
+        )
+        async with self._semaphore:
+            response = await endpoint.aget(client=self.client, flat=True)
+        return diff_snapshot(
+            job.installation_id, response, job.snapshot, self.emit_initial
+        )
+
+    async def run(self) -> None:
+        """Run the scheduler until `stop()` is called.
+
+        Errors of single polls are logged and do not stop the scheduler.
+        """
+        self._running = True
+        self._wakeup = asyncio.Event()
+        try:
+            while self._running:
+                delay = self._queue[0][0] - self._now() if self._queue else None
+                if delay is None or delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                due, _, job = heapq.heappop(self._queue)
+                if not job.active:
+                    continue
+                # A slow poll is not overlapped by the next one of the same job
+                if job not in self._in_flight:
+                    self._in_flight.add(job)
+                    task = asyncio.ensure_future(self._run_job(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                self._schedule(job, max(due, self._now()) + self._next_interval(job))
+        finally:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled polls so none outlives the scheduler
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._running = False
+
+    def stop(self) -> None:
+        """Ask a running scheduler to return."""
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run_job(self, job: PollJob) -> None:
+        """Poll a job and forward its changes to `on_change`."""
+        try:
+            changes = await self.poll(job)
+            if changes:
+                result = self.on_change(changes)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            LOGGER.warning(
+                "Realtime poll of installation %s failed: %s", job.installation_id, e
+            )
+        finally:
+            self._in_flight.discard(job)
+
+    def _schedule(self, job: PollJob, due: float) -> None:
+        """Push a job on the heap and wake the scheduler up."""
+        heapq.heappush(self._queue, (due, next(self._counter), job))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_interval(self, job: PollJob) -> float:
+        """Return the job interval randomly stretched by up to ±jitter."""
+        return job.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    @staticmethod
+    def _now() -> float:
+        """Return the current monotonic time."""
+        return time.monotonic()
@@ -0,0 +1,208 @@
+"""Retry and rate-limit policies for Febos requests.
+
+`RetryPolicy` decides whether a failed request is retried and how long to
+wait before the next attempt (exponential backoff with full jitter,
+honouring `Retry-After`). Idempotent requests are retried on transient
+status codes and transport errors; POST requests only when the server
+explicitly declined them or the connection could not be opened, so a
+request is never applied twice. `RateLimiter` keeps one token bucket per
+host so a client never sends more than a configured rate of requests.
+
+Both are configured on `FebosClient`/`AsyncFebosClient` and applied by
+`FebosEndpoint` to every request:
+
+    client = FebosClient(retry=RetryPolicy(max_attempts=5), rate_limit=20.0)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+from httpx import (ConnectError, ConnectTimeout, PoolTimeout, Response,
+                   TransportError)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how to retry failed requests.
+
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first one.
+        backoff_base: Delay in seconds before the second attempt; doubled
+            for each further attempt.
+        backoff_max: Upper bound of the backoff delay in seconds.
+        jitter: Draw each delay uniformly between zero and the backoff
+            delay ("full jitter") so that clients do not retry in lockstep.
+        retry_after_max: Upper bound in seconds for `Retry-After` delays.
+        retry_statuses: Status codes retried for idempotent requests.
+        post_retry_statuses: Status codes retried for other requests; only
+            codes meaning the request was not processed belong here.
+    """
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_after_max: float = 60.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    post_retry_statuses: FrozenSet[int] = frozenset({429, 503})
+
+    def retry_response(self, method: str, response: Response, attempt: int) -> bool:
+        """Whether a response with an error status should be retried.
+
+        Args:
+            method: HTTP method of the request.
+            response: The response received.
+            attempt: Number of the attempt that produced the response.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return response.status_code in self.retry_statuses
+        return response.status_code in self.post_retry_statuses
+
+    def retry_error(self, method: str, error: TransportError, attempt: int) -> bool:
+        """Whether a transport error should be retried.
+
+        Idempotent requests are retried on any transport error. Other
+        requests only when the connection could not be established, i.e.
+        the request certainly never reached the server.
+
+        Args:
+            method: HTTP method of the request.
+            error: The transport error raised by httpx.
+            attempt: Number of the attempt that failed.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout))
+
+    def delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Seconds to wait before the attempt following `attempt`.
+
+        Args:
+            attempt: Number of the attempt that failed.
+            response: The failed response, used for its `Retry-After` header.
+        """
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def retry_after_seconds(response: Response) -> Optional[float]:
+    """Parse the `Retry-After` header of a response.
+
+    Args:
+        response: Response that may carry a `Retry-After` header.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are added at `rate` per second up to `capacity`. Each request
+    takes one token; when the bucket is empty, the request is told how long
+    to wait for its token. The bucket can also be paused, e.g. after the
+    server answered 429 with a `Retry-After` header.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens, i.e. the allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Initialize TokenBucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst. Defaults to `rate` (one second worth).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for at least `seconds` from now."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Asynchronously wait until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Per-host token buckets sharing the same rate and burst.
+
+    Attributes:
+        rate: Requests per second allowed for each host.
+        capacity: Maximum burst for each host.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            rate: Requests per second allowed for each host.
+            capacity: Maximum burst for each host. Defaults to `rate`.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Return the token bucket of a host, creating it on first use."""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[host]
@@ -0,0 +1,243 @@
+"""Vectorized conversion of raw values into engineering units.
+
+Historical `vs` strings and realtime `Value.i` numbers are raw device
+values: a raw `215` of an input with `scale` 1 means `21.5`, and the input's
+`nullValue` (e.g. `-32768`) means "no data". `ValueDecoder` looks up the
+`InputMeta` of every input once from an `InstallationIndex` and converts
+whole historical blocks or realtime snapshots with a few NumPy operations:
+`raw / 10 ** scale`, with null values replaced by NaN.
+
+This module requires the optional `numpy` dependency
+(`pip install "febos[numpy]"`).
+
+Usage:
+    from febos.installation_index import InstallationIndex
+    from febos.scaling import ValueDecoder
+
+    decoder = ValueDecoder(InstallationIndex(page_config))
+    for columns in decoder.decode_historical(endpoint.get_columnar(client=client)):
+        print(columns.groupCode, columns.column("R8750").mean())
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from febos.columnar import (HistoricalDataColumns, columns_from_entry,
+                            decode_historical_data, require_numpy, to_float,
+                            to_float_matrix)
+from febos.data_model import (HistoricalDataGetResponse, RealtimeData,
+                              RealtimeDataGetResponse)
+from febos.installation_index import InputMeta, InstallationIndex
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+HistoricalBlock = Union[
+    bytes, str, HistoricalDataGetResponse, Iterable[HistoricalDataColumns]
+]
+
+CodesKey = Tuple[Optional[int], Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class RealtimeColumns:
+    """Decoded values of a single `RealtimeData` entry.
+
+    Attributes:
+        deviceId: ID of the device the input group belongs to.
+        thingId: ID of the thing the input group belongs to.
+        groupCode: Input group code, if returned by the server.
+        ts: Timestamp of the snapshot.
+        codes: Input codes naming the entries of `values`.
+        values: `float64` array of scaled values; NaN marks null, missing
+            or non-numeric values.
+    """
+
+    deviceId: int
+    thingId: int
+    groupCode: Optional[str]
+    ts: str
+    codes: List[str]
+    values: "np.ndarray"
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the values by input code."""
+        return dict(zip(self.codes, self.values.tolist()))
+
+
+class ValueDecoder:
+    """Convert raw input values into scaled floats with nulls masked.
+
+    The divisor (`10 ** scale`) and null value of each combination of
+    device and input codes are computed once and cached, so repeated blocks
+    of the same input group only cost the array operations. Inputs missing
+    from the configuration, including inputs of devices it does not list,
+    are passed through unscaled.
+
+    Attributes:
+        index: Index of the installation's page configuration.
+    """
+
+    def __init__(self, index: InstallationIndex) -> None:
+        """Initialize ValueDecoder.
+
+        Args:
+            index: Index of the installation's page configuration.
+        """
+        require_numpy()
+        self.index = index
+        self._vectors: Dict[CodesKey, Tuple["np.ndarray", "np.ndarray"]] = {}
+
+    def meta(self, code: str, device_id: Optional[int] = None) -> Optional[InputMeta]:
+        """Return the metadata of an input, or None if it is unknown.
+
+        With a `device_id`, only that device's metadata is used: the same
+        code may have another scale on another device.
+
+        Args:
+            code: Input code, e.g. `R8765`.
+            device_id: Device the input belongs to, if known.
+        """
+        try:
+            return self.index.input_meta(code, device_id)
+        except KeyError:
+            return None
+
+    def units(
+        self, codes: Sequence[str], device_id: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Return the measurement unit of each input code.
+
+        Args:
+            codes: Input codes.
+            device_id: Device the inputs belong to, if known.
+        """
+        units = []
+        for code in codes:
+            meta = self.meta(code, device_id)
+            units.append(meta.measUnit if meta else None)
+        return units
+
+    def scale(
+        self,
+        raw: "np.ndarray",
+        codes: Sequence[str],
+        device_id: Optional[int] = None,
+    ) -> "np.ndarray":
+        """Scale raw values and mask null values.
+
+        Args:
+            raw: `float64` array whose last axis follows `codes`, e.g. an
+                (N, len(codes)) matrix of historical values.
+            codes: Input codes of the last axis of `raw`.
+            device_id: Device the inputs belong to, if known.
+
+        Returns:
+            New array of the same shape with `raw / 10 ** scale`, NaN where
+            `raw` equals the input's null value.
+        """
+        divisors, nulls = self._vectors_for(codes, device_id)
+        values = raw / divisors
+        values[raw == nulls] = np.nan
+        return values
+
+    def decode_columns(self, columns: HistoricalDataColumns) -> HistoricalDataColumns:
+        """Return a copy of a historical entry with scaled values.
+
+        Args:
+            columns: Entry holding raw values, e.g. from `get_columnar()`.
+        """
+        return replace(
+            columns,
+            values=self.scale(columns.values, columns.codes, columns.deviceId),
+        )
+
+    def decode_historical(self, block: HistoricalBlock) -> List[HistoricalDataColumns]:
+        """Decode a historical data block into scaled columns.
+
+        Args:
+            block: Raw response body, a HistoricalDataGetResponse (e.g. a
+                chunk of `iter_chunks()`) or raw HistoricalDataColumns.
+
+        Returns:
+            One HistoricalDataColumns per entry, with scaled values.
+        """
+        if isinstance(block, (bytes, bytearray, str)):
+            block = decode_historical_data(block)
+        elif isinstance(block, HistoricalDataGetResponse):
+            block = [columns_from_entry(entry) for entry in block.root]
+        return [self.decode_columns(columns) for columns in block]
+
+    def decode_realtime(
+        self, response: RealtimeDataGetResponse
+    ) -> List[RealtimeColumns]:
+        """Decode a realtime snapshot into scaled values.
+
+        The values of all entries are converted together, in one pass.
+
+        Args:
+            response: Realtime data response.
+
+        Returns:
+            One RealtimeColumns per entry of the response.
+        """
+        codes: List[str] = []
+        raws: List[object] = []
+        divisors: List["np.ndarray"] = []
+        nulls: List["np.ndarray"] = []
+        for entry in response.root:
+            entry_codes = list(entry.data)
+            codes.extend(entry_codes)
+            raws.extend(value.i for value in entry.data.values())
+            entry_divisors, entry_nulls = self._vectors_for(entry_codes, entry.deviceId)
+            divisors.append(entry_divisors)
+            nulls.append(entry_nulls)
+        if not codes:
+            return [self._realtime(entry, [], np.empty(0)) for entry in response.root]
+
+        try:
+            raw = np.array(raws, dtype=np.float64)
+        except (TypeError, ValueError):
+            raw = np.array([to_float(value) for value in raws], dtype=np.float64)
+        values = raw / np.concatenate(divisors)
+        values[raw == np.concatenate(nulls)] = np.nan
+
+        results, start = [], 0
+        for entry in response.root:
+            stop = start + len(entry.data)
+            results.append(self._realtime(entry, codes[start:stop], values[start:stop]))
+            start = stop
+        return results
+
+    @staticmethod
+    def _realtime(
+        entry: RealtimeData, codes: List[str], values: "np.ndarray"
+    ) -> RealtimeColumns:
+        """Build the RealtimeColumns of an entry."""
+        return RealtimeColumns(
+            deviceId=entry.deviceId,
+            thingId=entry.thingId,
+            groupCode=entry.groupCode,
+            ts=entry.ts,
+            codes=codes,
+            values=values,
+        )
+
+    def _vectors_for(
+        self, codes: Sequence[str], device_id: Optional[int]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return the cached divisor and null value vectors of input codes."""
+        key = (device_id, tuple(codes))
+        vectors = self._vectors.get(key)
+        if vectors is None:
+            metas = [self.meta(code, device_id) for code in codes]
+            divisors = np.array(
+                [10.0**meta.scale if meta and meta.scale else 1.0 for meta in metas]
+            )
+            nulls = to_float_matrix(
+                [[meta.nullValue if meta else None for meta in metas]], len(codes)
+            )[0]
+            vectors = self._vectors[key] = (divisors, nulls)
+        return vectors
@@ -0,0 +1,320 @@
+"""Incremental parsing of large JSON array responses.
+
+`GetHistoricalDataEndpoint` and `GetDataAnalysisEndpoint` can return tens of
+megabytes for long ranges. Parsing such a body with `response.json()` and
+validating the whole tree keeps the raw bytes, the decoded Python objects
+and the models in memory at the same time. The decoders in this module are
+fed the body chunk by chunk (e.g. from `Response.iter_bytes()`) and return
+models as soon as their bytes are complete, so memory stays bounded by the
+size of a single element (or batch of points) instead of the whole body.
+
+`JsonArrayScanner` does the splitting: it skips over strings with a
+regular expression and tracks nesting to find where the elements of a top-level JSON array start and end,
+without decoding anything. Each element is then validated on its own with
+`model_validate_json`.
+
+Usage:
+    decoder = DataAnalysisEntryDecoder()
+    for chunk in response.iter_bytes():
+        for entry in decoder.feed(chunk):
+            ...
+    decoder.close()
+"""
+
+import json
+import re
+from typing import List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from febos.data_model import (DataAnalysisEntry, HistoricalDataEntry,
+                              HistoricalDataPoint)
+
+DEFAULT_BATCH_SIZE = 10000
+
+Event = Tuple[str, bytes]
+
+# A whole string (group 1 is its closing quote, missing if the string is
+# cut by the end of the buffer) or a structural character.
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*(")?|[\[\]{},:]', re.DOTALL)
+# Everything up to the next bracket outside strings (or a cut string).
+_SKIP = re.compile(rb'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*', re.DOTALL)
+_CLOSING = {ord("}"): ord("{"), ord("]"): ord("[")}
+
+
+class JsonArrayScanner:
+    """Split a JSON array arriving in chunks into its object elements.
+
+    `feed()` returns events for everything completed by a chunk:
+
+    - `("item", raw)`: raw bytes of an element of the top-level array.
+
+    When `nested` names a key holding an array in the elements (e.g.
+    `data` for historical data), that array is split as well so that a
+    single huge element is never buffered:
+
+    - `("head", raw)`: the element up to the nested array, closed as a JSON
+      object with the nested array replaced by `[]`.
+    - `("nested", raw)`: raw bytes of an element of the nested array.
+    - `("item", raw)`: the whole element with the nested array replaced by
+      `[]`, emitted after all its nested elements.
+
+    Only object and array elements are reported; scalars are skipped. The
+    scanner checks nesting but does not otherwise validate the JSON, which
+    is left to the parser of each element.
+
+    Attributes:
+        nested: Key of the nested array to split, if any.
+    """
+
+    def __init__(self, nested: Optional[str] = None) -> None:
+        """Initialize JsonArrayScanner.
+
+        Args:
+            nested: Key of an array inside the elements to split as well.
+        """
+        self.nested = nested
+        self._nested_key = json.dumps(nested).encode() if nested else None
+        self._buf = bytearray()
+        self._base = 0  # absolute offset of _buf[0]
+        self._pos = 0  # absolute offset of the next byte to scan
+        self._stack = bytearray()
+        self._expect_key = False
+        self._key: Optional[bytes] = None
+        self._parts: Optional[List[bytes]] = None
+        self._mark: Optional[int] = None
+        self._in_nested = False
+        self._nested_start: Optional[int] = None
+        self._done = False
+        self._events: List[Event] = []
+
+    def feed(self, chunk: bytes) -> List[Event]:
+        """Scan the next chunk of the body.
+
+        Args:
+            chunk: Next bytes of the JSON document.
+
+        Returns:
+            Events for the elements completed by this chunk.
+
+        Raises:
+            ValueError: If the document is not a JSON array or its brackets
+                do not match.
+        """
+        self._buf += chunk
+        self._scan()
+        self._trim()
+        events, self._events = self._events, []
+        return events
+
+    def close(self) -> None:
+        """Check that the whole array was received.
+
+        Raises:
+            ValueError: If the document ended before the array was closed.
+        """
+        if not self._done:
+            raise ValueError("Truncated JSON array")
+
+    def _slice(self, start: int, stop: int) -> bytes:
+        """Return the buffered bytes between two absolute offsets."""
+        return bytes(self._buf[start - self._base : stop - self._base])
+
+    def _scan(self) -> None:
+        """Advance over the buffered bytes, updating the nesting state."""
+        buf = self._buf
+        i = self._pos - self._base
+        while not self._done:
+            if len(self._stack) != 2:
+                # Keys are only tracked in elements: jump to the next bracket
+                i = _SKIP.match(buf, i).end()
+                if i == len(buf):
+                    break
+                char = buf[i]
+                if char == ord('"'):
+                    break  # string cut by the end of the buffer
+                offset = self._base + i
+                i += 1
+                if char in b"{[":
+                    self._open(char, offset)
+                else:
+                    self._close(char, offset)
+                continue
+
+            match = _TOKEN.search(buf, i)
+            if match is None:
+                i = len(buf)
+                break
+            char = buf[match.start()]
+            if char == ord('"'):
+                if match.group(1) is None:
+                    i = match.start()  # string cut by the end of the buffer
+                    break
+                if self._expect_key:
+                    self._key = match.group(0)
+            elif char in b"{[":
+                self._open(char, self._base + match.start())
+            elif char in b"}]":
+                self._close(char, self._base + match.start())
+            else:
+                # "," starts the next key of an element, ":" its value
+                self._expect_key = char == ord(",") and self._stack[-1] == ord("{")
+            i = match.end()
+        self._pos = self._base + i
+
+    def _open(self, char: int, offset: int) -> None:
+        """Handle an opening bracket at an absolute offset."""
+        depth = len(self._stack)
+        if depth == 0 and char != ord("["):
+            raise ValueError("Expected a JSON array")
+        if depth == 1:
+            self._parts = []
+            self._mark = offset
+            self._expect_key = char == ord("{")
+            self._key = None
+        elif (
+            depth == 2
+            and char == ord("[")
+            and self._stack[-1] == ord("{")
+            and self._key is not None
+            and self._key == self._nested_key
+        ):
+            self._parts.append(self._slice(self._mark, offset) + b"[]")
+            self._events.append(("head", b"".join(self._parts) + b"}"))
+            self._mark = None
+            self._in_nested = True
+        elif depth == 3 and self._in_nested:
+            self._nested_start = offset
+        self._stack.append(char)
+
+    def _close(self, char: int, offset: int) -> None:
+        """Handle a closing bracket at an absolute offset."""
+        if not self._stack or self._stack[-1] != _CLOSING[char]:
+            raise ValueError(f"Unbalanced JSON at byte {offset}")
+        self._stack.pop()
+        depth = len(self._stack)
+        if depth == 3 and self._nested_start is not None:
+            self._events.append(("nested", self._slice(self._nested_start, offset + 1)))
+            self._nested_start = None
+        elif depth == 2 and self._in_nested:
+            self._in_nested = False
+            self._mark = offset + 1
+        elif depth == 1:
+            self._parts.append(self._slice(self._mark, offset + 1))
+            self._events.append(("item", b"".join(self._parts)))
+            self._parts = None
+            self._mark = None
+        elif depth == 0:
+            self._done = True
+
+    def _trim(self) -> None:
+        """Drop buffered bytes no pending element needs any more."""
+        keep = self._pos
+        for offset in (self._mark, self._nested_start):
+            if offset is not None:
+                keep = min(keep, offset)
+        if keep > self._base:
+            del self._buf[: keep - self._base]
+            self._base = keep
+
+
+class DataAnalysisEntryDecoder:
+    """Decode a data analysis response body into entries as it arrives."""
+
+    def __init__(self) -> None:
+        """Initialize DataAnalysisEntryDecoder."""
+        self._scanner = JsonArrayScanner()
+
+    def feed(self, chunk: bytes) -> List[DataAnalysisEntry]:
+        """Return the entries completed by the next chunk of the body.
+
+        Raises:
+            ValueError: If the body is not a JSON array of valid entries.
+        """
+        return [
+            DataAnalysisEntry.model_validate_json(raw)
+            for _, raw in self._scanner.feed(chunk)
+        ]
+
+    def close(self) -> None:
+        """Check that the whole body was received.
+
+        Raises:
+            ValueError: If the body ended before the array was closed.
+        """
+        self._scanner.close()
+
+
+class HistoricalEntryDecoder:
+    """Decode a historical data response body into entries as it arrives.
+
+    The `data` points of each entry are parsed one by one and returned in
+    `HistoricalDataEntry` objects holding at most `batch_size` points, so a
+    single group spanning a year never has to be held in memory at once.
+    Consecutive batches of the same group carry the same `deviceId`,
+    `thingId` and `groupCode`. An entry without points is returned once
+    with empty `data`.
+
+    If the server sends the `data` key before the fields identifying the
+    entry, points are buffered until the end of the entry.
+
+    Attributes:
+        batch_size: Maximum number of points per returned entry.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Initialize HistoricalEntryDecoder.
+
+        Args:
+            batch_size: Maximum number of points per returned entry.
+                Defaults to 10000.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self._scanner = JsonArrayScanner(nested="data")
+        self._head: Optional[HistoricalDataEntry] = None
+        self._batch: List[HistoricalDataPoint] = []
+        self._emitted = False
+
+    def feed(self, chunk: bytes) -> List[HistoricalDataEntry]:
+        """Return the entries and batches completed by the next chunk.
+
+        Raises:
+            ValueError: If the body is not a JSON array of valid entries.
+        """
+        entries = []
+        for kind, raw in self._scanner.feed(chunk):
+            if kind == "head":
+                try:
+                    self._head = HistoricalDataEntry.model_validate_json(raw)
+                except ValidationError:
+                    self._head = None  # identifying fields come after data
+            elif kind == "nested":
+                self._batch.append(HistoricalDataPoint.model_validate_json(raw))
+                if self._head is not None and len(self._batch) >= self.batch_size:
+                    entries.append(self._flush(self._head))
+            else:
+                entry = HistoricalDataEntry.model_validate_json(raw)
+                if entry.data:
+                    # The entry had no splittable "data" array
+                    entries.append(entry)
+                elif self._batch or not self._emitted:
+                    entries.append(self._flush(entry))
+                self._head = None
+                self._emitted = False
+        return entries
+
+    def close(self) -> None:
+        """Check that the whole body was received.
+
+        Raises:
+            ValueError: If the body ended before the array was closed.
+        """
+        self._scanner.close()
+
+    def _flush(self, entry: HistoricalDataEntry) -> HistoricalDataEntry:
+        """Return the buffered points as a copy of `entry`."""
+        batch, self._batch = self._batch, []
+        self._emitted = True
+        return entry.model_copy(update={"data": batch})
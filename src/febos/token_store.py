@@ -0,0 +1,205 @@
+"""Persistent storage of session tokens shared between processes.
+
+Every process that logs in adds a round trip to `/v1/auth/login`, and many
+workers starting together get rate limited by it. A `TokenStore` keeps the
+bearer token and the `LoginPostResponse` of a user per host, so that
+`LoginEndpoint.post` can reuse a stored session instead of logging in, and
+a client that had to log in again (see `BearerAuth`) publishes its new token
+to the other processes.
+
+`FileTokenStore` is the default implementation: a single JSON file guarded
+by an `fcntl` lock file, so concurrent processes never see partial writes.
+
+Usage:
+    from febos import FebosClient
+    from febos.login import LoginEndpoint
+    from febos.token_store import FileTokenStore
+
+    client = FebosClient(token_store=FileTokenStore())
+    # Only goes to the network if no token is stored for this user
+    LoginEndpoint(username="user", password="pass").post(client=client)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Union
+
+from febos.data_model import LoginPostResponse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PATH = "~/.cache/febos/tokens.json"
+
+
+class StoredSession(NamedTuple):
+    """A session persisted by a `TokenStore`.
+
+    Attributes:
+        token: Bearer token returned by the login.
+        login: The login response, if known.
+    """
+
+    token: str
+    login: Optional[LoginPostResponse]
+
+
+def session_key(host: str, username: str) -> str:
+    """Return the key under which the session of a user is stored.
+
+    Args:
+        host: Host name of the Febos server.
+        username: Name of the user.
+    """
+    return f"{username}@{host}"
+
+
+class TokenStore(ABC):
+    """Storage of `StoredSession` objects by session key."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[StoredSession]:
+        """Return the stored session, or None if there is none.
+
+        Args:
+            key: Session key, see `session_key()`.
+        """
+
+    @abstractmethod
+    def save(self, key: str, session: StoredSession) -> None:
+        """Store a session, replacing any previous one.
+
+        Args:
+            key: Session key, see `session_key()`.
+            session: Session to store.
+        """
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        """Remove a stored session, if any.
+
+        Args:
+            key: Session key, see `session_key()`.
+        """
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store shared by the clients of a single process."""
+
+    def __init__(self) -> None:
+        """Initialize MemoryTokenStore."""
+        self._sessions: Dict[str, StoredSession] = {}
+
+    def load(self, key: str) -> Optional[StoredSession]:
+        """Return the stored session, or None if there is none."""
+        return self._sessions.get(key)
+
+    def save(self, key: str, session: StoredSession) -> None:
+        """Store a session, replacing any previous one."""
+        self._sessions[key] = session
+
+    def clear(self, key: str) -> None:
+        """Remove a stored session, if any."""
+        self._sessions.pop(key, None)
+
+
+class FileTokenStore(TokenStore):
+    """Token store backed by a JSON file shared between processes.
+
+    Readers take a shared lock and writers an exclusive lock on a sibling
+    `.lock` file; the JSON file itself is replaced atomically. The file is
+    created with owner-only permissions since it holds bearer tokens.
+    Passwords are never stored.
+
+    Attributes:
+        path: Path of the JSON file.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = DEFAULT_PATH) -> None:
+        """Initialize FileTokenStore.
+
+        Args:
+            path: Path of the JSON file. Its directory is created if missing.
+                Defaults to `~/.cache/febos/tokens.json`.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def load(self, key: str) -> Optional[StoredSession]:
+        """Return the stored session, or None if there is none."""
+        with self._locked(exclusive=False):
+            entry = self._read().get(key)
+        if not entry or not entry.get("token"):
+            return None
+        try:
+            login = (
+                LoginPostResponse.model_validate(entry["login"])
+                if entry.get("login")
+                else None
+            )
+        except ValueError as e:
+            LOGGER.warning("Ignoring invalid stored login for %s: %s", key, e)
+            login = None
+        return StoredSession(entry["token"], login)
+
+    def save(self, key: str, session: StoredSession) -> None:
+        """Store a session, replacing any previous one."""
+        with self._locked(exclusive=True):
+            data = self._read()
+            data[key] = {
+                "token": session.token,
+                "login": session.login.model_dump() if session.login else None,
+                "saved_at": time.time(),
+            }
+            self._write(data)
+
+    def clear(self, key: str) -> None:
+        """Remove a stored session, if any."""
+        with self._locked(exclusive=True):
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold a shared or exclusive lock on the lock file."""
+        with open(self._lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Any]:
+        """Read the whole store, treating a missing or corrupt file as empty."""
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            LOGGER.warning("Ignoring unreadable token store %s: %s", self.path, e)
+            return {}
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """Atomically replace the store file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,6 +1,11 @@
 import pytest
 
-from febos.client import FebosClient
+from febos.client import AsyncFebosClient, FebosClient
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
 
 
 @pytest.fixture
@@ -10,6 +15,13 @@ def client():
     return c
 
 
+@pytest.fixture
+def async_client():
+    c = AsyncFebosClient()
+    c.set_token("fake-token")
+    return c
+
+
 @pytest.fixture
 def mock_login_response():
     return {
@@ -95,6 +107,105 @@ def mock_page_config_response():
     }
 
 
+@pytest.fixture
+def mock_input_response():
+    return {
+        "category": "SENSOR",
+        "clientName": "client",
+        "code": "R8765",
+        "codeName": "T_EXT",
+        "dataOffset": 0,
+        "deviceId": 789,
+        "deviceModelId": 1,
+        "id": 5001,
+        "inputOptionDtoList": [],
+        "inputType": "NUMBER",
+        "label": "Outdoor temperature",
+        "name": "T_EXT",
+        "ord": 1,
+        "saveHistory": True,
+        "thingId": 10,
+        "thingModelId": 1,
+        "measUnit": "°C",
+        "nullValue": "-32768",
+        "scale": 1,
+    }
+
+
+@pytest.fixture
+def mock_page_config_with_inputs_response(
+    mock_page_config_response, mock_input_response
+):
+    input_group = {
+        "deviceId": 789,
+        "inputGroupCode": "F_GENERAL",
+        "inputGroupGetCode": "F_GENERAL_GET",
+        "inputGroupId": 300,
+        "inputList": [
+            mock_input_response,
+            mock_input_response
+            | {"code": "R8766", "id": 5002, "scale": None, "measUnit": "%"},
+        ],
+        "ord": 1,
+        "thingId": 10,
+    }
+    widget = {
+        "code": "W1",
+        "defaultDeviceId": 789,
+        "defaultThingId": 10,
+        "id": 200,
+        "inputGroupGetCodeList": ["F_GENERAL_GET"],
+        "label": "General",
+        "name": "General",
+        "ord": 1,
+        "tabId": 20,
+        "widgetInputGroupList": [input_group],
+    }
+    page = {
+        "code": "FBDEVLIST",
+        "codeName": "FBDEVLIST",
+        "id": 2,
+        "inputGroupGetCodeList": ["F_GENERAL_GET"],
+        "label": "Devices",
+        "name": "Devices",
+        "ord": 1,
+        "pageType": "DEVICE",
+        "tabList": [
+            {
+                "code": "TAB1",
+                "id": 20,
+                "inputGroupGetCodeMap": {"789": ["F_GENERAL_GET"]},
+                "label": "Tab",
+                "name": "Tab",
+                "ord": 1,
+                "pageId": 2,
+                "widgetList": [widget],
+            }
+        ],
+    }
+    thing = {
+        "address": "1",
+        "code": "TH1",
+        "codeName": "TH1",
+        "deviceId": 789,
+        "id": 10,
+        "label": "Thing",
+        "modelCode": "M1",
+        "modelId": 1,
+        "modelName": "Mod1",
+        "name": "Thing",
+        "ord": 1,
+        "tenantId": 1,
+        "tenantName": "T1",
+        "thingTypeCode": "TT1",
+        "thingTypeName": "ThingType1",
+    }
+    return mock_page_config_response | {
+        "pageMap": {"2": page},
+        "thingMap": {"10": thing},
+    }
+
+
 @pytest.fixture
 def mock_realtime_data_response():
     return [
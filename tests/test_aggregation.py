@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.endpoint import FebosEndpoint
+from febos.get_historical_data import GetHistoricalDataEndpoint
+
+np = pytest.importorskip("numpy")
+
+from febos.aggregation import (Resampler, aresample_chunks, lttb, resample,
+                               resample_chunks)
+from febos.columnar import HistoricalDataColumns, decode_historical_data
+
+GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
+
+
+def _columns(ts, values):
+    return HistoricalDataColumns(
+        deviceId=1,
+        thingId=2,
+        groupCode="G",
+        codes=["A", "B"],
+        ts=np.array(ts, dtype="datetime64[ms]"),
+        values=np.array(values, dtype=np.float64),
+    )
+
+
+def test_resample_aggregates():
+    columns = _columns(
+        [
+            "2026-02-11T00:10:00",
+            "2026-02-11T00:40:00",
+            "2026-02-11T00:20:00",
+            "2026-02-11T02:05:00",
+        ],
+        [[1, np.nan], [3, 5], [2, np.nan], [7, np.nan]],
+    )
+    hourly = resample(columns, timedelta(hours=1), how="mean")
+    assert (
+        hourly.ts.tolist()
+        == np.array(
+            ["2026-02-11T00:00:00", "2026-02-11T02:00:00"], dtype="datetime64[ms]"
+        ).tolist()
+    )
+    assert hourly.column("A").tolist() == [2.0, 7.0]
+    assert hourly.values[0, 1] == 5.0
+    assert np.isnan(hourly.values[1, 1])
+    assert resample(columns, timedelta(hours=1), "min").column("A").tolist() == [1, 7]
+    assert resample(columns, timedelta(hours=1), "max").column("A").tolist() == [3, 7]
+    # Latest valid value by timestamp, not by position in the input
+    assert resample(columns, timedelta(hours=1), "last").column("A").tolist() == [3, 7]
+    assert resample(columns, timedelta(hours=1), "count").values.tolist() == [
+        [3, 1],
+        [1, 0],
+    ]
+    with pytest.raises(ValueError):
+        resample(columns, timedelta(hours=1), "median")
+
+
+def test_resampler_merges_chunks_like_single_pass():
+    rng = np.random.default_rng(1)
+    ts = np.arange(
+        np.datetime64("2026-02-01T00:00:00"),
+        np.datetime64("2026-02-03T00:00:00"),
+        np.timedelta64(5, "m"),
+    ).astype("datetime64[ms]")
+    values = rng.normal(size=(len(ts), 2))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    whole = _columns(ts, values)
+
+    resampler = Resampler(timedelta(hours=7))
+    for start in range(0, len(ts), 100):
+        resampler.feed([_columns(ts[start : start + 100], values[start : start + 100])])
+    for how in ("min", "max", "mean", "last", "count"):
+        merged = resampler.result(how)[0]
+        expected = resample(whole, timedelta(hours=7), how)
+        assert (merged.ts == expected.ts).all()
+        np.testing.assert_allclose(merged.values, expected.values)
+
+
+@respx.mock
+def test_resample_chunks(client, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    chunks = endpoint.iter_chunks(client=client, chunk=timedelta(hours=6))
+    result = resample_chunks(chunks, timedelta(days=1), how="max")
+    assert len(result) == 1
+    assert result[0].groupCode == "FB-GRAPH-DATA@D9551@T31115"
+    assert result[0].values.tolist() == [[195.0, 76.0, 151.0, 48.0, 205.0]]
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_aresample_chunks(async_client, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    chunks = endpoint.aiter_chunks(client=async_client)
+    result = await aresample_chunks(chunks, timedelta(hours=1), how="count")
+    assert result[0].values[:, 0].tolist() == [2.0, 1.0]
+
+
+def test_lttb(mock_get_historical_data_response):
+    ts = np.arange(1000).astype("datetime64[s]").astype("datetime64[ms]")
+    values = np.sin(np.arange(1000) / 50.0)
+    values[500] = 10.0  # a spike must survive downsampling
+    values[10] = np.nan
+    picked_ts, picked = lttb(ts, values, 50)
+    assert len(picked) == 50
+    assert picked_ts[0] == ts[0] and picked_ts[-1] == ts[-1]
+    assert (np.diff(picked_ts.astype(np.int64)) > 0).all()
+    assert 10.0 in picked
+    with pytest.raises(ValueError):
+        lttb(ts, values, 2)
+
+    columns = decode_historical_data(mock_get_historical_data_response)[0]
+    assert len(lttb(columns.ts, columns.column("R8750"), 10)[1]) == 3
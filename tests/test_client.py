@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+
+import pytest
+import respx
+from httpx import HTTPStatusError, Request, Response
+
+from febos import client as client_module
+from febos.client import (COLLECTOR, HTTP1_FALLBACK_CONNECTIONS,
+                          STREAM_EXTENSION, AsyncFebosClient,
+                          ConnectionSettings, FebosClient, alog_response,
+                          configure_logging, log_response)
+from febos.endpoint import FebosEndpoint
+from febos.error import AuthenticationError
+from febos.get_language import GetLanguageEndpoint
+from febos.login import LoginEndpoint
+
+GET_LANGUAGE_URL = f"{FebosEndpoint.API_URL}{GetLanguageEndpoint.URL}"
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_async_client_max_concurrency(mock_get_language_response):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Response(200, json=mock_get_language_response)
+
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    respx.get(url).mock(side_effect=handler)
+    async with AsyncFebosClient(max_concurrency=2) as client:
+        endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+        responses = await asyncio.gather(
+            *(endpoint.aget(client=client) for _ in range(8))
+        )
+    assert len(responses) == 8
+    assert peak == 2
+
+
+def test_async_client_defaults(monkeypatch):
+    monkeypatch.setenv("FEBOS_BASE_URL", "https://febos.example.com")
+    client = AsyncFebosClient()
+    assert str(client.base_url) == "https://febos.example.com"
+    assert client.headers["Accept"] == "application/json, text/plain, */*"
+    assert client.get_token() is None
+    client.set_token("abc")
+    assert client.get_token() == "abc"
+
+
+def test_log_response_skipped_unless_debug(caplog):
+    caplog.set_level(logging.WARNING, logger="febos.client")
+    request = Request("GET", "https://febos.example.com/api")
+    response = Response(200, content=iter([b"payload"]), request=request)
+    log_response(response)
+    assert not response.is_stream_consumed
+    assert not caplog.records
+
+
+def test_log_response_skips_streamed_body(caplog):
+    caplog.set_level(logging.DEBUG, logger="febos.client")
+    request = Request(
+        "GET", "https://febos.example.com/api", extensions={STREAM_EXTENSION: True}
+    )
+    response = Response(200, content=iter([b"payload"]), request=request)
+    log_response(response)
+    assert not response.is_stream_consumed
+    assert "Content: [streamed]" in caplog.records[-1].getMessage()
+
+
+@pytest.mark.anyio
+async def test_alog_response_skips_streamed_body(caplog):
+    caplog.set_level(logging.DEBUG, logger="febos.client")
+    request = Request(
+        "GET", "https://febos.example.com/api", extensions={STREAM_EXTENSION: True}
+    )
+    response = Response(200, content=iter([b"payload"]), request=request)
+    await alog_response(response)
+    assert not response.is_stream_consumed
+    assert "Content: [streamed]" in caplog.records[-1].getMessage()
+
+
+def test_log_response_truncates_and_redacts(caplog, monkeypatch):
+    monkeypatch.setattr(client_module, "LOG_BODY_LIMIT", 4)
+    caplog.set_level(logging.DEBUG, logger="febos.client")
+    request = Request("GET", "https://febos.example.com/api")
+    response = Response(
+        200,
+        content=b"0123456789",
+        headers={"Authorization": "Bearer secret"},
+        request=request,
+    )
+    log_response(response)
+    message = caplog.records[-1].getMessage()
+    assert "0123... [6 more bytes]" in message
+    assert "secret" not in message
+    assert "[REDACTED]" in message
+
+
+def test_configure_logging(monkeypatch):
+    monkeypatch.setattr(client_module, "LOG_BODY_LIMIT", 2048)
+    monkeypatch.setattr(client_module, "REDACTED_HEADERS", frozenset())
+    configure_logging(body_limit=None, redact_headers=["X-Api-Key"])
+    assert client_module.LOG_BODY_LIMIT is None
+    assert client_module.REDACTED_HEADERS == frozenset({"x-api-key"})
+
+
+LOGIN_URL = f"{FebosEndpoint.API_URL}{LoginEndpoint.URL}"
+
+
+def _token_handler(payload):
+    def handler(request):
+        if request.headers.get("Authorization") != "Bearer fresh":
+            return Response(401)
+        return Response(200, json=payload)
+
+    return handler
+
+
+@respx.mock
+def test_client_relogin_on_401(client, mock_get_language_response):
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    data = respx.get(url).mock(side_effect=_token_handler(mock_get_language_response))
+    login = respx.post(LOGIN_URL).mock(
+        return_value=Response(200, json={}, headers={"Authorization": "fresh"})
+    )
+    client.set_token("expired")
+    client.set_credentials("user", "secret")
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    assert endpoint.get(client=client)
+    assert login.call_count == 1
+    assert data.call_count == 2
+    assert json.loads(login.calls[0].request.content) == {
+        "username": "user",
+        "password": "secret",
+    }
+    assert client.get_token() == "fresh"
+
+
+@respx.mock
+def test_client_relogin_failure(client):
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    respx.get(url).mock(return_value=Response(401))
+    respx.post(LOGIN_URL).mock(return_value=Response(401))
+    client.set_credentials("user", "wrong")
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    with pytest.raises(AuthenticationError):
+        endpoint.get(client=client)
+
+
+@respx.mock
+def test_client_without_credentials_does_not_relogin(client):
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    respx.get(url).mock(return_value=Response(401))
+    login = respx.post(LOGIN_URL)
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    with pytest.raises(HTTPStatusError):
+        endpoint.get(client=client)
+    assert not login.called
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_async_client_concurrent_relogin(
+    async_client, mock_get_language_response
+):
+    async def login_handler(request):
+        await asyncio.sleep(0.01)
+        return Response(200, json={}, headers={"Authorization": "fresh"})
+
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    respx.get(url).mock(side_effect=_token_handler(mock_get_language_response))
+    login = respx.post(LOGIN_URL).mock(side_effect=login_handler)
+    async_client.set_token("expired")
+    async_client.set_credentials("user", "secret")
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    responses = await asyncio.gather(
+        *(endpoint.aget(client=async_client) for _ in range(5))
+    )
+    assert len(responses) == 5
+    assert login.call_count == 1
+
+
+def test_client_connection_settings():
+    settings = ConnectionSettings(max_connections=7, max_keepalive_connections=3)
+    with FebosClient(connection=settings) as client:
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+
+
+def test_client_http2_falls_back_without_h2(monkeypatch, caplog):
+    monkeypatch.setattr(client_module.importlib.util, "find_spec", lambda name: None)
+    with caplog.at_level(logging.WARNING, logger="febos.client"):
+        client = AsyncFebosClient(connection=COLLECTOR)
+    assert "HTTP/2 requested" in caplog.text
+    assert client._transport._pool._http2 is False
+    # Without multiplexing the small HTTP/2 pool would queue requests
+    pool = client._transport._pool
+    assert pool._max_connections == HTTP1_FALLBACK_CONNECTIONS
+    assert pool._max_keepalive_connections == HTTP1_FALLBACK_CONNECTIONS
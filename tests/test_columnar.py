@@ -0,0 +1,106 @@
+import math
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.endpoint import FebosEndpoint
+from febos.get_data_analysis import GetDataAnalysisEndpoint
+from febos.get_historical_data import GetHistoricalDataEndpoint
+
+np = pytest.importorskip("numpy")
+
+from febos.columnar import decode_data_analysis, decode_historical_data
+
+GET_DATA_ANALYSIS_URL = f"{FebosEndpoint.API_URL}{GetDataAnalysisEndpoint.URL}"
+GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
+
+
+def test_decode_historical_data(mock_get_historical_data_response):
+    columns = decode_historical_data(mock_get_historical_data_response)
+    assert len(columns) == 1
+    entry = columns[0]
+    assert entry.deviceId == 9551
+    assert entry.codes == ["R8750", "R8751", "R8752", "R8753", "R8754"]
+    assert entry.ts.dtype == np.dtype("datetime64[ms]")
+    assert entry.ts[0] == np.datetime64("2026-02-11T01:03:18")
+    assert entry.values.shape == (3, 5)
+    assert entry.values.dtype == np.float64
+    assert entry.column("R8752").tolist() == [146.0, 145.0, 151.0]
+
+
+def test_decode_historical_data_nulls():
+    content = (
+        b'[{"deviceId": 1, "thingId": 2, "groupCode": "G", '
+        b'"inputArray": [{"code": "A"}, {"code": "B"}], '
+        b'"data": [{"ts": "2026-02-11T00:00:00", "vs": ["1.5", ""]}, '
+        b'{"ts": "2026-02-11T00:05:00", "vs": [null, "---"]}]}]'
+    )
+    entry = decode_historical_data(content)[0]
+    assert entry.values[0, 0] == 1.5
+    assert math.isnan(entry.values[0, 1])
+    assert np.isnan(entry.values[1]).all()
+    with pytest.raises(KeyError):
+        entry.column("C")
+
+
+@respx.mock
+def test_get_historical_data_get_columnar(client, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    columns = endpoint.get_columnar(client=client)
+    assert len(columns[0]) == 3
+    assert columns[0].values[2, 0] == 195.0
+
+
+def test_decode_data_analysis(mock_get_data_analysis_response):
+    rows = mock_get_data_analysis_response + [{"ts": "2026-02-11 12:00:00", "X1": 2}]
+    columns = decode_data_analysis(rows)
+    assert len(columns) == 3
+    assert columns.codes[0] == "R8765"
+    assert columns.codes[-1] == "X1"
+    assert columns.ts[0] == np.datetime64("2026-02-11T23:33:43")
+    assert columns.column("R8765").tolist()[:2] == [0.0, 0.0]
+    assert np.isnan(columns.column("R8774")).all()
+    assert np.isnan(columns.column("R8765")[2])
+    assert columns.column("X1")[2] == 2.0
+
+    records = columns.to_records()
+    assert records.dtype.names == ("ts", *columns.codes)
+    assert records[2]["X1"] == 2.0
+
+
+def test_data_analysis_columns_to_arrow(mock_get_data_analysis_response, tmp_path):
+    pytest.importorskip("pyarrow")
+    columns = decode_data_analysis(mock_get_data_analysis_response)
+    table = columns.to_arrow()
+    assert table.column_names == ["ts", *columns.codes]
+    assert table.num_rows == 2
+    # `---` lands as null, not NaN
+    assert table.column("R8774").null_count == 2
+    assert table.column("R8765").null_count == 0
+    columns.to_parquet(tmp_path / "analysis.parquet")
+    assert (tmp_path / "analysis.parquet").stat().st_size > 0
+
+
+@respx.mock
+def test_get_data_analysis_get_columnar(client, mock_get_data_analysis_response):
+    url = GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)
+    respx.get(url).mock(return_value=Response(200, json=mock_get_data_analysis_response))
+    endpoint = GetDataAnalysisEndpoint(
+        installation_id=7593,
+        device_id=9551,
+        from_ts="2026-02-11 00:00:00",
+        to_ts="2026-02-11 23:59:00",
+    )
+    columns = endpoint.get_columnar(client=client)
+    assert len(columns) == 2
+    assert len(columns.codes) == 10
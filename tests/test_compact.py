@@ -0,0 +1,113 @@
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.compact import (DataAnalysisRow, HistoricalPoint,
+                           parse_data_analysis, parse_historical,
+                           parse_realtime)
+from febos.data_model import (GetDataAnalysisGetResponse,
+                              HistoricalDataGetResponse,
+                              RealtimeDataGetResponse)
+from febos.endpoint import FebosEndpoint
+from febos.get_data_analysis import GetDataAnalysisEndpoint
+from febos.get_historical_data import GetHistoricalDataEndpoint
+from febos.realtime_data import RealtimeDataEndpoint
+
+GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
+GET_DATA_ANALYSIS_URL = f"{FebosEndpoint.API_URL}{GetDataAnalysisEndpoint.URL}"
+REALTIME_DATA_URL = f"{FebosEndpoint.API_URL}{RealtimeDataEndpoint.URL}"
+
+
+def test_compact_round_trip(
+    mock_get_historical_data_response,
+    mock_get_data_analysis_response,
+    mock_realtime_data_response,
+):
+    blocks = parse_historical(json.dumps(mock_get_historical_data_response))
+    assert blocks[0].codes == ["R8750", "R8751", "R8752", "R8753", "R8754"]
+    assert blocks[0].data[0] == HistoricalPoint(
+        "2026-02-11T01:03:18", ("194", "74", "146", "48", "205")
+    )
+    assert HistoricalDataGetResponse(
+        [block.to_model() for block in blocks]
+    ) == HistoricalDataGetResponse.model_validate(mock_get_historical_data_response)
+
+    rows = parse_data_analysis(json.dumps(mock_get_data_analysis_response))
+    assert rows[0].ts == "2026-02-11 23:33:43"
+    assert rows[0].values["R8774"] == "---"
+    assert GetDataAnalysisGetResponse(
+        [row.to_model() for row in rows]
+    ) == GetDataAnalysisGetResponse.model_validate(mock_get_data_analysis_response)
+
+    records = parse_realtime(json.dumps(mock_realtime_data_response))
+    assert records[0].data["temp"].i == 22.5
+    assert RealtimeDataGetResponse(
+        [record.to_model() for record in records]
+    ) == RealtimeDataGetResponse.model_validate(mock_realtime_data_response)
+
+
+def test_compact_invalid():
+    with pytest.raises(ValueError):
+        parse_historical(b'[{"deviceId": "x"}]')
+    with pytest.raises(ValueError):
+        parse_data_analysis(b'[{"R8765": "0"}]')
+    assert parse_data_analysis(b"[]") == []
+
+
+@respx.mock
+def test_get_compact(
+    client,
+    mock_get_historical_data_response,
+    mock_get_data_analysis_response,
+    mock_realtime_data_response,
+):
+    respx.get(GET_HISTORICAL_DATA_URL.format(installation_id=7593)).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    respx.get(GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)).mock(
+        return_value=Response(200, json=mock_get_data_analysis_response)
+    )
+    respx.get(REALTIME_DATA_URL.format(installation_id=101)).mock(
+        return_value=Response(200, json=mock_realtime_data_response)
+    )
+    blocks = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    ).get_compact(client=client)
+    assert len(blocks[0].data) == 3
+    rows = GetDataAnalysisEndpoint(installation_id=7593, device_id=9551).get_compact(
+        client=client
+    )
+    assert isinstance(rows[0], DataAnalysisRow)
+    records = RealtimeDataEndpoint(
+        installation_id=101, input_group_list=["F_GENERAL"]
+    ).get_compact(client=client)
+    assert records[0].deviceId == 789
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_aget_compact(
+    async_client, mock_get_historical_data_response, mock_realtime_data_response
+):
+    respx.get(GET_HISTORICAL_DATA_URL.format(installation_id=7593)).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    respx.get(REALTIME_DATA_URL.format(installation_id=101)).mock(
+        return_value=Response(200, json=mock_realtime_data_response)
+    )
+    blocks = await GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    ).aget_compact(client=async_client)
+    assert blocks[0].data[-1].ts == "2026-02-11T23:33:43"
+    records = await RealtimeDataEndpoint(
+        installation_id=101, input_group_list=["F_GENERAL"]
+    ).aget_compact(client=async_client)
+    assert records[0].groupCode == "F_GENERAL"
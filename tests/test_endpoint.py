@@ -0,0 +1,41 @@
+from typing import ClassVar
+
+import pytest
+
+from febos.endpoint import FebosEndpoint
+from febos.get_language import GetLanguageEndpoint
+from febos.installation import InstallationEndpoint
+
+
+def test_endpoint_url_template_is_precompiled():
+    assert GetLanguageEndpoint._url_fields == ("installation_id", "device_id")
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    assert (
+        endpoint._url()
+        == f"{FebosEndpoint.API_URL}{GetLanguageEndpoint.URL}".format(
+            installation_id=100, device_id=789
+        )
+    )
+
+
+def test_endpoint_url_without_placeholders():
+    assert InstallationEndpoint._url_fields == ()
+    assert InstallationEndpoint()._url() == (
+        f"{FebosEndpoint.API_URL}{InstallationEndpoint.URL}"
+    )
+
+
+def test_endpoint_url_unknown_placeholder():
+    with pytest.raises(TypeError, match="unknown fields"):
+
+        class BrokenEndpoint(FebosEndpoint):
+            URL: ClassVar[str] = "/v1/{missing_id}"
+            REFERER: ClassVar[str] = "/page"
+
+
+def test_endpoint_referer_follows_base_url(client):
+    endpoint = InstallationEndpoint()
+    referer = endpoint._headers(client)["Referer"]
+    assert referer == str(client.base_url) + "/aq-iot-app-emmeti/auth/installation-list"
+    client.base_url = "https://febos.example.com"
+    assert endpoint._headers(client)["Referer"].startswith("https://febos.example.com")
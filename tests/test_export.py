@@ -0,0 +1,228 @@
+import copy
+import csv
+import io
+import json
+from datetime import timedelta
+
+import pytest
+import respx
+from httpx import Response
+
+from febos import cli
+from febos.client import FebosClient
+from febos.endpoint import FebosEndpoint
+from febos.export import export_historical, file_name
+from febos.get_historical_data import GetHistoricalDataEndpoint
+from febos.login import LoginEndpoint, LoginPostResponse
+from febos.token_store import FileTokenStore, StoredSession, session_key
+
+GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
+LOGIN_URL = f"{FebosEndpoint.API_URL}{LoginEndpoint.URL}"
+GROUP = "FB-GRAPH-DATA@D9551@T31115"
+HOST = "emmeti.aq-iot.net"
+
+
+def _endpoint():
+    return GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list=GROUP,
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+
+
+def test_file_name():
+    assert file_name(GROUP, "csv") == f"{GROUP}.csv"
+    assert file_name("A/B C", "parquet") == "A_B_C.parquet"
+
+
+@respx.mock
+def test_export_historical_csv(client, tmp_path, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    progress = []
+    stats = export_historical(
+        client,
+        _endpoint(),
+        tmp_path / "out",
+        chunk=timedelta(hours=12),
+        progress=lambda stats: progress.append((stats.chunks, stats.points)),
+    )
+    assert route.call_count == 2
+    # The second chunk returns the same points, which are dropped
+    assert progress == [(1, 3), (2, 3)]
+    assert stats.total_chunks == 2
+    assert stats.files == {GROUP: tmp_path / "out" / f"{GROUP}.csv"}
+
+    with open(stats.files[GROUP], newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["ts", "R8750", "R8751", "R8752", "R8753", "R8754"]
+    assert rows[1] == ["2026-02-11T01:03:18", "194", "74", "146", "48", "205"]
+    assert len(rows) == 4
+
+
+@respx.mock
+def test_export_historical_parquet(client, tmp_path, mock_get_historical_data_response):
+    pytest.importorskip("numpy")
+    pq = pytest.importorskip("pyarrow.parquet")
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    stats = export_historical(client, _endpoint(), tmp_path, fmt="parquet")
+    table = pq.read_table(stats.files[GROUP])
+    assert table.num_rows == 3
+    assert table.column("R8750").to_pylist() == [194.0, 193.0, 195.0]
+
+
+def _second_chunk(response, codes, vs):
+    """Return a second-half chunk of `response` with one point of `codes`."""
+    second = copy.deepcopy(response)
+    second[0]["inputArray"] = [{"code": code} for code in codes]
+    second[0]["data"] = [{"ts": "2026-02-11T23:38:43", "vs": vs}]
+    return second
+
+
+@respx.mock
+def test_export_historical_csv_reordered_codes(
+    client, tmp_path, mock_get_historical_data_response
+):
+    second = _second_chunk(
+        mock_get_historical_data_response,
+        ["R8754", "R8753", "R8752", "R8751", "R8750"],
+        ["206", "49", "152", "77", "196"],
+    )
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url, params={"time_from": "2026-02-11 00:00:00"}).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    respx.get(url).mock(return_value=Response(200, json=second))
+    stats = export_historical(client, _endpoint(), tmp_path, chunk=timedelta(hours=12))
+
+    with open(stats.files[GROUP], newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["ts", "R8750", "R8751", "R8752", "R8753", "R8754"]
+    assert rows[-1] == ["2026-02-11T23:38:43", "196", "77", "152", "49", "206"]
+    assert len(rows) == 5
+
+
+@respx.mock
+def test_export_historical_csv_changed_codes(
+    client, tmp_path, mock_get_historical_data_response
+):
+    second = _second_chunk(
+        mock_get_historical_data_response,
+        ["R8750", "R8751", "R8752", "R8753", "R8755"],
+        ["196", "77", "152", "49", "206"],
+    )
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url, params={"time_from": "2026-02-11 00:00:00"}).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    respx.get(url).mock(return_value=Response(200, json=second))
+    with pytest.raises(ValueError, match="changed between chunks"):
+        export_historical(client, _endpoint(), tmp_path, chunk=timedelta(hours=12))
+
+
+def test_export_historical_unknown_format(client, tmp_path):
+    with pytest.raises(ValueError, match="fmt must be one of"):
+        export_historical(client, _endpoint(), tmp_path, fmt="xlsx")
+
+
+@respx.mock
+def test_cli_export(
+    client,
+    tmp_path,
+    capsys,
+    monkeypatch,
+    mock_login_response,
+    mock_get_historical_data_response,
+):
+    monkeypatch.setenv("FEBOS_PASSWORD", "pass")
+    respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "token"}
+        )
+    )
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    argv += ["-o", str(tmp_path), "-u", "user"]
+    assert cli.main(argv, client=client) == 0
+    out, err = capsys.readouterr()
+    assert out.strip() == str(tmp_path / f"{GROUP}.csv")
+    assert "chunk 1/1: 3 points" in err
+    assert "Exported 3 points of 1 input groups" in err
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@respx.mock
+def test_cli_export_stored_session(
+    tmp_path,
+    capsys,
+    monkeypatch,
+    mock_login_response,
+    mock_get_historical_data_response,
+):
+    monkeypatch.delenv("FEBOS_PASSWORD", raising=False)
+    store = FileTokenStore(tmp_path / "tokens.json")
+    login = LoginPostResponse.model_validate(mock_login_response)
+    store.save(session_key(HOST, "user"), StoredSession("stored", login))
+    login_route = respx.post(LOGIN_URL)
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    argv += ["-o", str(tmp_path), "-u", "user", "-q"]
+    # No password and no terminal: the stored session is enough
+    assert cli.main(argv, client=FebosClient(token_store=store)) == 0
+    assert not login_route.called
+    assert route.calls.last.request.headers["Authorization"] == "Bearer stored"
+
+
+def test_cli_export_no_terminal(client, capsys, monkeypatch):
+    monkeypatch.delenv("FEBOS_PASSWORD", raising=False)
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    assert cli.main(argv + ["-u", "user"], client=client) == 1
+    assert "febos: error: Password missing" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option", [["--workers", "0"], ["--chunk-hours", "-1"]])
+def test_cli_export_invalid_ranges(client, capsys, option):
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    with pytest.raises(SystemExit):
+        cli.main(argv + option, client=client)
+    assert "must be positive" in capsys.readouterr().err
+
+
+@respx.mock
+def test_cli_export_error(client, capsys, monkeypatch):
+    monkeypatch.delenv("FEBOS_PASSWORD", raising=False)
+    monkeypatch.setattr("sys.stdin", _Terminal())
+    prompts = []
+    monkeypatch.setattr(
+        cli.getpass, "getpass", lambda prompt: prompts.append(prompt) or "wrong"
+    )
+    route = respx.post(LOGIN_URL).mock(return_value=Response(401))
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    assert cli.main(argv + ["-u", "user"], client=client) == 1
+    assert prompts == ["Febos password: "]
+    assert json.loads(route.calls.last.request.content)["password"] == "wrong"
+    assert "febos: error:" in capsys.readouterr().err
+
+
+def test_cli_export_no_password_flag(client, capsys):
+    argv = ["export", "7593", GROUP, "2026-02-11 00:00:00", "2026-02-11 23:59:59"]
+    with pytest.raises(SystemExit):
+        cli.main(argv + ["-u", "user", "-p", "pass"], client=client)
+    assert "unrecognized arguments: -p pass" in capsys.readouterr().err
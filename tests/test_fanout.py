@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.endpoint import FebosEndpoint
+from febos.fanout import afan_out, fan_out
+from febos.get_language import GetLanguageEndpoint
+
+GET_LANGUAGE_URL = f"{FebosEndpoint.API_URL}{GetLanguageEndpoint.URL}"
+
+
+def language_endpoint(key):
+    installation_id, device_id = key
+    return GetLanguageEndpoint(installation_id=installation_id, device_id=device_id)
+
+
+def mock_gated_languages(payload, installation_ids, failing=()):
+    """Mock languages answered only once the test sets their gate event."""
+    state = {"in_flight": 0, "peak": 0}
+    started = {installation_id: asyncio.Event() for installation_id in installation_ids}
+    gates = {installation_id: asyncio.Event() for installation_id in installation_ids}
+
+    def route(installation_id):
+        async def handler(request):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            started[installation_id].set()
+            await gates[installation_id].wait()
+            state["in_flight"] -= 1
+            if installation_id in failing:
+                return Response(500)
+            return Response(200, json=payload)
+
+        return handler
+
+    for installation_id in installation_ids:
+        url = GET_LANGUAGE_URL.format(installation_id=installation_id, device_id=1)
+        respx.get(url).mock(side_effect=route(installation_id))
+    return state, started, gates
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_afan_out_yields_in_completion_order(
+    async_client, mock_get_language_response
+):
+    state, started, gates = mock_gated_languages(
+        mock_get_language_response, [1, 2, 3, 4], failing={3}
+    )
+    order = [2, 3, 4, 1]
+
+    async def release_first():
+        # Both slots are taken before the first request completes
+        await started[1].wait()
+        await started[2].wait()
+        gates[order[0]].set()
+
+    releaser = asyncio.create_task(release_first())
+    keys = [(installation_id, 1) for installation_id in gates]
+    results = []
+    async for result in afan_out(async_client, language_endpoint, keys, limit=2):
+        results.append(result)
+        # Complete the next request only once the previous one was yielded
+        if len(results) < len(order):
+            gates[order[len(results)]].set()
+    await releaser
+
+    assert [result.key for result in results] == [(2, 1), (3, 1), (4, 1), (1, 1)]
+    assert state["peak"] == 2
+    failed = [result for result in results if not result.ok]
+    assert [result.key for result in failed] == [(3, 1)]
+    assert failed[0].value is None
+    assert all(result.value is not None for result in results if result.ok)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_afan_out_early_exit_cancels_pending(
+    async_client, mock_get_language_response
+):
+    _, _, gates = mock_gated_languages(mock_get_language_response, [1, 2, 3])
+    gates[1].set()
+    keys = [(installation_id, 1) for installation_id in gates]
+    before = asyncio.all_tasks()
+    results = afan_out(async_client, language_endpoint, keys, limit=3)
+    async for result in results:
+        assert result.key == (1, 1)
+        break
+    await results.aclose()
+    # The cancelled requests have finished, none is left pending
+    assert asyncio.all_tasks() <= before
+
+
+@respx.mock
+def test_fan_out_reports_errors_per_item(client, mock_get_language_response):
+    for installation_id in (1, 2, 3):
+        url = GET_LANGUAGE_URL.format(installation_id=installation_id, device_id=1)
+        status = 404 if installation_id == 2 else 200
+        respx.get(url).mock(
+            return_value=Response(status, json=mock_get_language_response)
+        )
+    results = {
+        result.key: result
+        for result in fan_out(
+            client, language_endpoint, ((i, 1) for i in (1, 2, 3)), limit=2
+        )
+    }
+    assert set(results) == {(1, 1), (2, 1), (3, 1)}
+    assert results[(1, 1)].ok and results[(3, 1)].ok
+    assert not results[(2, 1)].ok
@@ -1,6 +1,6 @@
 import pytest
 import respx
-from httpx import Response
+from httpx import HTTPStatusError, Response
 
 from febos.endpoint import FebosEndpoint
 from febos.get_data_analysis import GetDataAnalysisEndpoint
@@ -33,3 +33,58 @@ def test_get_data_analysis_http_error(client):
     endpoint = GetDataAnalysisEndpoint(installation_id=7593, device_id=9551)
     with pytest.raises(Exception):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_data_analysis_aget_success(
+    async_client, mock_get_data_analysis_response
+):
+    url = GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_data_analysis_response)
+    )
+    endpoint = GetDataAnalysisEndpoint(
+        installation_id=7593, device_id=9551, from_ts="2026-02-11 00:00:00"
+    )
+    response = await endpoint.aget(client=async_client)
+    request = route.calls.last.request
+    assert request.url.params["from"] == "2026-02-11 00:00:00"
+    assert "to" not in request.url.params
+    assert len(response.root) == len(mock_get_data_analysis_response)
+
+
+@respx.mock
+def test_get_data_analysis_stream(client, mock_get_data_analysis_response):
+    url = GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_data_analysis_response)
+    )
+    endpoint = GetDataAnalysisEndpoint(installation_id=7593, device_id=9551)
+    entries = list(endpoint.stream(client=client))
+    assert [entry.ts for entry in entries] == [
+        row["ts"] for row in mock_get_data_analysis_response
+    ]
+
+
+@respx.mock
+def test_get_data_analysis_stream_http_error(client):
+    url = GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)
+    respx.get(url).mock(return_value=Response(500))
+    endpoint = GetDataAnalysisEndpoint(installation_id=7593, device_id=9551)
+    with pytest.raises(HTTPStatusError):
+        list(endpoint.stream(client=client))
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_data_analysis_astream(
+    async_client, mock_get_data_analysis_response
+):
+    url = GET_DATA_ANALYSIS_URL.format(installation_id=7593, device_id=9551)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_data_analysis_response)
+    )
+    endpoint = GetDataAnalysisEndpoint(installation_id=7593, device_id=9551)
+    entries = [entry async for entry in endpoint.astream(client=async_client)]
+    assert len(entries) == len(mock_get_data_analysis_response)
@@ -25,3 +25,13 @@ def test_get_febos_slave_get_http_error(client):
     endpoint = GetFebosSlaveEndpoint(installation_id=100, device_id=200)
     with pytest.raises(HTTPStatusError):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_febos_slave_aget_success(async_client, mock_slave_response):
+    url = GET_FEBOS_SLAVE_URL.format(installation_id=100, device_id=200)
+    respx.get(url).mock(return_value=Response(200, json=mock_slave_response))
+    endpoint = GetFebosSlaveEndpoint(installation_id=100, device_id=200)
+    response = await endpoint.aget(client=async_client)
+    assert response.root[0].nomeSlave == "Living"
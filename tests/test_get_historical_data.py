@@ -1,9 +1,15 @@
+import asyncio
+import json
+import logging
+from datetime import timedelta
+
 import pytest
 import respx
 from httpx import Response
 
 from febos.endpoint import FebosEndpoint
-from febos.get_historical_data import GetHistoricalDataEndpoint
+from febos.get_historical_data import (GetHistoricalDataEndpoint,
+                                       split_time_range)
 
 GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
 
@@ -42,3 +48,198 @@ def test_get_historical_data_http_error(client):
     )
     with pytest.raises(Exception):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_historical_data_aget_success(
+    async_client, mock_get_historical_data_response
+):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    response = await endpoint.aget(client=async_client)
+    request = route.calls.last.request
+    assert request.url.params["time_from"] == "2026-02-11 00:00:00"
+    assert request.url.params["time_to"] == "2026-02-11 23:59:59"
+    assert len(response.root[0].data) == len(
+        mock_get_historical_data_response[0]["data"]
+    )
+
+
+def _chunk_response(request):
+    time_from = request.url.params["time_from"]
+    time_to = request.url.params["time_to"]
+    return Response(
+        200,
+        json=[
+            {
+                "deviceId": 9551,
+                "thingId": 31115,
+                "groupCode": "FB-GRAPH-DATA@D9551@T31115",
+                "inputArray": [{"code": "R8750"}],
+                "data": [
+                    {"ts": time_to.replace(" ", "T"), "vs": ["2"]},
+                    {"ts": time_from.replace(" ", "T"), "vs": ["1"]},
+                ],
+            }
+        ],
+    )
+
+
+def test_split_time_range():
+    assert split_time_range(
+        "2026-02-01 00:00:00", "2026-02-03 12:00:00", timedelta(days=1)
+    ) == [
+        ("2026-02-01 00:00:00", "2026-02-02 00:00:00"),
+        ("2026-02-02 00:00:00", "2026-02-03 00:00:00"),
+        ("2026-02-03 00:00:00", "2026-02-03 12:00:00"),
+    ]
+    with pytest.raises(ValueError):
+        split_time_range("2026-02-01 00:00:00", "2026-02-02 00:00:00", timedelta(0))
+
+
+@respx.mock
+def test_get_historical_data_get_chunked(client):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(side_effect=_chunk_response)
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-01 00:00:00",
+        time_to="2026-02-04 00:00:00",
+    )
+    response = endpoint.get_chunked(client=client, chunk=timedelta(days=1))
+    assert route.call_count == 3
+    assert len(response.root) == 1
+    assert [point.ts for point in response.root[0].data] == [
+        "2026-02-01T00:00:00",
+        "2026-02-02T00:00:00",
+        "2026-02-03T00:00:00",
+        "2026-02-04T00:00:00",
+    ]
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_historical_data_aiter_chunks(async_client):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(side_effect=_chunk_response)
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-01 00:00:00",
+        time_to="2026-02-03 00:00:00",
+    )
+    chunks = [
+        chunk
+        async for chunk in endpoint.aiter_chunks(
+            client=async_client, chunk=timedelta(days=1), max_workers=2
+        )
+    ]
+    assert [[p.ts for p in c.root[0].data] for c in chunks] == [
+        ["2026-02-01T00:00:00", "2026-02-02T00:00:00"],
+        ["2026-02-03T00:00:00"],
+    ]
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_historical_data_aiter_chunks_early_exit(async_client):
+    blocked = asyncio.Event()
+
+    async def handler(request):
+        if request.url.params["time_from"] != "2026-02-01 00:00:00":
+            await blocked.wait()
+        return _chunk_response(request)
+
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(side_effect=handler)
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-01 00:00:00",
+        time_to="2026-02-04 00:00:00",
+    )
+    before = asyncio.all_tasks()
+    chunks = endpoint.aiter_chunks(
+        client=async_client, chunk=timedelta(days=1), max_workers=3
+    )
+    async for _ in chunks:
+        break
+    await chunks.aclose()
+    # The cancelled requests have finished, none is left pending
+    assert asyncio.all_tasks() <= before
+
+
+@respx.mock
+def test_get_historical_data_stream(client, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    entries = list(endpoint.stream(client=client, batch_size=2))
+    assert [len(entry.data) for entry in entries] == [2, 1]
+    assert entries[1].data[0].ts == "2026-02-11T23:33:43"
+
+
+@respx.mock
+def test_get_historical_data_stream_debug_logging(
+    client, caplog, mock_get_historical_data_response
+):
+    caplog.set_level(logging.DEBUG, logger="febos.client")
+    body = json.dumps(mock_get_historical_data_response).encode()
+    pulled = []
+
+    def chunks():
+        for i in range(0, len(body), 64):
+            pulled.append(i)
+            yield body[i : i + 64]
+
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(return_value=Response(200, content=chunks()))
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    entries = endpoint.stream(client=client, batch_size=1)
+    next(entries)
+    # The debug hook must not buffer the body before it is streamed
+    assert len(pulled) < -(-len(body) // 64)
+    entries.close()
+    assert "Content: [streamed]" in caplog.text
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_historical_data_astream(
+    async_client, mock_get_historical_data_response
+):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    endpoint = GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list="FB-GRAPH-DATA@D9551@T31115",
+        time_from="2026-02-11 00:00:00",
+        time_to="2026-02-11 23:59:59",
+    )
+    entries = [entry async for entry in endpoint.astream(client=async_client)]
+    assert len(entries) == 1
+    assert len(entries[0].data) == 3
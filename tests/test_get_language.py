@@ -28,3 +28,13 @@ def test_get_language_get_http_error(client):
     endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
     with pytest.raises(Exception):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_language_aget_success(async_client, mock_get_language_response):
+    url = GET_LANGUAGE_URL.format(installation_id=100, device_id=789)
+    respx.get(url).mock(return_value=Response(200, json=mock_get_language_response))
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    response = await endpoint.aget(client=async_client)
+    assert response.ID_language == mock_get_language_response["ID_language"]
@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.endpoint import FebosEndpoint
+from febos.get_historical_data import GetHistoricalDataEndpoint
+from febos.history_store import HistoryStore, merge_ranges, missing_ranges
+
+GET_HISTORICAL_DATA_URL = f"{FebosEndpoint.API_URL}{GetHistoricalDataEndpoint.URL}"
+GROUP = "FB-GRAPH-DATA@D9551@T31115"
+
+
+def _endpoint(time_from="2026-02-11 00:00:00", time_to="2026-02-11 23:59:59"):
+    return GetHistoricalDataEndpoint(
+        installation_id=7593,
+        input_group_list=GROUP,
+        time_from=time_from,
+        time_to=time_to,
+    )
+
+
+def test_missing_ranges():
+    synced = [("2026-02-11 00:00:00", "2026-02-11 06:00:00")]
+    synced.append(("2026-02-11 12:00:00", "2026-02-11 18:00:00"))
+    assert missing_ranges(synced, "2026-02-11 00:00:00", "2026-02-11 06:00:00") == []
+    assert missing_ranges(synced, "2026-02-10 00:00:00", "2026-02-12 00:00:00") == [
+        ("2026-02-10 00:00:00", "2026-02-11 00:00:00"),
+        ("2026-02-11 06:00:00", "2026-02-11 12:00:00"),
+        ("2026-02-11 18:00:00", "2026-02-12 00:00:00"),
+    ]
+    assert missing_ranges([], "2026-02-11 00:00:00", "2026-02-11 01:00:00") == [
+        ("2026-02-11 00:00:00", "2026-02-11 01:00:00")
+    ]
+    assert merge_ranges(synced + [("2026-02-11 06:00:00", "2026-02-11 12:00:00")]) == [
+        ("2026-02-11 00:00:00", "2026-02-11 18:00:00")
+    ]
+
+
+@respx.mock
+def test_history_store_serves_repeated_query_locally(
+    client, tmp_path, mock_get_historical_data_response
+):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    store = HistoryStore(tmp_path / "history.sqlite")
+    first = store.get(client=client, endpoint=_endpoint())
+    assert first == _endpoint().get(client=client)
+    route.reset()
+
+    # Also after a restart, from the database file only
+    restarted = HistoryStore(tmp_path / "history.sqlite")
+    assert restarted.get(client=client, endpoint=_endpoint()) == first
+    narrow = _endpoint("2026-02-11 01:05:00", "2026-02-11 23:59:59")
+    assert [
+        p.ts for p in restarted.get(client=client, endpoint=narrow).root[0].data
+    ] == [
+        "2026-02-11T01:08:18",
+        "2026-02-11T23:33:43",
+    ]
+    assert not route.called
+    assert restarted.last_synced(7593, GROUP) == "2026-02-11 23:59:59"
+
+
+@respx.mock
+def test_history_store_fetches_only_missing_ranges(
+    client, mock_get_historical_data_response
+):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    store = HistoryStore(":memory:")
+    store.get(client=client, endpoint=_endpoint())
+    route.reset()
+
+    wide = _endpoint("2026-02-10 00:00:00", "2026-02-12 23:59:59")
+    response = store.get(client=client, endpoint=wide)
+    assert len(response.root[0].data) == 3
+    assert [
+        (call.request.url.params["time_from"], call.request.url.params["time_to"])
+        for call in route.calls
+    ] == [
+        ("2026-02-10 00:00:00", "2026-02-11 00:00:00"),
+        ("2026-02-11 23:59:59", "2026-02-12 23:59:59"),
+    ]
+    assert store.get(client=client, endpoint=wide) == response
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_history_store_refetches_unsettled_tail(
+    client, mock_get_historical_data_response
+):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    # Every point is recent: only the range up to the last point is final
+    store = HistoryStore(":memory:", settle=timedelta(days=365 * 100))
+    store.get(client=client, endpoint=_endpoint())
+    assert store.last_synced(7593, GROUP) == "2026-02-11 23:33:43"
+
+    store.get(client=client, endpoint=_endpoint())
+    assert route.call_count == 2
+    assert route.calls.last.request.url.params["time_from"] == "2026-02-11 23:33:43"
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_history_store_aget(async_client, mock_get_historical_data_response):
+    url = GET_HISTORICAL_DATA_URL.format(installation_id=7593)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_get_historical_data_response)
+    )
+    store = HistoryStore(":memory:")
+    first = await store.aget(client=async_client, endpoint=_endpoint())
+    second = await store.aget(client=async_client, endpoint=_endpoint())
+    assert first == second
+    assert first.root[0].groupCode == GROUP
+    assert len(first.root[0].data) == 3
+    assert route.call_count == 1
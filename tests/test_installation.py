@@ -45,3 +45,15 @@ def test_installation_get_http_error(client):
     endpoint = InstallationEndpoint(pageStart=1, pageItems=10)
     with pytest.raises(HTTPStatusError):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_installation_aget_success(async_client, mock_installation_response):
+    route = respx.get(INSTALLATION_URL).mock(
+        return_value=Response(200, json=mock_installation_response)
+    )
+    endpoint = InstallationEndpoint(pageStart=1, pageItems=10)
+    response = await endpoint.aget(client=async_client)
+    assert isinstance(response, InstallationGetResponse)
+    assert route.calls.last.request.url.params["pageItems"] == "10"
@@ -0,0 +1,61 @@
+import copy
+
+import pytest
+
+from febos.data_model import PageConfigGetResponse
+from febos.installation_index import InputMeta, InstallationIndex
+
+
+@pytest.fixture
+def index(mock_page_config_with_inputs_response):
+    return InstallationIndex(
+        PageConfigGetResponse.model_validate(mock_page_config_with_inputs_response)
+    )
+
+
+def test_installation_index_maps(index):
+    assert index.devices[789].name == "Device1"
+    assert index.things[10].name == "Thing"
+    assert index.input_groups[(789, "F_GENERAL")].inputGroupId == 300
+    assert index.input_group("F_GENERAL", 789).inputGroupId == 300
+    assert index.input("R8765").id == 5001
+    assert index.input("R8766", device_id=789).id == 5002
+    assert index.meta[(789, "R8765")] == InputMeta(1, "°C", "-32768")
+    assert index.meta[(789, "R8766")] == InputMeta(None, "%", "-32768")
+    assert index.input_meta("R8765") == InputMeta(1, "°C", "-32768")
+    assert index.input_meta("R8765", device_id=789) == InputMeta(1, "°C", "-32768")
+    with pytest.raises(KeyError):
+        index.input_meta("R8765", device_id=1)
+
+
+def test_installation_index_resolve(index):
+    resolved = index.resolve("R8765")
+    assert resolved.input.code == "R8765"
+    assert resolved.group.inputGroupCode == "F_GENERAL"
+    assert resolved.widget.code == "W1"
+    assert resolved.device.id == 789
+    assert resolved.thing.id == 10
+    assert resolved.meta.measUnit == "°C"
+    with pytest.raises(KeyError):
+        index.resolve("R0000")
+    with pytest.raises(KeyError):
+        index.resolve("R8765", device_id=1)
+
+
+def test_installation_index_shared_codes(mock_page_config_with_inputs_response):
+    # A second device of the same model: same group and input codes, other
+    # scale
+    page_config = copy.deepcopy(mock_page_config_with_inputs_response)
+    widgets = page_config["pageMap"]["2"]["tabList"][0]["widgetList"]
+    group = copy.deepcopy(widgets[0]["widgetInputGroupList"][0])
+    group |= {"deviceId": 790, "inputGroupId": 301}
+    for item in group["inputList"]:
+        item |= {"deviceId": 790, "scale": 2}
+    widgets[0]["widgetInputGroupList"].append(group)
+    index = InstallationIndex(PageConfigGetResponse.model_validate(page_config))
+
+    assert index.input_group("F_GENERAL", 789).inputGroupId == 300
+    assert index.input_group("F_GENERAL", 790).inputGroupId == 301
+    assert index.input_meta("R8765", device_id=789).scale == 1
+    assert index.input_meta("R8765", device_id=790).scale == 2
+    assert index.resolve("R8765", device_id=790).group.inputGroupId == 301
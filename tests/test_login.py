@@ -41,3 +41,30 @@ def test_login_post_http_error(client):
     endpoint = LoginEndpoint(username="wrong", password="wrong")
     with pytest.raises(HTTPStatusError):
         endpoint.post(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_login_apost_success(async_client, mock_login_response):
+    respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "new-token"}
+        )
+    )
+    endpoint = LoginEndpoint(username="testuser", password="password123")
+    response = await endpoint.apost(client=async_client)
+    assert isinstance(response, LoginPostResponse)
+    assert async_client.get_token() == "new-token"
+
+
+@respx.mock
+def test_login_post_remember_credentials(client, mock_login_response):
+    respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "token"}
+        )
+    )
+    LoginEndpoint(username="user", password="pass").post(client=client)
+    assert (client.auth.username, client.auth.password) == ("user", "pass")
+    LoginEndpoint(username="other", password="x").post(client=client, remember=False)
+    assert client.auth.username == "user"
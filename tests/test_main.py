@@ -0,0 +1,160 @@
+import io
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+import main
+from febos.client import FebosClient
+from febos.endpoint import FebosEndpoint
+from febos.installation import InstallationEndpoint
+from febos.login import LoginEndpoint
+from febos.page_config import PageConfigEndpoint
+
+INSTALLATION_URL = f"{FebosEndpoint.API_URL}{InstallationEndpoint.URL}"
+LOGIN_URL = f"{FebosEndpoint.API_URL}{LoginEndpoint.URL}"
+PAGE_CONFIG_URL = f"{FebosEndpoint.API_URL}{PageConfigEndpoint.URL}"
+
+
+def _records(output):
+    """Return the JSON lines of a batch run, ordered by line number."""
+    lines = output.getvalue().splitlines()
+    return sorted((json.loads(line) for line in lines), key=lambda r: r["line"])
+
+
+@pytest.fixture
+def mock_login(mock_login_response):
+    return respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "token"}
+        )
+    )
+
+
+@respx.mock
+def test_run_batch_json_lines(
+    mock_login, mock_installation_response, mock_page_config_response
+):
+    respx.get(INSTALLATION_URL).mock(
+        return_value=Response(200, json=mock_installation_response)
+    )
+    respx.get(PAGE_CONFIG_URL.format(installation_id=7593)).mock(
+        return_value=Response(200, json=mock_page_config_response)
+    )
+    lines = ["# checks", "", "login user pass", "installation", "pageconfig 7593"]
+    output = io.StringIO()
+    status = main.FebosSession(FebosClient()).run_batch(lines, output=output)
+    assert status == 0
+
+    login, installation, pageconfig = _records(output)
+    assert login == {
+        "line": 3,
+        "command": "login user",
+        "ok": True,
+        "result": {"username": "testuser", "installationIdList": [101]},
+    }
+    assert installation["line"] == 4
+    assert installation["command"] == "installation"
+    assert installation["ok"] is True
+    assert installation["result"][0]["id"] == mock_installation_response[0]["id"]
+    assert pageconfig["line"] == 5
+    assert pageconfig["ok"] is True
+
+
+@respx.mock
+def test_run_batch_failed_login():
+    respx.post(LOGIN_URL).mock(return_value=Response(401))
+    route = respx.get(INSTALLATION_URL)
+    output = io.StringIO()
+    session = main.FebosSession(FebosClient())
+    assert session.run_batch(["login user wrong", "installation"], output=output) == 1
+
+    (record,) = _records(output)
+    assert record["line"] == 1
+    assert record["command"] == "login user"
+    assert record["ok"] is False
+    assert not route.called
+
+
+@respx.mock
+def test_run_batch_command_errors(mock_login, mock_installation_response):
+    respx.get(INSTALLATION_URL).mock(
+        return_value=Response(200, json=mock_installation_response)
+    )
+    lines = ["frobnicate", "pageconfig", "installation"]
+    output = io.StringIO()
+    session = main.FebosSession(FebosClient())
+    assert session.run_batch(lines, output=output, credentials=("u", "p")) == 1
+
+    login, unknown, arity, installation = _records(output)
+    assert login["line"] == 0
+    assert login["ok"] is True
+    assert unknown["ok"] is False
+    assert "Command not available in batch mode: 'frobnicate'" in unknown["error"]
+    assert arity["ok"] is False
+    assert "Wrong number of arguments for 'pageconfig'" in arity["error"]
+    assert installation["ok"] is True
+
+
+def test_run_batch_login_usage():
+    output = io.StringIO()
+    session = main.FebosSession(FebosClient())
+    assert session.run_batch(["login user"], output=output) == 1
+    (record,) = _records(output)
+    assert record["error"] == "Usage: login <username> <password>"
+
+
+def test_run_batch_not_authenticated():
+    output = io.StringIO()
+    session = main.FebosSession(FebosClient())
+    assert session.run_batch(["installation"], output=output) == 1
+    (record,) = _records(output)
+    assert record["ok"] is False
+    assert "Not authenticated" in record["error"]
+
+
+@respx.mock
+def test_main_batch(
+    tmp_path, capsys, monkeypatch, mock_login, mock_installation_response
+):
+    monkeypatch.setenv("FEBOS_PASSWORD", "pass")
+    respx.get(INSTALLATION_URL).mock(
+        return_value=Response(200, json=mock_installation_response)
+    )
+    batch = tmp_path / "checks.txt"
+    batch.write_text("installation\n", encoding="utf-8")
+    assert main.main(["--batch", str(batch), "-u", "user"]) == 0
+
+    assert json.loads(mock_login.calls.last.request.content)["password"] == "pass"
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["command"], r["ok"]) for r in records] == [
+        ("login user", True),
+        ("installation", True),
+    ]
+
+
+@respx.mock
+def test_main_batch_never_prompts(capsys, monkeypatch, mock_login):
+    monkeypatch.delenv("FEBOS_PASSWORD", raising=False)
+    monkeypatch.setattr(main.getpass, "getpass", pytest.fail)
+    stdin = io.StringIO("installation\n")
+    monkeypatch.setattr("sys.stdin", stdin)
+    assert main.main(["--batch", "-", "-u", "user"]) == 1
+
+    assert not mock_login.called
+    # The batch commands on stdin are left alone
+    assert stdin.read() == "installation\n"
+    (record,) = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert record == {
+        "line": 0,
+        "command": "login user",
+        "ok": False,
+        "error": "Password missing: set FEBOS_PASSWORD",
+    }
+
+
+def test_main_no_password_flag(capsys):
+    with pytest.raises(SystemExit):
+        main.parse_args(["--batch", "-", "-u", "user", "-p", "pass"])
+    assert "unrecognized arguments: -p pass" in capsys.readouterr().err
@@ -5,7 +5,7 @@ from httpx import HTTPStatusError, Response
 from febos.endpoint import FebosEndpoint
 from febos.page_config import PageConfigEndpoint
 
-PAGE_CONFIG_URL = f"{FebosEndpoint.API_URL}{PageConfig.URL}"
+PAGE_CONFIG_URL = f"{FebosEndpoint.API_URL}{PageConfigEndpoint.URL}"
 
 
 @respx.mock
@@ -29,3 +29,17 @@ def test_page_config_get_auth_error(client):
     endpoint = PageConfigEndpoint(installation_id=100)
     with pytest.raises(HTTPStatusError):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_page_config_aget_success(async_client, mock_page_config_response):
+    url = PAGE_CONFIG_URL.format(installation_id=100)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_page_config_response)
+    )
+    endpoint = PageConfigEndpoint(installation_id=100)
+    response = await endpoint.aget(client=async_client)
+    assert route.called
+    assert response.installation.id == 100
+    assert respx.calls.last.request.headers["Authorization"] == "Bearer fake-token"
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+import respx
+from httpx import ConnectError, HTTPStatusError, Response
+
+from febos.endpoint import FebosEndpoint
+from febos.page_config import PageConfigEndpoint
+from febos.page_config_cache import PageConfigCache
+
+PAGE_CONFIG_URL = f"{FebosEndpoint.API_URL}{PageConfigEndpoint.URL}"
+
+
+@respx.mock
+def test_page_config_cache_reload_from_disk(
+    client, tmp_path, mock_page_config_response
+):
+    url = PAGE_CONFIG_URL.format(installation_id=100)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_page_config_response)
+    )
+    config = PageConfigCache(tmp_path).get(client=client, installation_id=100)
+    assert config.installation.id == 100
+    assert (tmp_path / "100.json").exists()
+
+    # A new cache instance (e.g. after a restart) reads the disk copy only
+    restarted = PageConfigCache(tmp_path)
+    assert restarted.load(100) == config
+    assert restarted.get(client=client, installation_id=100) == config
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_page_config_cache_revalidates_with_etag(
+    client, tmp_path, mock_page_config_response
+):
+    url = PAGE_CONFIG_URL.format(installation_id=100)
+    route = respx.get(url).mock(
+        side_effect=[
+            Response(200, json=mock_page_config_response, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+    cache = PageConfigCache(tmp_path, ttl=0)
+    first = cache.get(client=client, installation_id=100)
+    fetched_at = cache._entries[100][1]["fetched_at"]
+    time.sleep(0.01)
+    second = cache.get(client=client, installation_id=100)
+    assert second is first
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+    assert cache._entries[100][1]["fetched_at"] > fetched_at
+
+
+@respx.mock
+def test_page_config_cache_errors(client, tmp_path, mock_page_config_response):
+    url = PAGE_CONFIG_URL.format(installation_id=100)
+    route = respx.get(url)
+    route.mock(return_value=Response(401))
+    cache = PageConfigCache(tmp_path, ttl=0)
+    with pytest.raises(HTTPStatusError):
+        cache.get(client=client, installation_id=100)
+
+    route.mock(return_value=Response(200, json=mock_page_config_response))
+    config = cache.get(client=client, installation_id=100)
+    route.mock(side_effect=ConnectError("unreachable"))
+    assert cache.get(client=client, installation_id=100) is config
+    cache.stale_if_error = False
+    with pytest.raises(ConnectError):
+        cache.get(client=client, installation_id=100)
+
+    cache.invalidate(100)
+    assert cache.load(100) is None
+    assert not (tmp_path / "100.json").exists()
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_page_config_cache_aget(
+    async_client, tmp_path, mock_page_config_response
+):
+    url = PAGE_CONFIG_URL.format(installation_id=100)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_page_config_response)
+    )
+    cache = PageConfigCache(tmp_path)
+    config = await cache.aget(client=async_client, installation_id=100)
+    assert await cache.aget(client=async_client, installation_id=100) is config
+    assert route.call_count == 1
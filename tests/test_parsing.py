@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from febos import parsing
+from febos.data_model import (HistoricalDataGetResponse,
+                              InstallationGetResponse, LoginPostResponse)
+from febos.parsing import parse_response, type_adapter
+
+
+def test_parse_response_root_model(mock_get_historical_data_response):
+    content = json.dumps(mock_get_historical_data_response).encode()
+    response = parse_response(HistoricalDataGetResponse, content)
+    assert isinstance(response, HistoricalDataGetResponse)
+    assert response == HistoricalDataGetResponse.model_validate(
+        mock_get_historical_data_response
+    )
+    assert type_adapter(HistoricalDataGetResponse) is type_adapter(
+        HistoricalDataGetResponse
+    )
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_parse_response_model(mock_login_response, trusted):
+    content = json.dumps(mock_login_response).encode()
+    response = parse_response(LoginPostResponse, content, trusted)
+    assert response == LoginPostResponse.model_validate(mock_login_response)
+
+
+def test_parse_response_trusted_falls_back_to_lax(
+    mock_installation_response, monkeypatch
+):
+    monkeypatch.setattr(parsing, "_LAX_MODELS", set())
+    # Strict mode rejects the string id, lax mode coerces it
+    payload = [mock_installation_response[0] | {"id": "101"}]
+    response = parse_response(
+        InstallationGetResponse, json.dumps(payload).encode(), trusted=True
+    )
+    assert response.root[0].id == 101
+    # The strict pass is not tried again for this model
+    assert InstallationGetResponse in parsing._LAX_MODELS
+
+
+def test_parse_response_invalid(mock_login_response):
+    content = json.dumps(mock_login_response | {"id": "x"}).encode()
+    for trusted in (False, True):
+        with pytest.raises(ValidationError):
+            parse_response(LoginPostResponse, content, trusted)
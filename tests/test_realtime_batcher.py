@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import HTTPStatusError, Response
+
+from febos.endpoint import FebosEndpoint
+from febos.realtime_batcher import RealtimeBatcher, split_input_groups
+from febos.realtime_data import RealtimeDataEndpoint
+
+REALTIME_DATA_URL = f"{FebosEndpoint.API_URL}{RealtimeDataEndpoint.URL}"
+
+
+def _realtime_response(request):
+    groups = request.url.params["input_group_list"].split(",")
+    if "BROKEN" in groups:
+        return Response(503)
+    return Response(
+        200,
+        json=[
+            {
+                "data": {f"{group}_code": {"i": 1}},
+                "deviceId": 789,
+                "groupCode": group,
+                "thingId": 10,
+                "ts": "2024-01-01T12:00:00Z",
+            }
+            for group in groups
+        ],
+    )
+
+
+def test_split_input_groups():
+    groups = [f"GROUP{i:02}" for i in range(10)]
+    assert split_input_groups(100, groups, 10_000) == [groups]
+    chunks = split_input_groups(100, groups, 80)
+    assert len(chunks) > 1
+    assert [g for chunk in chunks for g in chunk] == groups
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_batcher_coalesces_requests(async_client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    route = respx.get(url).mock(side_effect=_realtime_response)
+    batcher = RealtimeBatcher(async_client, window=0.01)
+    first, second, third = await asyncio.gather(
+        batcher.get(100, ["GR1"]),
+        batcher.get(100, ["GR2", "GR3"]),
+        batcher.get(100, ["GR1", "GR3"]),
+    )
+    assert route.call_count == 1
+    assert route.calls.last.request.url.params["input_group_list"] == "GR1,GR2,GR3"
+    assert [entry.groupCode for entry in first.root] == ["GR1"]
+    assert [entry.groupCode for entry in second.root] == ["GR2", "GR3"]
+    assert [entry.groupCode for entry in third.root] == ["GR1", "GR3"]
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_batcher_split_and_errors(async_client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    route = respx.get(url).mock(side_effect=_realtime_response)
+    batcher = RealtimeBatcher(async_client, window=0.01, max_url_length=0)
+    ok, broken = await asyncio.gather(
+        batcher.get(100, ["GR1"]),
+        batcher.get(100, ["BROKEN"]),
+        return_exceptions=True,
+    )
+    assert route.call_count == 2
+    assert [entry.groupCode for entry in ok.root] == ["GR1"]
+    assert isinstance(broken, HTTPStatusError)
@@ -1,7 +1,10 @@
+import json
+
 import pytest
 import respx
 from httpx import HTTPStatusError, Response
 
+from febos.data_model import FlatRealtimeDataGetResponse, RealtimeData, Value
 from febos.endpoint import FebosEndpoint
 from febos.realtime_data import RealtimeDataEndpoint
 
@@ -22,6 +25,19 @@ def test_realtime_data_get_success(client, mock_realtime_data_response):
     assert response.root[0].data["temp"].i == 22.5
 
 
+@respx.mock
+def test_realtime_data_get_flat(client, mock_realtime_data_response):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    respx.get(url).mock(return_value=Response(200, json=mock_realtime_data_response))
+    client.trusted = True
+    endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1"])
+    response = endpoint.get(client=client, flat=True)
+    assert isinstance(response, FlatRealtimeDataGetResponse)
+    assert response.root[0].data == {"temp": 22.5}
+    assert response.root[0].deviceId == 789
+    assert response.root[0].ts == "2024-01-01T12:00:00Z"
+
+
 @respx.mock
 def test_realtime_data_get_auth_error(client):
     url = REALTIME_DATA_URL.format(installation_id=100)
@@ -29,3 +45,64 @@ def test_realtime_data_get_auth_error(client):
     endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1", "GR2"])
     with pytest.raises(HTTPStatusError):
         endpoint.get(client=client)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_data_aget_success(async_client, mock_realtime_data_response):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    route = respx.get(url).mock(
+        return_value=Response(200, json=mock_realtime_data_response)
+    )
+    endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1", "GR2"])
+    response = await endpoint.aget(client=async_client)
+    assert route.called
+    assert route.calls.last.request.url.params["input_group_list"] == "GR1,GR2"
+    assert response.root[0].data["temp"].i == 22.5
+    flat = await endpoint.aget(client=async_client, flat=True)
+    assert flat.root[0].data["temp"] == 22.5
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_data_aget_auth_error(async_client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    respx.get(url).mock(return_value=Response(401))
+    endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1"])
+    with pytest.raises(HTTPStatusError):
+        await endpoint.aget(client=async_client)
+
+
+@respx.mock
+def test_realtime_data_post_body(client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    route = respx.post(url).mock(
+        return_value=Response(200, json={"errCode": 0, "msg": "OK"})
+    )
+    endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1"])
+    data = RealtimeData(
+        data={"temp": Value(i=22.5)}, deviceId=1, thingId=2, ts="2024-01-01T12:00:00Z"
+    )
+    assert endpoint.post(client=client, data=data).errCode == 0
+    assert json.loads(route.calls.last.request.content) == {
+        "data": {"temp": {"i": 22.5}},
+        "deviceId": 1,
+        "thingId": 2,
+        "ts": "2024-01-01T12:00:00Z",
+    }
+
+    endpoint.post(client=client, data=data.model_copy(update={"groupCode": "GR1"}))
+    assert json.loads(route.calls.last.request.content)["groupCode"] == "GR1"
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_data_apost_body(async_client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    route = respx.post(url).mock(
+        return_value=Response(200, json={"errCode": 0, "msg": "OK"})
+    )
+    endpoint = RealtimeDataEndpoint(installation_id=100, input_group_list=["GR1"])
+    data = RealtimeData(data={"temp": Value(i=22.5)}, deviceId=1, thingId=2)
+    await endpoint.apost(client=async_client, data=data)
+    assert "groupCode" not in json.loads(route.calls.last.request.content)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from febos.data_model import RealtimeDataGetResponse
+from febos.endpoint import FebosEndpoint
+from febos.realtime_data import RealtimeDataEndpoint
+from febos.realtime_poller import RealtimePoller, diff_snapshot
+
+REALTIME_DATA_URL = f"{FebosEndpoint.API_URL}{RealtimeDataEndpoint.URL}"
+
+
+def _realtime(values):
+    return [
+        {
+            "data": {code: {"i": value} for code, value in values.items()},
+            "deviceId": 789,
+            "groupCode": "F_GENERAL",
+            "thingId": 10,
+            "ts": "2024-01-01T12:00:00Z",
+        }
+    ]
+
+
+def test_diff_snapshot():
+    snapshot = {}
+    first = RealtimeDataGetResponse.model_validate(_realtime({"a": 1, "b": 2}))
+    second = RealtimeDataGetResponse.model_validate(_realtime({"a": 1, "b": 3}))
+    assert [c.code for c in diff_snapshot(100, first, snapshot)] == ["a", "b"]
+    changes = diff_snapshot(100, second, snapshot)
+    assert len(changes) == 1
+    assert changes[0].code == "b"
+    assert changes[0].value == 3
+    assert changes[0].previous == 2
+    assert diff_snapshot(100, second, snapshot) == []
+    assert diff_snapshot(100, first, {}, emit_initial=False) == []
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_realtime_poller_emits_only_changes(async_client):
+    url = REALTIME_DATA_URL.format(installation_id=100)
+    respx.get(url).mock(
+        side_effect=[
+            Response(200, json=_realtime({"temp": 22.5, "hum": 40})),
+            Response(200, json=_realtime({"temp": 22.5, "hum": 40})),
+            Response(200, json=_realtime({"temp": 23.0, "hum": 40})),
+        ]
+        + [Response(200, json=_realtime({"temp": 23.0, "hum": 40}))] * 100
+    )
+    received = []
+    poller = RealtimePoller(async_client, on_change=received.append, jitter=0)
+    job = poller.add(installation_id=100, input_group_list=["F_GENERAL"], interval=0.01)
+
+    async def two_changes():
+        while len(received) < 2:
+            await asyncio.sleep(0.005)
+
+    runner = asyncio.ensure_future(poller.run())
+    try:
+        await asyncio.wait_for(two_changes(), timeout=5)
+    finally:
+        poller.stop()
+        await asyncio.wait_for(runner, timeout=5)
+    assert not poller._tasks
+
+    assert [(c.code, c.value) for c in received[0]] == [("temp", 22.5), ("hum", 40)]
+    assert [(c.code, c.value, c.previous) for c in received[1]] == [
+        ("temp", 23.0, 22.5)
+    ]
+    assert job.snapshot[(789, 10, "temp")] == 23.0
@@ -0,0 +1,92 @@
+import pytest
+import respx
+from httpx import ConnectError, HTTPStatusError, ReadTimeout, Response
+
+from febos.client import AsyncFebosClient, FebosClient
+from febos.endpoint import FebosEndpoint
+from febos.get_language import GetLanguageEndpoint
+from febos.login import LoginEndpoint
+from febos.retry import RetryPolicy, TokenBucket, retry_after_seconds
+
+GET_LANGUAGE_URL = f"{FebosEndpoint.API_URL}{GetLanguageEndpoint.URL}".format(
+    installation_id=100, device_id=789
+)
+LOGIN_URL = f"{FebosEndpoint.API_URL}{LoginEndpoint.URL}"
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.delay(1, Response(429, headers={"Retry-After": "7"})) == 7
+    assert policy.delay(1, Response(503, headers={"Retry-After": "600"})) == 60
+    assert 0 <= RetryPolicy(backoff_base=1).delay(3) <= 4
+    assert retry_after_seconds(Response(429)) is None
+    date = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert retry_after_seconds(Response(429, headers={"Retry-After": date})) == 0
+
+
+def test_retry_policy_methods():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.retry_response("GET", Response(502), 1)
+    assert not policy.retry_response("GET", Response(502), 3)
+    assert not policy.retry_response("GET", Response(500), 1)
+    assert not policy.retry_response("POST", Response(502), 1)
+    assert policy.retry_response("POST", Response(429), 1)
+    assert policy.retry_error("GET", ReadTimeout("timeout"), 1)
+    assert not policy.retry_error("POST", ReadTimeout("timeout"), 1)
+    assert policy.retry_error("POST", ConnectError("refused"), 1)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    bucket.pause(5)
+    assert bucket.reserve() == pytest.approx(5, abs=0.01)
+
+
+@respx.mock
+def test_call_retries_get(mock_get_language_response):
+    route = respx.get(GET_LANGUAGE_URL).mock(
+        side_effect=[
+            Response(503),
+            ConnectError("reset"),
+            Response(200, json=mock_get_language_response),
+        ]
+    )
+    client = FebosClient(retry=NO_WAIT)
+    response = GetLanguageEndpoint(installation_id=100, device_id=789).get(client)
+    assert route.call_count == 3
+    assert response.ID_language == "1"
+
+
+@respx.mock
+def test_call_gives_up_and_skips_post(mock_login_response):
+    respx.get(GET_LANGUAGE_URL).mock(return_value=Response(503))
+    route = respx.post(LOGIN_URL).mock(return_value=Response(502))
+    client = FebosClient(retry=NO_WAIT)
+    with pytest.raises(HTTPStatusError):
+        GetLanguageEndpoint(installation_id=100, device_id=789).get(client)
+    with pytest.raises(HTTPStatusError):
+        LoginEndpoint(username="user", password="pass").post(client)
+    assert route.call_count == 1
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_acall_retries_and_rate_limits(mock_get_language_response):
+    route = respx.get(GET_LANGUAGE_URL).mock(
+        side_effect=[
+            Response(429, headers={"Retry-After": "0"}),
+            Response(200, json=mock_get_language_response),
+        ]
+    )
+    client = AsyncFebosClient(retry=NO_WAIT, rate_limit=100)
+    endpoint = GetLanguageEndpoint(installation_id=100, device_id=789)
+    response = await endpoint.aget(client)
+    assert route.call_count == 2
+    assert response.ID_language == "1"
+    assert client.rate_limiter.bucket("emmeti.aq-iot.net").rate == 100
@@ -0,0 +1,81 @@
+import pytest
+
+from febos.data_model import (HistoricalDataGetResponse, PageConfigGetResponse,
+                              RealtimeDataGetResponse)
+from febos.installation_index import InstallationIndex
+
+np = pytest.importorskip("numpy")
+
+from febos.columnar import decode_historical_data
+from febos.scaling import ValueDecoder
+
+
+@pytest.fixture
+def decoder(mock_page_config_with_inputs_response):
+    return ValueDecoder(
+        InstallationIndex(
+            PageConfigGetResponse.model_validate(mock_page_config_with_inputs_response)
+        )
+    )
+
+
+@pytest.fixture
+def historical_body():
+    return [
+        {
+            "deviceId": 789,
+            "thingId": 10,
+            "groupCode": "F_GENERAL",
+            "inputArray": [{"code": "R8765"}, {"code": "R8766"}, {"code": "R9999"}],
+            "data": [
+                {"ts": "2026-02-11T00:00:00", "vs": ["215", "40", "7"]},
+                {"ts": "2026-02-11T00:05:00", "vs": ["-32768", "-32768", ""]},
+                {"ts": "2026-02-11T00:10:00", "vs": ["-15", "41", "8"]},
+            ],
+        }
+    ]
+
+
+def test_decode_historical_scales_and_masks_nulls(decoder, historical_body):
+    expected = [[21.5, 40.0, 7.0], [np.nan, np.nan, np.nan], [-1.5, 41.0, 8.0]]
+    from_columns = decoder.decode_historical(decode_historical_data(historical_body))
+    np.testing.assert_array_equal(from_columns[0].values, expected)
+
+    response = HistoricalDataGetResponse.model_validate(historical_body)
+    np.testing.assert_array_equal(
+        decoder.decode_historical(response)[0].values, expected
+    )
+    assert decoder.units(["R8765", "R8766", "R9999"], 789) == ["°C", "%", None]
+
+
+def test_decode_realtime(decoder):
+    response = RealtimeDataGetResponse.model_validate(
+        [
+            {
+                "data": {"R8765": {"i": 215}, "R8766": {"i": -32768}},
+                "deviceId": 789,
+                "thingId": 10,
+                "ts": "2026-02-11T00:00:00Z",
+            },
+            {
+                "data": {
+                    "R8765": {"i": 215},
+                    "R8766": {"i": "---"},
+                    "R9999": {"i": 3},
+                },
+                "deviceId": 790,
+                "thingId": 11,
+                "ts": "2026-02-11T00:00:00Z",
+            },
+        ]
+    )
+    first, second = decoder.decode_realtime(response)
+    assert first.deviceId == 789
+    assert first.codes == ["R8765", "R8766"]
+    assert first.values[0] == 21.5
+    assert np.isnan(first.values[1])
+    # Unknown device and unknown code: passed through unscaled, never with
+    # the metadata of another device
+    assert second.as_dict()["R8765"] == 215.0
+    assert np.isnan(second.as_dict()["R8766"])
+    assert second.as_dict()["R9999"] == 3.0
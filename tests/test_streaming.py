@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from febos.data_model import HistoricalDataGetResponse
+from febos.streaming import (DataAnalysisEntryDecoder, HistoricalEntryDecoder,
+                             JsonArrayScanner)
+
+
+def feed_bytewise(decoder, body):
+    results = []
+    for i in range(len(body)):
+        results.extend(decoder.feed(body[i : i + 1]))
+    decoder.close()
+    return results
+
+
+def test_scanner_splits_items_with_tricky_strings():
+    items = [
+        {"ts": "a", "note": 'brackets ] } [ { and "quotes" \\ backslash'},
+        {"ts": "b", "nested": {"list": [1, [2, 3]], "s": "è"}},
+        {},
+    ]
+    body = json.dumps(items).encode()
+    scanner = JsonArrayScanner()
+    raws = [raw for _, raw in feed_bytewise(scanner, body)]
+    assert [json.loads(raw) for raw in raws] == items
+
+
+def test_scanner_rejects_invalid_documents():
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        JsonArrayScanner().feed(b'{"a": 1}')
+    with pytest.raises(ValueError, match="Unbalanced"):
+        JsonArrayScanner().feed(b"[{]")
+    scanner = JsonArrayScanner()
+    scanner.feed(b'[{"ts": "a"}')
+    with pytest.raises(ValueError, match="Truncated"):
+        scanner.close()
+
+
+def test_scanner_bounds_its_buffer():
+    scanner = JsonArrayScanner(nested="data")
+    scanner.feed(b'[{"deviceId": 1, "data": [')
+    for _ in range(1000):
+        scanner.feed(b'{"ts": "2026-02-11T01:03:18", "vs": ["1", "2"]},')
+    assert len(scanner._buf) < 100
+
+
+def test_data_analysis_decoder(mock_get_data_analysis_response):
+    body = json.dumps(mock_get_data_analysis_response).encode()
+    entries = feed_bytewise(DataAnalysisEntryDecoder(), body)
+    assert [entry.model_dump() for entry in entries] == mock_get_data_analysis_response
+
+
+def test_historical_decoder_batches_points(mock_get_historical_data_response):
+    body = json.dumps(mock_get_historical_data_response).encode()
+    entries = feed_bytewise(HistoricalEntryDecoder(batch_size=2), body)
+    assert [len(entry.data) for entry in entries] == [2, 1]
+    assert {entry.groupCode for entry in entries} == {"FB-GRAPH-DATA@D9551@T31115"}
+    expected = HistoricalDataGetResponse.model_validate(
+        mock_get_historical_data_response
+    ).root[0]
+    assert entries[0].inputArray == expected.inputArray
+    assert entries[0].data + entries[1].data == expected.data
+
+
+def test_historical_decoder_data_before_header(mock_get_historical_data_response):
+    entry = mock_get_historical_data_response[0]
+    reordered = [
+        {"data": entry["data"]} | {k: v for k, v in entry.items() if k != "data"},
+        entry | {"groupCode": "EMPTY", "data": []},
+    ]
+    body = json.dumps(reordered).encode()
+    entries = feed_bytewise(HistoricalEntryDecoder(batch_size=2), body)
+    assert [(e.groupCode, len(e.data)) for e in entries] == [
+        ("FB-GRAPH-DATA@D9551@T31115", 3),
+        ("EMPTY", 0),
+    ]
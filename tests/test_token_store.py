@@ -0,0 +1,110 @@
+import json
+
+import respx
+from httpx import Response
+
+from febos.client import FebosClient
+from febos.endpoint import FebosEndpoint
+from febos.get_language import GetLanguageEndpoint
+from febos.login import LoginEndpoint, LoginPostResponse
+from febos.token_store import FileTokenStore, StoredSession, session_key
+
+LOGIN_URL = f"{FebosEndpoint.API_URL}{LoginEndpoint.URL}"
+GET_LANGUAGE_URL = f"{FebosEndpoint.API_URL}{GetLanguageEndpoint.URL}".format(
+    installation_id=100, device_id=789
+)
+HOST = "emmeti.aq-iot.net"
+
+
+def test_file_token_store_roundtrip(tmp_path, mock_login_response):
+    store = FileTokenStore(tmp_path / "tokens.json")
+    login = LoginPostResponse.model_validate(mock_login_response)
+    assert store.load("user@host") is None
+    store.save("user@host", StoredSession("token", login))
+    # A second store on the same file, e.g. in another process
+    loaded = FileTokenStore(tmp_path / "tokens.json").load("user@host")
+    assert loaded == StoredSession("token", login)
+    store.clear("user@host")
+    assert store.load("user@host") is None
+
+
+def test_file_token_store_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("{not json")
+    assert FileTokenStore(path).load("user@host") is None
+
+
+@respx.mock
+def test_login_uses_stored_session(tmp_path, monkeypatch, mock_login_response):
+    monkeypatch.delenv("FEBOS_BASE_URL", raising=False)
+    store = FileTokenStore(tmp_path / "tokens.json")
+    route = respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "first"}
+        )
+    )
+    endpoint = LoginEndpoint(username="testuser", password="pass")
+
+    endpoint.post(client=FebosClient(token_store=store))
+    assert route.call_count == 1
+    assert store.load(session_key(HOST, "testuser")).token == "first"
+
+    client = FebosClient(token_store=store)
+    response = endpoint.post(client=client)
+    assert route.call_count == 1
+    assert response.username == "testuser"
+    assert client.get_token() == "first"
+
+    endpoint.post(client=client, refresh=True)
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_rejected_stored_token_logs_in_and_saves(
+    tmp_path, monkeypatch, mock_login_response, mock_get_language_response
+):
+    monkeypatch.delenv("FEBOS_BASE_URL", raising=False)
+    store = FileTokenStore(tmp_path / "tokens.json")
+    store.save(session_key(HOST, "testuser"), StoredSession("stale", None))
+
+    def language(request):
+        if request.headers["Authorization"] != "Bearer fresh":
+            return Response(401)
+        return Response(200, json=mock_get_language_response)
+
+    respx.get(GET_LANGUAGE_URL).mock(side_effect=language)
+    login = respx.post(LOGIN_URL).mock(
+        return_value=Response(
+            200, json=mock_login_response, headers={"Authorization": "fresh"}
+        )
+    )
+    client = FebosClient(token_store=store)
+    client.set_token("stale")
+    client.set_credentials("testuser", "pass")
+    GetLanguageEndpoint(installation_id=100, device_id=789).get(client=client)
+    assert login.call_count == 1
+    saved = json.loads((tmp_path / "tokens.json").read_text())
+    assert saved[session_key(HOST, "testuser")]["token"] == "fresh"
+
+
+@respx.mock
+def test_rejected_token_adopts_token_stored_by_other_process(
+    tmp_path, monkeypatch, mock_get_language_response
+):
+    monkeypatch.delenv("FEBOS_BASE_URL", raising=False)
+    store = FileTokenStore(tmp_path / "tokens.json")
+
+    def language(request):
+        if request.headers["Authorization"] != "Bearer fresh":
+            return Response(401)
+        return Response(200, json=mock_get_language_response)
+
+    respx.get(GET_LANGUAGE_URL).mock(side_effect=language)
+    login = respx.post(LOGIN_URL)
+    client = FebosClient(token_store=store)
+    client.set_token("stale")
+    client.set_credentials("testuser", "pass")
+    store.save(session_key(HOST, "testuser"), StoredSession("fresh", None))
+    GetLanguageEndpoint(installation_id=100, device_id=789).get(client=client)
+    assert not login.called
+    assert client.get_token() == "fresh"